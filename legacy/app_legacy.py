@@ -11,29 +11,32 @@ Features:
 - Manual trading controls
 """
 
-import time
-from datetime import date
-
-import pandas as pd
-import plotly.graph_objects as go
+import functools
+import json
+import logging
+from dataclasses import replace
+from datetime import date, datetime
+from typing import Optional
+
+import requests
 import streamlit as st
+import streamlit.components.v1 as components
 
-from src.backtester import run_default_backtest
+# Plotly, pandas and the backtesters are imported lazily inside the render
+# functions that use them to keep worker start-up light.
 from src.config import load_config, save_config
 from src.database import get_database
-from src.etrade_client import create_etrade_client
-from src.multi_strategy_backtester import MultiStrategyBacktester, run_comprehensive_backtest
+from src.etrade_client import ETradeAPIError, ETradeAuthError, create_etrade_client
 from src.strategy import IBITDipStrategy
 
 # Import bot modules
 from src.utils import (
+    calculate_dip_percentage,
     format_currency,
-    format_timedelta,
     get_et_now,
     get_market_times,
     is_friday,
     is_market_open,
-    time_until,
 )
 
 # Page configuration
@@ -41,6 +44,8 @@ st.set_page_config(
     page_title="IBIT Dip Bot", page_icon="📈", layout="wide", initial_sidebar_state="expanded"
 )
 
+logger = logging.getLogger(__name__)
+
 
 # Initialize session state
 def init_session_state():
@@ -72,6 +77,48 @@ def get_client():
     return st.session_state.client
 
 
+# How often the live quote panels rerun during market hours
+LIVE_REFRESH_SECONDS = 30
+
+
+def live_fragment(run_every: Optional[float]):
+    """Decorator making a panel a fragment that reruns on its own every run_every seconds.
+
+    st.fragment(run_every=...) needs Streamlit 1.37+. On older versions the panel is
+    rendered as usual and only refreshes with the page.
+    """
+    fragment = getattr(st, "fragment", None)
+    if fragment is None:
+        logger.warning(
+            f"Streamlit {st.__version__} has no st.fragment (needs 1.37+); "
+            "live panels will only refresh with the page"
+        )
+        return lambda func: func
+    return fragment(run_every=run_every)
+
+
+def cached_ibit_quote() -> dict:
+    """Get IBIT quote from session cache or fetch if stale (>15s).
+
+    Shared by the dip gauge and position panels so a rerun makes one quote call.
+    """
+    now = datetime.now()
+    cache_key = "cached_ibit_quote"
+    cache_time_key = "cached_ibit_quote_time"
+
+    # Check if we have a recent cache
+    if cache_key in st.session_state and cache_time_key in st.session_state:
+        age = (now - st.session_state[cache_time_key]).total_seconds()
+        if age < 15:
+            return st.session_state[cache_key]
+
+    # Fetch fresh data
+    quote = get_client().get_ibit_quote()
+    st.session_state[cache_key] = quote
+    st.session_state[cache_time_key] = now
+    return quote
+
+
 def get_strategy():
     """Get or create strategy instance."""
     if st.session_state.strategy is None:
@@ -86,236 +133,305 @@ def get_strategy():
     return st.session_state.strategy
 
 
+# Trade reads are cached on the trades-table version, so they only hit SQLite
+# again after a trade is recorded or closed.
+@st.cache_data(ttl=30)
+def _trade_history(version: tuple, limit: int = 100) -> list:
+    return get_database().get_trade_history(limit=limit)
+
+
+@st.cache_data(ttl=30)
+def _trade_statistics(version: tuple) -> dict:
+    return get_database().get_trade_statistics()
+
+
+@st.cache_data(ttl=30)
+def _equity_curve(version: tuple):
+    """Equity curve reduced to one point per trading day (last cumulative P&L)."""
+    import pandas as pd
+
+    curve_data = get_database().get_equity_curve()
+    if not curve_data:
+        return None
+
+    df = pd.DataFrame(curve_data)
+    df["date"] = pd.to_datetime(df["date"])
+    return df.groupby("date", as_index=False, sort=True)["cumulative_pnl"].last()
+
+
+@functools.lru_cache(maxsize=8)
+def _market_times(day: date) -> dict:
+    """Market times for a trading day (fixed per date, so memoized)."""
+    return get_market_times(day)
+
+
+@functools.lru_cache(maxsize=8)
+def _is_friday(day: date) -> bool:
+    """Whether the trading day is a Friday (memoized per date)."""
+    return is_friday(day)
+
+
 # Custom CSS for styling
+DARK_CSS = """
+<style>
+.metric-card {
+    background: linear-gradient(135deg, #1e1e2e 0%, #2d2d44 100%);
+    border-radius: 10px;
+    padding: 20px;
+    margin: 10px 0;
+    border: 1px solid #3d3d5c;
+}
+.dip-gauge {
+    font-size: 48px;
+    font-weight: bold;
+    text-align: center;
+}
+.dip-positive { color: #4caf50; }
+.dip-negative { color: #f44336; }
+.countdown {
+    font-size: 24px;
+    text-align: center;
+    color: #bb86fc;
+}
+.status-running { color: #4caf50; }
+.status-stopped { color: #f44336; }
+.status-paused { color: #ff9800; }
+</style>
+"""
+
+LIGHT_CSS = """
+<style>
+.metric-card {
+    background: linear-gradient(135deg, #f5f5f5 0%, #e0e0e0 100%);
+    border-radius: 10px;
+    padding: 20px;
+    margin: 10px 0;
+    border: 1px solid #ccc;
+}
+.dip-gauge {
+    font-size: 48px;
+    font-weight: bold;
+    text-align: center;
+}
+.dip-positive { color: #2e7d32; }
+.dip-negative { color: #c62828; }
+.countdown {
+    font-size: 24px;
+    text-align: center;
+    color: #6200ea;
+}
+</style>
+"""
+
+THEME_CSS = {"dark": DARK_CSS, "light": LIGHT_CSS}
+
+
 def apply_custom_css():
-    """Apply custom CSS based on theme."""
-    theme = st.session_state.config.theme
+    """Apply custom CSS based on theme.
+
+    The stylesheets are prebuilt constants; Streamlit still needs the markdown
+    element emitted on every run or the style is dropped from the page.
+    """
+    css = THEME_CSS.get(st.session_state.config.theme, LIGHT_CSS)
+    st.markdown(css, unsafe_allow_html=True)
 
-    if theme == "dark":
-        st.markdown(
-            """
-        <style>
-        .metric-card {
-            background: linear-gradient(135deg, #1e1e2e 0%, #2d2d44 100%);
-            border-radius: 10px;
-            padding: 20px;
-            margin: 10px 0;
-            border: 1px solid #3d3d5c;
-        }
-        .dip-gauge {
-            font-size: 48px;
-            font-weight: bold;
-            text-align: center;
-        }
-        .dip-positive { color: #4caf50; }
-        .dip-negative { color: #f44336; }
-        .countdown {
-            font-size: 24px;
-            text-align: center;
-            color: #bb86fc;
-        }
-        .status-running { color: #4caf50; }
-        .status-stopped { color: #f44336; }
-        .status-paused { color: #ff9800; }
-        </style>
-        """,
-            unsafe_allow_html=True,
-        )
-    else:
-        st.markdown(
-            """
-        <style>
-        .metric-card {
-            background: linear-gradient(135deg, #f5f5f5 0%, #e0e0e0 100%);
-            border-radius: 10px;
-            padding: 20px;
-            margin: 10px 0;
-            border: 1px solid #ccc;
-        }
-        .dip-gauge {
-            font-size: 48px;
-            font-weight: bold;
-            text-align: center;
-        }
-        .dip-positive { color: #2e7d32; }
-        .dip-negative { color: #c62828; }
-        .countdown {
-            font-size: 24px;
-            text-align: center;
-            color: #6200ea;
-        }
-        </style>
-        """,
-            unsafe_allow_html=True,
-        )
+
+def set_if_changed(obj, attr: str, value) -> bool:
+    """Set obj.attr to value only if it differs. Returns True if it was changed."""
+    if getattr(obj, attr) != value:
+        setattr(obj, attr, value)
+        return True
+    return False
 
 
 # Sidebar Configuration Panel
 def render_sidebar():
-    """Render the sidebar configuration panel."""
+    """Render the sidebar configuration panel.
+
+    All widgets live in a single form so edits are applied in one rerun on submit
+    instead of one rerun per widget change.
+    """
     st.sidebar.title("⚙️ Configuration")
 
     config = st.session_state.config
+    strategy_changed = False
 
-    # Theme toggle
-    theme = st.sidebar.selectbox(
-        "Theme", ["dark", "light"], index=0 if config.theme == "dark" else 1
-    )
-    if theme != config.theme:
+    with st.sidebar.form("config_form", clear_on_submit=False):
+        # Theme toggle
+        theme = st.selectbox("Theme", ["dark", "light"], index=0 if config.theme == "dark" else 1)
+        theme_changed = theme != config.theme
         config.theme = theme
-        st.rerun()
 
-    st.sidebar.divider()
+        st.divider()
 
-    # Trading Mode
-    st.sidebar.subheader("Trading Mode")
-    dry_run = st.sidebar.toggle("Dry Run (Paper Trading)", value=config.dry_run)
-    config.dry_run = dry_run
+        # Trading Mode
+        st.subheader("Trading Mode")
+        dry_run = st.toggle("Dry Run (Paper Trading)", value=config.dry_run)
+        config.dry_run = dry_run
 
-    st.sidebar.divider()
+        st.divider()
 
-    # Strategy Settings
-    st.sidebar.subheader("Strategy Settings")
+        # Strategy Settings
+        st.subheader("Strategy Settings")
 
-    # Strategy type selection
-    strategy_options = {
-        "combined": "Combined (Recommended)",
-        "mean_reversion": "Mean Reversion",
-        "short_thursday": "Short Thursday",
-        "original_dip": "Original 10AM Dip (Not Recommended)",
-    }
-    strategy_type = st.sidebar.selectbox(
-        "Strategy Type",
-        options=list(strategy_options.keys()),
-        format_func=lambda x: strategy_options[x],
-        index=list(strategy_options.keys()).index(config.strategy.strategy_type)
-        if config.strategy.strategy_type in strategy_options
-        else 0,
-        help="Select trading strategy",
-    )
-    config.strategy.strategy_type = strategy_type
-
-    # Strategy-specific settings
-    if strategy_type in ["mean_reversion", "combined"]:
-        mean_rev_threshold = st.sidebar.slider(
-            "Mean Reversion Threshold (%)",
-            min_value=-5.0,
-            max_value=-1.0,
-            value=config.strategy.mean_reversion_threshold,
-            step=0.5,
-            help="Buy after day drops below this threshold",
+        # Strategy type selection
+        strategy_options = {
+            "combined": "Combined (Recommended)",
+            "mean_reversion": "Mean Reversion",
+            "short_thursday": "Short Thursday",
+            "original_dip": "Original 10AM Dip (Not Recommended)",
+        }
+        strategy_type = st.selectbox(
+            "Strategy Type",
+            options=list(strategy_options.keys()),
+            format_func=lambda x: strategy_options[x],
+            index=list(strategy_options.keys()).index(config.strategy.strategy_type)
+            if config.strategy.strategy_type in strategy_options
+            else 0,
+            help="Select trading strategy (apply to show its settings)",
         )
-        config.strategy.mean_reversion_threshold = mean_rev_threshold
+        strategy_changed |= set_if_changed(config.strategy, "strategy_type", strategy_type)
 
-    if strategy_type in ["short_thursday", "combined"]:
-        enable_short_thu = st.sidebar.toggle(
-            "Enable Short Thursday",
-            value=config.strategy.enable_short_thursday,
-            help="Short IBIT on Thursdays",
-        )
-        config.strategy.enable_short_thursday = enable_short_thu
+        # Strategy-specific settings
+        if strategy_type in ["mean_reversion", "combined"]:
+            mean_rev_threshold = st.slider(
+                "Mean Reversion Threshold (%)",
+                min_value=-5.0,
+                max_value=-1.0,
+                value=config.strategy.mean_reversion_threshold,
+                step=0.5,
+                help="Buy after day drops below this threshold",
+            )
+            strategy_changed |= set_if_changed(
+                config.strategy, "mean_reversion_threshold", mean_rev_threshold
+            )
 
-    if strategy_type == "original_dip":
-        st.sidebar.warning(
-            "Original strategy has poor backtested performance. Consider using Combined strategy."
-        )
+        if strategy_type in ["short_thursday", "combined"]:
+            enable_short_thu = st.toggle(
+                "Enable Short Thursday",
+                value=config.strategy.enable_short_thursday,
+                help="Short IBIT on Thursdays",
+            )
+            strategy_changed |= set_if_changed(
+                config.strategy, "enable_short_thursday", enable_short_thu
+            )
 
-        # Monday trading
-        monday_enabled = st.sidebar.toggle(
-            "Enable Monday Trading",
-            value=config.strategy.monday_enabled,
-            help="Monday historically has weaker performance",
-        )
-        config.strategy.monday_enabled = monday_enabled
-
-        if monday_enabled:
-            monday_threshold = st.sidebar.slider(
-                "Monday Threshold (%)",
-                min_value=0.6,
-                max_value=2.0,
-                value=config.strategy.monday_threshold,
-                step=0.1,
-                help="Dip threshold for Monday trades",
+        if strategy_type == "original_dip":
+            st.warning(
+                "Original strategy has poor backtested performance. Consider using Combined strategy."
             )
-            config.strategy.monday_threshold = monday_threshold
-
-        # Regular threshold
-        regular_threshold = st.sidebar.slider(
-            "Regular Threshold (%)",
-            min_value=0.3,
-            max_value=1.5,
-            value=config.strategy.regular_threshold,
-            step=0.1,
-            help="Dip threshold for Tue-Fri trades",
-        )
-        config.strategy.regular_threshold = regular_threshold
 
-    # Position sizing
-    st.sidebar.subheader("Position Sizing")
+            # Monday trading
+            monday_enabled = st.toggle(
+                "Enable Monday Trading",
+                value=config.strategy.monday_enabled,
+                help="Monday historically has weaker performance",
+            )
+            strategy_changed |= set_if_changed(config.strategy, "monday_enabled", monday_enabled)
+
+            if monday_enabled:
+                monday_threshold = st.slider(
+                    "Monday Threshold (%)",
+                    min_value=0.6,
+                    max_value=2.0,
+                    value=config.strategy.monday_threshold,
+                    step=0.1,
+                    help="Dip threshold for Monday trades",
+                )
+                strategy_changed |= set_if_changed(
+                    config.strategy, "monday_threshold", monday_threshold
+                )
+
+            # Regular threshold
+            regular_threshold = st.slider(
+                "Regular Threshold (%)",
+                min_value=0.3,
+                max_value=1.5,
+                value=config.strategy.regular_threshold,
+                step=0.1,
+                help="Dip threshold for Tue-Fri trades",
+            )
+            strategy_changed |= set_if_changed(
+                config.strategy, "regular_threshold", regular_threshold
+            )
 
-    max_position_type = st.sidebar.radio(
-        "Max Position",
-        ["Percentage of Cash", "Fixed Dollar Amount"],
-        index=0 if config.strategy.max_position_usd is None else 1,
-    )
+        # Position sizing
+        st.subheader("Position Sizing")
 
-    if max_position_type == "Percentage of Cash":
-        max_pct = st.sidebar.slider(
-            "Max Position (%)",
-            min_value=10,
-            max_value=100,
-            value=int(config.strategy.max_position_pct),
-            step=10,
+        max_position_type = st.radio(
+            "Max Position",
+            ["Percentage of Cash", "Fixed Dollar Amount"],
+            index=0 if config.strategy.max_position_usd is None else 1,
         )
-        config.strategy.max_position_pct = float(max_pct)
-        config.strategy.max_position_usd = None
-    else:
-        max_usd = st.sidebar.number_input(
-            "Max Position ($)",
-            min_value=100,
-            max_value=1000000,
-            value=int(config.strategy.max_position_usd or 10000),
-            step=1000,
-        )
-        config.strategy.max_position_usd = float(max_usd)
 
-    st.sidebar.divider()
+        if max_position_type == "Percentage of Cash":
+            max_pct = st.slider(
+                "Max Position (%)",
+                min_value=10,
+                max_value=100,
+                value=int(config.strategy.max_position_pct),
+                step=10,
+            )
+            strategy_changed |= set_if_changed(config.strategy, "max_position_pct", float(max_pct))
+            strategy_changed |= set_if_changed(config.strategy, "max_position_usd", None)
+        else:
+            max_usd = st.number_input(
+                "Max Position ($)",
+                min_value=100,
+                max_value=1000000,
+                value=int(config.strategy.max_position_usd or 10000),
+                step=1000,
+            )
+            strategy_changed |= set_if_changed(config.strategy, "max_position_usd", float(max_usd))
 
-    # Notifications
-    st.sidebar.subheader("Notifications")
-    desktop_notify = st.sidebar.toggle(
-        "Desktop Notifications", value=config.notifications.desktop_enabled
-    )
-    config.notifications.desktop_enabled = desktop_notify
+        st.divider()
 
-    email_notify = st.sidebar.toggle(
-        "Email Notifications", value=config.notifications.email_enabled
-    )
-    config.notifications.email_enabled = email_notify
+        # Notifications
+        st.subheader("Notifications")
+        desktop_notify = st.toggle(
+            "Desktop Notifications", value=config.notifications.desktop_enabled
+        )
+        email_notify = st.toggle("Email Notifications", value=config.notifications.email_enabled)
+        notification_updates = {"desktop_enabled": desktop_notify, "email_enabled": email_notify}
 
-    if email_notify:
-        with st.sidebar.expander("Email Settings"):
+        # Only build the SMTP inputs when the user asks to edit them
+        if email_notify and st.checkbox("Configure email", key="email_settings_open"):
             smtp_user = st.text_input("SMTP Username", value=config.notifications.smtp_username)
             smtp_pass = st.text_input("SMTP Password", type="password")
             email_to = st.text_input("Send To (comma-separated)")
 
             if smtp_user:
-                config.notifications.smtp_username = smtp_user
+                notification_updates["smtp_username"] = smtp_user
             if smtp_pass:
-                config.notifications.smtp_password = smtp_pass
+                notification_updates["smtp_password"] = smtp_pass
             if email_to:
-                config.notifications.email_to = [e.strip() for e in email_to.split(",")]
+                notification_updates["email_to"] = [e.strip() for e in email_to.split(",")]
 
-    st.sidebar.divider()
+        config.notifications = replace(config.notifications, **notification_updates)
 
-    # Save config button
-    if st.sidebar.button("💾 Save Configuration"):
-        save_config(config)
-        st.sidebar.success("Configuration saved!")
+        st.divider()
+
+        col1, col2 = st.columns(2)
+        with col1:
+            applied = st.form_submit_button("✅ Apply", use_container_width=True)
+        with col2:
+            saved = st.form_submit_button("💾 Save", use_container_width=True)
 
     # Update session state
     st.session_state.config = config
 
+    # Rebuild the strategy only when one of its settings actually changed
+    if strategy_changed:
+        st.session_state.strategy = None
+
+    if saved:
+        save_config(config)
+        st.sidebar.success("Configuration saved!")
+
+    # The CSS was already applied with the previous theme this run
+    if (applied or saved) and theme_changed:
+        st.rerun()
+
 
 # Main Dashboard
 def render_dashboard():
@@ -323,7 +439,6 @@ def render_dashboard():
     st.title("📈 IBIT Dip Bot Dashboard")
 
     now = get_et_now()
-    times = get_market_times(now.date())
 
     # Top row - Status and controls
     col1, col2, col3, col4 = st.columns(4)
@@ -355,12 +470,15 @@ def render_dashboard():
 
     st.divider()
 
+    # Live quote panels rerun on their own every 30 seconds during market hours
+    run_every = LIVE_REFRESH_SECONDS if is_market_open() else None
+
     # Main content - 2 columns
     left_col, right_col = st.columns([2, 1])
 
     with left_col:
         # Dip Gauge
-        render_dip_gauge()
+        live_fragment(run_every)(render_dip_gauge)()
 
         st.divider()
 
@@ -379,24 +497,22 @@ def render_dashboard():
         st.divider()
 
         # Current Position
-        render_position_status()
+        live_fragment(run_every)(render_position_status)()
 
 
 def render_dip_gauge():
     """Render the live dip percentage gauge."""
+    import plotly.graph_objects as go
+
     st.subheader("📊 Dip Gauge")
 
     try:
-        client = get_client()
-        quote = client.get_ibit_quote()
+        quote = cached_ibit_quote()
 
         current_price = quote.get("last_price", 0)
         open_price = quote.get("open_price", 0)
 
-        if open_price > 0:
-            dip_pct = ((open_price - current_price) / open_price) * 100
-        else:
-            dip_pct = 0
+        dip_pct = calculate_dip_percentage(open_price, current_price)
 
         # Display gauge
         col1, col2, col3 = st.columns(3)
@@ -461,37 +577,87 @@ def render_dip_gauge():
         st.info("Make sure you're authenticated with E*TRADE or running in dry-run mode.")
 
 
+COUNTDOWN_SCRIPT = """
+<script>
+const timers = %s;
+function fmt(ms) {
+    const total = Math.floor(ms / 1000);
+    if (total < 0) return "Now";
+    const h = Math.floor(total / 3600), m = Math.floor((total %% 3600) / 60), s = total %% 60;
+    if (h > 0) return `${h}h ${m}m ${s}s`;
+    if (m > 0) return `${m}m ${s}s`;
+    return `${s}s`;
+}
+function tick() {
+    const now = Date.now();
+    for (const t of timers) {
+        const phase = t.phases.find((p) => now < p.until);
+        document.getElementById(t.id).textContent =
+            phase ? phase.text.replace("{}", fmt(phase.until - now)) : t.done;
+    }
+}
+tick();
+setInterval(tick, 1000);
+</script>
+"""
+
+
+def _countdown_html(timers: list, theme: str) -> str:
+    """Build the countdown block; the browser ticks it down every second."""
+    color = "white" if theme == "dark" else "black"
+    rows = "".join(
+        f"<div style='margin-bottom:12px'>"
+        f"<div style='font-size:14px;opacity:0.7'>{t['label']}</div>"
+        f"<div id='{t['id']}' style='font-size:28px'></div></div>"
+        for t in timers
+    )
+    return (
+        f"<div style='font-family:sans-serif;color:{color}'>{rows}</div>"
+        + COUNTDOWN_SCRIPT % json.dumps(timers)
+    )
+
+
+@live_fragment(run_every=60)
 def render_countdown_timers():
-    """Render countdown timers for key events."""
+    """Render countdown timers for key events.
+
+    Targets are sent once as epoch milliseconds and counted down client-side; the
+    fragment only reruns once a minute (e.g. to pick up a new trading day).
+    """
     st.subheader("⏱️ Countdowns")
 
     now = get_et_now()
-    times = get_market_times(now.date())
-
-    # Market open countdown
-    if now < times["market_open"]:
-        time_to_open = time_until(times["market_open"])
-        st.metric("Market Open", format_timedelta(time_to_open))
-    else:
-        st.metric("Market Open", "✓ Open")
-
-    # Dip window countdown
-    if now < times["dip_window_start"]:
-        time_to_dip = time_until(times["dip_window_start"])
-        st.metric("Dip Window", format_timedelta(time_to_dip))
-    elif now <= times["dip_window_end"]:
-        time_remaining = time_until(times["dip_window_end"])
-        st.metric("Dip Window", f"Active ({format_timedelta(time_remaining)} left)")
-    else:
-        st.metric("Dip Window", "✓ Passed")
+    times = _market_times(now.date())
+    close_time = times["friday_close"] if _is_friday(now.date()) else times["market_close"]
+
+    def ms(dt: datetime) -> int:
+        return int(dt.timestamp() * 1000)
+
+    timers = [
+        {
+            "id": "market-open",
+            "label": "Market Open",
+            "phases": [{"until": ms(times["market_open"]), "text": "{}"}],
+            "done": "✓ Open",
+        },
+        {
+            "id": "dip-window",
+            "label": "Dip Window",
+            "phases": [
+                {"until": ms(times["dip_window_start"]), "text": "{}"},
+                {"until": ms(times["dip_window_end"]), "text": "Active ({} left)"},
+            ],
+            "done": "✓ Passed",
+        },
+        {
+            "id": "market-close",
+            "label": "Market Close",
+            "phases": [{"until": ms(close_time), "text": "{}"}],
+            "done": "✓ Closed",
+        },
+    ]
 
-    # Market close countdown
-    close_time = times["friday_close"] if is_friday() else times["market_close"]
-    if now < close_time:
-        time_to_close = time_until(close_time)
-        st.metric("Market Close", format_timedelta(time_to_close))
-    else:
-        st.metric("Market Close", "✓ Closed")
+    components.html(_countdown_html(timers, st.session_state.config.theme), height=230)
 
 
 def render_quick_controls():
@@ -549,36 +715,42 @@ def render_position_status():
         st.metric("Entry Price", f"${open_trade['entry_price']:.2f}")
         st.metric("Entry Dip", f"{open_trade['dip_percentage']:.2f}%")
 
-        # Calculate unrealized P&L
+        # Calculate unrealized P&L; the panel simply omits it if the quote is unavailable
         try:
-            client = get_client()
-            quote = client.get_ibit_quote()
-            current = quote.get("last_price", open_trade["entry_price"])
-            unrealized = (current - open_trade["entry_price"]) * open_trade["shares"]
-            unrealized_pct = (
-                (current - open_trade["entry_price"]) / open_trade["entry_price"]
-            ) * 100
-            st.metric("Unrealized P&L", f"{format_currency(unrealized)} ({unrealized_pct:+.2f}%)")
-        except:
-            pass
+            quote = cached_ibit_quote()
+            if quote:
+                entry_price = open_trade["entry_price"]
+                delta = quote.get("last_price", entry_price) - entry_price
+                unrealized = delta * open_trade["shares"]
+                unrealized_pct = delta / entry_price * 100
+                st.metric(
+                    "Unrealized P&L", f"{format_currency(unrealized)} ({unrealized_pct:+.2f}%)"
+                )
+        except (
+            ETradeAuthError,
+            ETradeAPIError,
+            requests.RequestException,
+            ConnectionError,
+            KeyError,
+        ) as e:
+            logger.warning(f"Could not calculate unrealized P&L: {e}")
     else:
         st.info("No open position")
 
 
 def render_equity_curve():
     """Render equity curve chart."""
+    import plotly.graph_objects as go
+
     st.subheader("📈 Equity Curve")
 
     db = st.session_state.db
-    curve_data = db.get_equity_curve()
+    df = _equity_curve(db.get_trades_version())
 
-    if not curve_data:
+    if df is None:
         st.info("No trade history yet. Run some trades to see the equity curve.")
         return
 
-    df = pd.DataFrame(curve_data)
-    df["date"] = pd.to_datetime(df["date"])
-
     # Create figure
     fig = go.Figure()
 
@@ -612,47 +784,56 @@ def render_equity_curve():
 
 
 # Trade History Tab
+TRADE_HISTORY_COLUMNS = [
+    "date",
+    "day_of_week",
+    "dip_percentage",
+    "entry_price",
+    "exit_price",
+    "shares",
+    "dollar_pnl",
+    "percentage_pnl",
+    "status",
+]
+
+
 def render_trade_history():
     """Render trade history table."""
+    import pandas as pd
+
     st.title("📋 Trade History")
 
     db = st.session_state.db
-    trades = db.get_trade_history(limit=100)
+    trades = _trade_history(db.get_trades_version())
 
     if not trades:
         st.info("No trades yet.")
         return
 
-    df = pd.DataFrame(trades)
-
-    # Format columns
-    df["date"] = pd.to_datetime(df["date"]).dt.strftime("%Y-%m-%d")
-    df["entry_price"] = df["entry_price"].apply(lambda x: f"${x:.2f}")
-    df["exit_price"] = df["exit_price"].apply(lambda x: f"${x:.2f}" if x else "-")
-    df["dip_percentage"] = df["dip_percentage"].apply(lambda x: f"{x:.2f}%")
-    df["dollar_pnl"] = df["dollar_pnl"].apply(lambda x: f"${x:+.2f}" if x else "-")
-    df["percentage_pnl"] = df["percentage_pnl"].apply(lambda x: f"{x:+.2f}%" if x else "-")
-
-    # Select columns to display
-    display_cols = [
-        "date",
-        "day_of_week",
-        "dip_percentage",
-        "entry_price",
-        "exit_price",
-        "shares",
-        "dollar_pnl",
-        "percentage_pnl",
-        "status",
-    ]
+    # Build only the displayed columns straight from the records
+    df = pd.DataFrame.from_records(trades, columns=TRADE_HISTORY_COLUMNS)
+    df["date"] = pd.to_datetime(df["date"])
 
-    st.dataframe(df[display_cols], use_container_width=True, hide_index=True)
+    # Keep columns numeric and let the dataframe widget format them client-side
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "date": st.column_config.DateColumn(format="YYYY-MM-DD"),
+            "dip_percentage": st.column_config.NumberColumn(format="%.2f%%"),
+            "entry_price": st.column_config.NumberColumn(format="$%.2f"),
+            "exit_price": st.column_config.NumberColumn(format="$%.2f"),
+            "dollar_pnl": st.column_config.NumberColumn(format="$%+.2f"),
+            "percentage_pnl": st.column_config.NumberColumn(format="%+.2f%%"),
+        },
+    )
 
     # Statistics
     st.divider()
     st.subheader("Statistics")
 
-    stats = db.get_trade_statistics()
+    stats = _trade_statistics(db.get_trades_version())
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -667,6 +848,55 @@ def render_trade_history():
 
 
 # Backtesting Tab
+@st.cache_resource(ttl=3600, max_entries=8)
+def _loaded_backtester(start_date: date, end_date: date, initial_capital: int):
+    """Backtester with IBIT data already loaded, shared by both backtest tabs."""
+    from src.multi_strategy_backtester import MultiStrategyBacktester
+
+    backtester = MultiStrategyBacktester(initial_capital=initial_capital)
+    backtester.load_data(start_date, end_date)
+    return backtester
+
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _run_backtest(
+    strategy_choice: str,
+    start_date: date,
+    end_date: date,
+    initial_capital: int,
+    mr_threshold: Optional[float],
+    monday_enabled: bool,
+    threshold: Optional[float],
+):
+    """Run a single-strategy backtest, cached on its inputs."""
+    from src.backtester import run_default_backtest
+
+    if strategy_choice == "Original Dip":
+        return run_default_backtest(
+            start_date=start_date,
+            end_date=end_date,
+            threshold=threshold,
+            monday_enabled=monday_enabled,
+            initial_capital=initial_capital,
+        )
+
+    backtester = _loaded_backtester(start_date, end_date, initial_capital)
+
+    if strategy_choice == "Mean Reversion":
+        return backtester.backtest_mean_reversion(threshold=mr_threshold)
+    if strategy_choice == "Short Thursday":
+        return backtester.backtest_short_thursday()
+    return backtester.backtest_combined(mean_reversion_threshold=mr_threshold)
+
+
+@st.cache_data(ttl=3600, max_entries=32)
+def _run_comparison(start_date: date, end_date: date, initial_capital: int):
+    """Run the multi-strategy comparison, cached on its inputs."""
+    backtester = _loaded_backtester(start_date, end_date, initial_capital)
+    results = backtester.backtest_all_strategies()
+    return results, backtester.compare_strategies(results)
+
+
 def render_backtest():
     """Render backtesting interface with multi-strategy support."""
     st.title("🔬 Backtesting")
@@ -683,6 +913,8 @@ def render_backtest():
 
 def render_single_strategy_backtest():
     """Render single strategy backtest interface."""
+    import plotly.graph_objects as go
+
     col1, col2 = st.columns([1, 2])
 
     with col1:
@@ -705,6 +937,9 @@ def render_single_strategy_backtest():
         end_date = st.date_input("End Date", value=date.today(), key="single_end")
 
         # Strategy-specific parameters
+        mr_threshold = None
+        threshold = None
+        monday_enabled = False
         if strategy_choice in ["Mean Reversion", "Combined"]:
             mr_threshold = st.slider(
                 "Mean Reversion Threshold (%)",
@@ -739,24 +974,15 @@ def render_single_strategy_backtest():
         if run_backtest:
             with st.spinner("Running backtest..."):
                 try:
-                    backtester = MultiStrategyBacktester(initial_capital=initial_capital)
-                    backtester.load_data(start_date, end_date)
-
-                    # Run appropriate strategy
-                    if strategy_choice == "Mean Reversion":
-                        result = backtester.backtest_mean_reversion(threshold=mr_threshold)
-                    elif strategy_choice == "Short Thursday":
-                        result = backtester.backtest_short_thursday()
-                    elif strategy_choice == "Combined":
-                        result = backtester.backtest_combined(mean_reversion_threshold=mr_threshold)
-                    else:  # Original Dip
-                        result = run_default_backtest(
-                            start_date=start_date,
-                            end_date=end_date,
-                            threshold=threshold,
-                            monday_enabled=monday_enabled,
-                            initial_capital=initial_capital,
-                        )
+                    result = _run_backtest(
+                        strategy_choice,
+                        start_date,
+                        end_date,
+                        initial_capital,
+                        mr_threshold,
+                        monday_enabled,
+                        threshold,
+                    )
 
                     # Display results
                     st.subheader(f"Results: {strategy_choice}")
@@ -827,6 +1053,8 @@ def render_single_strategy_backtest():
 
 def render_multi_strategy_backtest():
     """Render multi-strategy comparison backtest."""
+    import plotly.graph_objects as go
+
     st.subheader("Compare All Strategies")
 
     col1, col2 = st.columns([1, 3])
@@ -851,9 +1079,7 @@ def render_multi_strategy_backtest():
         if run_comparison:
             with st.spinner("Running all backtests..."):
                 try:
-                    results, comparison_df = run_comprehensive_backtest(
-                        start_date=start_date, end_date=end_date, initial_capital=initial_capital
-                    )
+                    results, comparison_df = _run_comparison(start_date, end_date, initial_capital)
 
                     st.subheader("Strategy Comparison")
                     st.dataframe(comparison_df, use_container_width=True, hide_index=True)
@@ -870,19 +1096,21 @@ def render_multi_strategy_backtest():
                     fig = go.Figure()
                     colors = ["#4caf50", "#2196f3", "#ff9800", "#e91e63", "#9c27b0", "#00bcd4"]
 
+                    # Build every trace first, then add them to the figure in one call
+                    traces = []
                     for i, (name, result) in enumerate(results.items()):
                         if result.trades:
                             df = result.to_dataframe()
-                            df["cumulative"] = df["dollar_pnl"].cumsum()
-                            fig.add_trace(
-                                go.Scatter(
+                            traces.append(
+                                go.Scattergl(
                                     x=df["date"],
-                                    y=df["cumulative"],
+                                    y=df["dollar_pnl"].cumsum().to_numpy(),
                                     mode="lines",
                                     name=name,
                                     line=dict(color=colors[i % len(colors)]),
                                 )
                             )
+                    fig.add_traces(traces)
 
                     fig.add_hline(y=0, line_dash="dash", line_color="gray")
 
@@ -1045,11 +1273,6 @@ def main():
     with tab4:
         render_settings()
 
-    # Auto-refresh every 30 seconds during market hours
-    if is_market_open():
-        time.sleep(0.1)  # Small delay to prevent too rapid refreshes
-        # Note: For production, use streamlit-autorefresh component
-
 
 if __name__ == "__main__":
     main()
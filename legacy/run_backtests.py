@@ -3,7 +3,9 @@
 Run comprehensive backtests on all IBIT strategies.
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from pathlib import Path
 
@@ -28,9 +30,14 @@ def main():
     print()
 
     # Run comprehensive backtest
-    results, comparison = run_comprehensive_backtest(
-        start_date=start_date, end_date=end_date, initial_capital=initial_capital
-    )
+    # Strategy variants are independent and CPU-bound, so run them in worker processes
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results, comparison = run_comprehensive_backtest(
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=initial_capital,
+            executor=executor,
+        )
 
     # Display comparison table
     print("\n" + "=" * 80)
@@ -53,11 +60,14 @@ def main():
     print("=" * 80)
 
     for name, result in sorted(results.items(), key=lambda x: -x[1].total_return_pct):
-        print(f"\n--- {name} ---")
-        print(f"Trades: {result.total_trades}")
-        print(f"Win Rate: {result.win_rate:.1f}%")
-        print(f"Total Return: {result.total_return_pct:+.1f}%")
-        print(f"vs Buy&Hold: {result.total_return_pct - result.buy_hold_return_pct:+.1f}%")
+        lines = [
+            f"\n--- {name} ---",
+            f"Trades: {result.total_trades}",
+            f"Win Rate: {result.win_rate:.1f}%",
+            f"Total Return: {result.total_return_pct:+.1f}%",
+            f"vs Buy&Hold: {result.total_return_pct - result.buy_hold_return_pct:+.1f}%",
+        ]
+        print("\n".join(lines))
 
     print("\n" + "=" * 80)
     print("BACKTEST COMPLETE")
@@ -4,11 +4,16 @@ Run comprehensive backtests on BITX (2x leveraged Bitcoin ETF).
 Compare to IBIT results.
 """
 
+import contextlib
+import os
+import pickle
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -19,7 +24,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 @dataclass
 class BacktestTrade:
-    """Record of a single backtest trade."""
+    """Record of a single backtest trade (row view over BacktestResults.trades)."""
 
     date: date
     direction: str
@@ -32,6 +37,38 @@ class BacktestTrade:
     reason: str
 
 
+# Downloaded price history is cached here between runs
+CACHE_DIR = Path(__file__).parent / ".cache" / "bitx_backtest"
+CACHE_TTL_SECONDS = 15 * 60
+
+LONG = 1
+SHORT = -1
+
+SLIPPAGE_PCT = 0.01
+# (entry, exit) price multipliers per direction; slippage always works against the trade
+SLIPPAGE_FACTORS = {
+    direction: (1 + direction * SLIPPAGE_PCT / 100, 1 - direction * SLIPPAGE_PCT / 100)
+    for direction in (LONG, SHORT)
+}
+
+# Trade columns stored as parallel arrays (structure of arrays)
+TRADE_COLUMNS = {
+    "date": "datetime64[D]",
+    "direction": np.int8,  # LONG or SHORT
+    "entry_price": np.float64,
+    "exit_price": np.float64,
+    "shares": np.int64,
+    "dollar_pnl": np.float64,
+    "percentage_pnl": np.float64,
+    "prev_return": np.float64,  # previous day's return, used in the trade reason
+}
+
+
+def empty_trades() -> Dict[str, np.ndarray]:
+    """Zero-length trade columns."""
+    return {name: np.empty(0, dtype=dtype) for name, dtype in TRADE_COLUMNS.items()}
+
+
 @dataclass
 class BacktestResults:
     """Results from backtesting a strategy."""
@@ -41,7 +78,9 @@ class BacktestResults:
     start_date: date
     end_date: date
     initial_capital: float
-    trades: List[BacktestTrade] = field(default_factory=list)
+    trades: Dict[str, np.ndarray] = field(default_factory=empty_trades)
+    # direction -> (strategy label, reason template formatted with prev_return)
+    trade_labels: Dict[int, Tuple[str, str]] = field(default_factory=dict)
 
     total_trades: int = 0
     long_trades: int = 0
@@ -58,278 +97,349 @@ class BacktestResults:
     sharpe_ratio: float = 0.0
     buy_hold_return_pct: float = 0.0
 
+    def trade_records(self) -> List[BacktestTrade]:
+        """Materialize the trade columns as BacktestTrade rows."""
+        t = self.trades
+        records = []
+        for d, direction, entry, exit_, n, pnl, pct, prev in zip(
+            t["date"].tolist(),
+            t["direction"].tolist(),
+            t["entry_price"].tolist(),
+            t["exit_price"].tolist(),
+            t["shares"].tolist(),
+            t["dollar_pnl"].tolist(),
+            t["percentage_pnl"].tolist(),
+            t["prev_return"].tolist(),
+        ):
+            strategy, reason = self.trade_labels[direction]
+            records.append(
+                BacktestTrade(
+                    date=d,
+                    direction="long" if direction == LONG else "short",
+                    strategy=strategy,
+                    entry_price=entry,
+                    exit_price=exit_,
+                    shares=n,
+                    dollar_pnl=pnl,
+                    percentage_pnl=pct,
+                    reason=reason.format(prev=prev),
+                )
+            )
+        return records
+
     def calculate_metrics(self):
-        if not self.trades:
+        returns = self.trades["percentage_pnl"]
+        if len(returns) == 0:
             return
 
-        self.total_trades = len(self.trades)
-        self.long_trades = sum(1 for t in self.trades if t.direction == "long")
-        self.short_trades = sum(1 for t in self.trades if t.direction == "short")
-        self.winning_trades = sum(1 for t in self.trades if t.percentage_pnl > 0)
+        direction = self.trades["direction"]
+        self.total_trades = len(returns)
+        self.long_trades = int(np.count_nonzero(direction == LONG))
+        self.short_trades = int(np.count_nonzero(direction == SHORT))
+        self.winning_trades = int(np.count_nonzero(returns > 0))
         self.losing_trades = self.total_trades - self.winning_trades
         self.win_rate = (
             (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0
         )
 
-        self.total_return = sum(t.dollar_pnl for t in self.trades)
+        self.total_return = float(np.sum(self.trades["dollar_pnl"]))
         self.total_return_pct = (
             (self.total_return / self.initial_capital * 100) if self.initial_capital > 0 else 0
         )
 
-        returns = [t.percentage_pnl for t in self.trades]
-        self.avg_return_pct = np.mean(returns) if returns else 0
-        self.best_trade_pct = max(returns) if returns else 0
-        self.worst_trade_pct = min(returns) if returns else 0
-
-        if len(returns) > 1 and np.std(returns) > 0:
-            self.sharpe_ratio = (np.mean(returns) / np.std(returns)) * np.sqrt(252)
+        # Mean and (population) std share one mean instead of np.mean/np.std recomputing it
+        n = len(returns)
+        mean = returns.sum() / n
+        deviation = returns - mean
+        std = np.sqrt((deviation * deviation).sum() / n)
+
+        self.avg_return_pct = mean
+        self.best_trade_pct = returns.max()
+        self.worst_trade_pct = returns.min()
+
+        if n > 1 and std > 0:
+            self.sharpe_ratio = (mean / std) * np.sqrt(252)
+
+
+def load_data(tickers: List[str], start_date: date, end_date: date) -> Dict[str, pd.DataFrame]:
+    """Load data for several tickers, reusing local copies of earlier downloads."""
+    frames = {}
+    for ticker in tickers:
+        cache_path = CACHE_DIR / f"{ticker}_{start_date}_{end_date}.pkl"
+        # Closed ranges never change; ranges that include today go stale
+        df = _read_cache(cache_path, None if end_date < date.today() else CACHE_TTL_SECONDS)
+        if df is not None:
+            frames[ticker] = df
+
+    missing = [ticker for ticker in tickers if ticker not in frames]
+    if missing:
+        for ticker, df in _download_data(missing, start_date, end_date).items():
+            _write_cache(CACHE_DIR / f"{ticker}_{start_date}_{end_date}.pkl", df)
+            frames[ticker] = df
+
+    return {ticker: frames[ticker] for ticker in tickers}
+
+
+def _read_cache(path: Path, max_age: Optional[float]) -> Optional[pd.DataFrame]:
+    """Cached frame at path, or None if it is missing, too old or unreadable."""
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime >= max_age:
+            return None
+        return pd.read_pickle(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+        print(f"Ignoring unreadable cache file {path}: {e}")
+        return None
+
+
+def _write_cache(path: Path, df: pd.DataFrame) -> None:
+    """Save df to path; the cache is only an optimisation, so failures are just reported."""
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so an interrupted run never leaves a partial file behind
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not cache data to {path}: {e}")
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
+
+def _download_data(tickers: List[str], start_date: date, end_date: date) -> Dict[str, pd.DataFrame]:
+    """Download daily bars for all tickers from Yahoo Finance in one request."""
+    data = yf.download(
+        tickers,
+        start=start_date,
+        end=end_date + timedelta(days=1),
+        interval="1d",
+        group_by="ticker",
+        auto_adjust=True,
+        threads=True,
+        progress=False,
+    )
+    return {ticker: _normalize_bars(data[ticker].dropna(how="all")) for ticker in tickers}
 
 
-def load_data(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
-    """Load data for a ticker."""
-    t = yf.Ticker(ticker)
-    df = t.history(start=start_date, end=end_date + timedelta(days=1), interval="1d")
+def _normalize_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """Lowercase the yfinance columns and add the date/weekday columns."""
     df = df.reset_index()
     df.columns = [c.lower() for c in df.columns]
-    if "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"]).dt.date
-    elif "datetime" in df.columns:
-        df["date"] = pd.to_datetime(df["datetime"]).dt.date
+    df = df.rename(columns={"datetime": "date"})
+    timestamps = pd.to_datetime(df["date"])
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+    df["date"] = timestamps.dt.normalize()
+    # Row-local, so it stays valid after run_comparison filters to common dates
+    df["weekday"] = timestamps.dt.weekday.to_numpy()
     return df
 
 
+def prepare_trade_columns(df: pd.DataFrame, initial_capital: float) -> Dict[str, np.ndarray]:
+    """
+    Compute the per-day inputs shared by every strategy, once per ticker.
+
+    All strategies trade open-to-close with the same fixed capital, so each
+    day's long and short outcome is the same whichever strategy takes it; a
+    strategy only decides which days (and which side) it trades.
+    """
+    # Work on raw float64 arrays; everything below is plain ufunc arithmetic
+    open_price = df["open"].to_numpy(dtype=np.float64)
+    close_price = df["close"].to_numpy(dtype=np.float64)
+
+    daily_return = (close_price - open_price) / open_price * 100
+    prev_return = np.empty_like(daily_return)
+    prev_return[:1] = np.nan
+    prev_return[1:] = daily_return[:-1]
+
+    columns = {
+        "date": df["date"].to_numpy().astype("datetime64[D]"),
+        "prev_return": prev_return,
+        "weekday": df["weekday"].to_numpy(),
+    }
+
+    for side, direction in (("long", LONG), ("short", SHORT)):
+        entry_factor, exit_factor = SLIPPAGE_FACTORS[direction]
+        entry_price = open_price * entry_factor
+        exit_price = close_price * exit_factor
+        shares = (initial_capital // entry_price).astype(np.int64)
+        move = direction * (exit_price - entry_price)
+        columns[f"{side}_entry_price"] = entry_price
+        columns[f"{side}_exit_price"] = exit_price
+        columns[f"{side}_shares"] = shares
+        columns[f"{side}_dollar_pnl"] = move * shares
+        columns[f"{side}_percentage_pnl"] = move / entry_price * 100
+
+    return columns
+
+
+def _select_trades(
+    columns: Dict[str, np.ndarray], is_long: np.ndarray, is_short: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Gather the trade columns for the days a strategy goes long or short."""
+    mask = (is_long & (columns["long_shares"] > 0)) | (is_short & (columns["short_shares"] > 0))
+    rows = np.flatnonzero(mask)
+    side_long = is_long[rows]
+    side_short = ~side_long
+    long_rows = rows[side_long]
+    short_rows = rows[side_short]
+
+    direction = np.full(len(rows), SHORT, dtype=TRADE_COLUMNS["direction"])
+    direction[side_long] = LONG
+    trades = {
+        "date": columns["date"][rows],
+        "direction": direction,
+        "prev_return": columns["prev_return"][rows],
+    }
+    # Each output column is allocated once at its final size and filled in place
+    for name in ("entry_price", "exit_price", "shares", "dollar_pnl", "percentage_pnl"):
+        out = np.empty(len(rows), dtype=TRADE_COLUMNS[name])
+        out[side_long] = columns[f"long_{name}"][long_rows]
+        out[side_short] = columns[f"short_{name}"][short_rows]
+        trades[name] = out
+    return trades
+
+
+def _new_results(
+    df: pd.DataFrame, ticker: str, strategy_name: str, initial_capital: float
+) -> BacktestResults:
+    """Results shell with the period and buy & hold return filled in."""
+    results = BacktestResults(
+        ticker=ticker,
+        strategy_name=strategy_name,
+        start_date=df["date"].iloc[0].date(),
+        end_date=df["date"].iloc[-1].date(),
+        initial_capital=initial_capital,
+    )
+    first_price = df["open"].iloc[0]
+    last_price = df["close"].iloc[-1]
+    results.buy_hold_return_pct = (last_price - first_price) / first_price * 100
+    return results
+
+
 def backtest_mean_reversion(
     df: pd.DataFrame,
     ticker: str,
     threshold: float,
     initial_capital: float,
     skip_thursday: bool = True,
+    columns: Optional[Dict[str, np.ndarray]] = None,
 ) -> BacktestResults:
     """Backtest mean reversion strategy."""
-    df = df.copy()
-    df["daily_return"] = (df["close"] - df["open"]) / df["open"] * 100
-    df["prev_return"] = df["daily_return"].shift(1)
-    df["weekday"] = pd.to_datetime(df["date"]).apply(lambda x: x.weekday())
+    if columns is None:
+        columns = prepare_trade_columns(df, initial_capital)
 
-    results = BacktestResults(
-        ticker=ticker,
-        strategy_name=f"Mean Reversion ({threshold}%)",
-        start_date=df["date"].iloc[0],
-        end_date=df["date"].iloc[-1],
-        initial_capital=initial_capital,
-    )
+    results = _new_results(df, ticker, f"Mean Reversion ({threshold}%)", initial_capital)
 
-    capital = initial_capital
-    slippage_pct = 0.01
-
-    for i, row in df.iterrows():
-        if pd.isna(row["prev_return"]):
-            continue
-        if row["prev_return"] >= threshold:
-            continue
-        if skip_thursday and row["weekday"] == 3:
-            continue
-
-        entry_price = row["open"] * (1 + slippage_pct / 100)
-        exit_price = row["close"] * (1 - slippage_pct / 100)
-        shares = int(capital // entry_price)
-
-        if shares <= 0:
-            continue
-
-        dollar_pnl = (exit_price - entry_price) * shares
-        pct_pnl = (exit_price - entry_price) / entry_price * 100
-
-        results.trades.append(
-            BacktestTrade(
-                date=row["date"],
-                direction="long",
-                strategy="mean_reversion",
-                entry_price=entry_price,
-                exit_price=exit_price,
-                shares=shares,
-                dollar_pnl=dollar_pnl,
-                percentage_pnl=pct_pnl,
-                reason=f"Prev day: {row['prev_return']:.2f}%",
-            )
-        )
+    # The first day's NaN previous return compares False, so needs no separate check
+    is_long = columns["prev_return"] < threshold
+    if skip_thursday:
+        is_long &= columns["weekday"] != 3
 
-    first_price = df["open"].iloc[0]
-    last_price = df["close"].iloc[-1]
-    results.buy_hold_return_pct = (last_price - first_price) / first_price * 100
+    results.trade_labels = {LONG: ("mean_reversion", "Prev day: {prev:.2f}%")}
+    results.trades = _select_trades(columns, is_long, np.zeros_like(is_long))
     results.calculate_metrics()
     return results
 
 
 def backtest_short_thursday(
-    df: pd.DataFrame, ticker: str, initial_capital: float
+    df: pd.DataFrame,
+    ticker: str,
+    initial_capital: float,
+    columns: Optional[Dict[str, np.ndarray]] = None,
 ) -> BacktestResults:
     """Backtest short Thursday strategy."""
-    df = df.copy()
-    df["weekday"] = pd.to_datetime(df["date"]).apply(lambda x: x.weekday())
+    if columns is None:
+        columns = prepare_trade_columns(df, initial_capital)
 
-    results = BacktestResults(
-        ticker=ticker,
-        strategy_name="Short Thursday",
-        start_date=df["date"].iloc[0],
-        end_date=df["date"].iloc[-1],
-        initial_capital=initial_capital,
-    )
+    results = _new_results(df, ticker, "Short Thursday", initial_capital)
 
-    capital = initial_capital
-    slippage_pct = 0.01
-
-    for i, row in df.iterrows():
-        if row["weekday"] != 3:
-            continue
-
-        entry_price = row["open"] * (1 - slippage_pct / 100)
-        exit_price = row["close"] * (1 + slippage_pct / 100)
-        shares = int(capital // entry_price)
-
-        if shares <= 0:
-            continue
-
-        dollar_pnl = (entry_price - exit_price) * shares
-        pct_pnl = (entry_price - exit_price) / entry_price * 100
-
-        results.trades.append(
-            BacktestTrade(
-                date=row["date"],
-                direction="short",
-                strategy="short_thursday",
-                entry_price=entry_price,
-                exit_price=exit_price,
-                shares=shares,
-                dollar_pnl=dollar_pnl,
-                percentage_pnl=pct_pnl,
-                reason="Thursday short",
-            )
-        )
+    is_short = columns["weekday"] == 3
 
-    first_price = df["open"].iloc[0]
-    last_price = df["close"].iloc[-1]
-    results.buy_hold_return_pct = (last_price - first_price) / first_price * 100
+    results.trade_labels = {SHORT: ("short_thursday", "Thursday short")}
+    results.trades = _select_trades(columns, np.zeros_like(is_short), is_short)
     results.calculate_metrics()
     return results
 
 
 def backtest_combined(
-    df: pd.DataFrame, ticker: str, mr_threshold: float, initial_capital: float
+    df: pd.DataFrame,
+    ticker: str,
+    mr_threshold: float,
+    initial_capital: float,
+    columns: Optional[Dict[str, np.ndarray]] = None,
 ) -> BacktestResults:
     """Backtest combined strategy."""
-    df = df.copy()
-    df["daily_return"] = (df["close"] - df["open"]) / df["open"] * 100
-    df["prev_return"] = df["daily_return"].shift(1)
-    df["weekday"] = pd.to_datetime(df["date"]).apply(lambda x: x.weekday())
-
-    results = BacktestResults(
-        ticker=ticker,
-        strategy_name=f"Combined (MR: {mr_threshold}%)",
-        start_date=df["date"].iloc[0],
-        end_date=df["date"].iloc[-1],
-        initial_capital=initial_capital,
-    )
+    if columns is None:
+        columns = prepare_trade_columns(df, initial_capital)
 
-    capital = initial_capital
-    slippage_pct = 0.01
-
-    for i, row in df.iterrows():
-        trade = None
-
-        # Mean reversion takes priority
-        if not pd.isna(row["prev_return"]) and row["prev_return"] < mr_threshold:
-            entry_price = row["open"] * (1 + slippage_pct / 100)
-            exit_price = row["close"] * (1 - slippage_pct / 100)
-            shares = int(capital // entry_price)
-
-            if shares > 0:
-                dollar_pnl = (exit_price - entry_price) * shares
-                pct_pnl = (exit_price - entry_price) / entry_price * 100
-                trade = BacktestTrade(
-                    date=row["date"],
-                    direction="long",
-                    strategy="combined_mr",
-                    entry_price=entry_price,
-                    exit_price=exit_price,
-                    shares=shares,
-                    dollar_pnl=dollar_pnl,
-                    percentage_pnl=pct_pnl,
-                    reason=f"MR: prev {row['prev_return']:.2f}%",
-                )
+    results = _new_results(df, ticker, f"Combined (MR: {mr_threshold}%)", initial_capital)
 
-        # Short Thursday if no MR signal
-        elif row["weekday"] == 3:
-            entry_price = row["open"] * (1 - slippage_pct / 100)
-            exit_price = row["close"] * (1 + slippage_pct / 100)
-            shares = int(capital // entry_price)
-
-            if shares > 0:
-                dollar_pnl = (entry_price - exit_price) * shares
-                pct_pnl = (entry_price - exit_price) / entry_price * 100
-                trade = BacktestTrade(
-                    date=row["date"],
-                    direction="short",
-                    strategy="combined_thu",
-                    entry_price=entry_price,
-                    exit_price=exit_price,
-                    shares=shares,
-                    dollar_pnl=dollar_pnl,
-                    percentage_pnl=pct_pnl,
-                    reason="Short Thursday",
-                )
+    # Mean reversion takes priority; short Thursday only if no MR signal
+    is_long = columns["prev_return"] < mr_threshold
+    is_short = ~is_long & (columns["weekday"] == 3)
 
-        if trade:
-            results.trades.append(trade)
-
-    first_price = df["open"].iloc[0]
-    last_price = df["close"].iloc[-1]
-    results.buy_hold_return_pct = (last_price - first_price) / first_price * 100
+    results.trade_labels = {
+        LONG: ("combined_mr", "MR: prev {prev:.2f}%"),
+        SHORT: ("combined_thu", "Short Thursday"),
+    }
+    results.trades = _select_trades(columns, is_long, is_short)
     results.calculate_metrics()
     return results
 
 
+def run_ticker_backtests(
+    ticker: str, df: pd.DataFrame, initial_capital: float
+) -> Dict[str, BacktestResults]:
+    """Run every strategy variant on one ticker, sharing one pass of per-day columns."""
+    cols = prepare_trade_columns(df, initial_capital)
+    return {
+        f"{ticker}_mr_2": backtest_mean_reversion(df, ticker, -2.0, initial_capital, columns=cols),
+        f"{ticker}_mr_3": backtest_mean_reversion(df, ticker, -3.0, initial_capital, columns=cols),
+        f"{ticker}_short_thu": backtest_short_thursday(df, ticker, initial_capital, columns=cols),
+        f"{ticker}_combined_2": backtest_combined(df, ticker, -2.0, initial_capital, columns=cols),
+        f"{ticker}_combined_3": backtest_combined(df, ticker, -3.0, initial_capital, columns=cols),
+    }
+
+
 def run_comparison(
     ticker1: str, ticker2: str, start_date: date, end_date: date, initial_capital: float = 10000.0
 ):
     """Run comparison between two tickers."""
-    print(f"\nLoading {ticker1} data...")
-    df1 = load_data(ticker1, start_date, end_date)
+    print(f"\nLoading {ticker1} and {ticker2} data...")
+    frames = load_data([ticker1, ticker2], start_date, end_date)
+    df1, df2 = frames[ticker1], frames[ticker2]
     print(f"Loaded {len(df1)} days for {ticker1}")
-
-    print(f"\nLoading {ticker2} data...")
-    df2 = load_data(ticker2, start_date, end_date)
     print(f"Loaded {len(df2)} days for {ticker2}")
 
-    # Find common date range
-    dates1 = set(df1["date"])
-    dates2 = set(df2["date"])
-    common_dates = dates1 & dates2
+    # Find common date range (both frames are already in date order)
+    common_dates, rows1, rows2 = np.intersect1d(
+        df1["date"].to_numpy(), df2["date"].to_numpy(), assume_unique=True, return_indices=True
+    )
 
-    if not common_dates:
+    if len(common_dates) == 0:
         print("No overlapping dates found!")
         return
 
-    min_date = min(common_dates)
-    max_date = max(common_dates)
+    min_date, max_date = common_dates[[0, -1]].astype("datetime64[D]")
 
     print(f"\nCommon date range: {min_date} to {max_date} ({len(common_dates)} days)")
 
-    # Filter to common dates
-    df1 = df1[df1["date"].isin(common_dates)].sort_values("date").reset_index(drop=True)
-    df2 = df2[df2["date"].isin(common_dates)].sort_values("date").reset_index(drop=True)
+    # Filter to common dates by position; intersect1d already located them
+    df1 = df1.iloc[rows1].reset_index(drop=True)
+    df2 = df2.iloc[rows2].reset_index(drop=True)
 
+    # Each ticker's backtests are independent, so run them in worker processes
+    tickers = [(ticker1, df1), (ticker2, df2)]
     results = {}
-
-    # Run all strategies on both tickers
-    for ticker, df in [(ticker1, df1), (ticker2, df2)]:
-        print(f"\nRunning backtests on {ticker}...")
-
-        results[f"{ticker}_mr_2"] = backtest_mean_reversion(df, ticker, -2.0, initial_capital)
-        results[f"{ticker}_mr_3"] = backtest_mean_reversion(df, ticker, -3.0, initial_capital)
-        results[f"{ticker}_short_thu"] = backtest_short_thursday(df, ticker, initial_capital)
-        results[f"{ticker}_combined_2"] = backtest_combined(df, ticker, -2.0, initial_capital)
-        results[f"{ticker}_combined_3"] = backtest_combined(df, ticker, -3.0, initial_capital)
+    with ProcessPoolExecutor(max_workers=min(len(tickers), os.cpu_count() or 1)) as executor:
+        futures = []
+        for ticker, df in tickers:
+            print(f"\nRunning backtests on {ticker}...")
+            futures.append(executor.submit(run_ticker_backtests, ticker, df, initial_capital))
+        for future in futures:
+            results.update(future.result())
 
     return results, df1, df2
 
@@ -345,35 +455,42 @@ def print_comparison_table(results: Dict[str, BacktestResults], ticker1: str, ti
         "combined_3": "Combined (-3%)",
     }
 
-    print("\n" + "=" * 100)
-    print(f"{'STRATEGY COMPARISON':^100}")
-    print("=" * 100)
-
-    header = f"{'Strategy':<25} | {'':^35} | {'':^35}"
-    print(header)
-    print(f"{'':<25} | {ticker1:^35} | {ticker2:^35}")
-    print("-" * 100)
+    def summary(r: BacktestResults) -> str:
+        return f"{r.total_return_pct:+.1f}% ({r.win_rate:.0f}% win, {r.total_trades} trades)"
 
+    rows = []
     for strat in strategies:
         r1 = results.get(f"{ticker1}_{strat}")
         r2 = results.get(f"{ticker2}_{strat}")
-
         if r1 and r2:
-            name = strategy_names[strat]
-            col1 = f"{r1.total_return_pct:+.1f}% ({r1.win_rate:.0f}% win, {r1.total_trades} trades)"
-            col2 = f"{r2.total_return_pct:+.1f}% ({r2.win_rate:.0f}% win, {r2.total_trades} trades)"
-            print(f"{name:<25} | {col1:^35} | {col2:^35}")
-
-    print("-" * 100)
+            rows.append(
+                {"Strategy": strategy_names[strat], ticker1: summary(r1), ticker2: summary(r2)}
+            )
 
     # Buy and hold comparison
     r1 = results.get(f"{ticker1}_combined_2")
     r2 = results.get(f"{ticker2}_combined_2")
     if r1 and r2:
-        print(
-            f"{'Buy & Hold':<25} | {r1.buy_hold_return_pct:+.1f}%{' ':^28} | {r2.buy_hold_return_pct:+.1f}%{' ':^28}"
+        rows.append(
+            {
+                "Strategy": "Buy & Hold",
+                ticker1: f"{r1.buy_hold_return_pct:+.1f}%",
+                ticker2: f"{r2.buy_hold_return_pct:+.1f}%",
+            }
         )
 
+    comparison = pd.DataFrame(rows, columns=["Strategy", ticker1, ticker2])
+    print(
+        "\n".join(
+            [
+                "\n" + "=" * 100,
+                f"{'STRATEGY COMPARISON':^100}",
+                "=" * 100,
+                comparison.to_string(index=False),
+            ]
+        )
+    )
+
 
 def main():
     print("=" * 80)
@@ -402,16 +519,19 @@ def main():
 
     for key in sorted(results.keys()):
         r = results[key]
-        print(f"\n--- {key} ---")
-        print(f"Trades: {r.total_trades} (Long: {r.long_trades}, Short: {r.short_trades})")
-        print(f"Win Rate: {r.win_rate:.1f}%")
-        print(f"Total Return: {r.total_return_pct:+.1f}%")
-        print(f"Avg Return/Trade: {r.avg_return_pct:+.2f}%")
-        print(f"Best Trade: {r.best_trade_pct:+.2f}%")
-        print(f"Worst Trade: {r.worst_trade_pct:+.2f}%")
-        print(f"Sharpe Ratio: {r.sharpe_ratio:.2f}")
-        print(f"Buy & Hold: {r.buy_hold_return_pct:+.1f}%")
-        print(f"vs B&H: {r.total_return_pct - r.buy_hold_return_pct:+.1f}%")
+        lines = [
+            f"\n--- {key} ---",
+            f"Trades: {r.total_trades} (Long: {r.long_trades}, Short: {r.short_trades})",
+            f"Win Rate: {r.win_rate:.1f}%",
+            f"Total Return: {r.total_return_pct:+.1f}%",
+            f"Avg Return/Trade: {r.avg_return_pct:+.2f}%",
+            f"Best Trade: {r.best_trade_pct:+.2f}%",
+            f"Worst Trade: {r.worst_trade_pct:+.2f}%",
+            f"Sharpe Ratio: {r.sharpe_ratio:.2f}",
+            f"Buy & Hold: {r.buy_hold_return_pct:+.1f}%",
+            f"vs B&H: {r.total_return_pct - r.buy_hold_return_pct:+.1f}%",
+        ]
+        print("\n".join(lines))
 
     # Risk comparison
     print("\n" + "=" * 80)
@@ -422,12 +542,13 @@ def main():
         r1 = results.get(f"IBIT_{strat}")
         r2 = results.get(f"BITX_{strat}")
         if r1 and r2:
-            print(f"\n{strat}:")
-            print(f"  IBIT: Best {r1.best_trade_pct:+.2f}% / Worst {r1.worst_trade_pct:+.2f}%")
-            print(f"  BITX: Best {r2.best_trade_pct:+.2f}% / Worst {r2.worst_trade_pct:+.2f}%")
-            print(
-                f"  Leverage effect: ~{abs(r2.worst_trade_pct / r1.worst_trade_pct):.1f}x on worst trade"
-            )
+            lines = [
+                f"\n{strat}:",
+                f"  IBIT: Best {r1.best_trade_pct:+.2f}% / Worst {r1.worst_trade_pct:+.2f}%",
+                f"  BITX: Best {r2.best_trade_pct:+.2f}% / Worst {r2.worst_trade_pct:+.2f}%",
+                f"  Leverage effect: ~{abs(r2.worst_trade_pct / r1.worst_trade_pct):.1f}x on worst trade",
+            ]
+            print("\n".join(lines))
 
 
 if __name__ == "__main__":
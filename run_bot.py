@@ -24,12 +24,9 @@ import logging
 import os
 import signal
 import sys
-import time
-from datetime import datetime
+import threading
 
 from src.config import setup_logging
-from src.etrade_client import ETradeClient
-from src.smart_scheduler import SmartScheduler
 from src.smart_strategy import StrategyConfig
 from src.trading_bot import BotConfig, TradingBot, TradingMode
 from src.utils import get_et_now
@@ -64,7 +61,9 @@ def create_bot(live_mode: bool = False) -> TradingBot:
             logger.error("Set ETRADE_CONSUMER_KEY, ETRADE_CONSUMER_SECRET, and ETRADE_ACCOUNT_ID")
             sys.exit(1)
 
-        # Create E*TRADE client
+        # Create E*TRADE client (imported here so paper runs never load it)
+        from src.etrade_client import ETradeClient
+
         client = ETradeClient(consumer_key, consumer_secret)
 
         if not client.is_authenticated():
@@ -131,13 +130,16 @@ def run_once(bot: TradingBot):
 
 def run_scheduled(bot: TradingBot):
     """Run the bot with scheduled jobs."""
+    # Deferred so --once runs don't load the scheduler, APScheduler or Telegram
+    from src.smart_scheduler import SmartScheduler
+
     scheduler = SmartScheduler(bot)
+    shutdown = threading.Event()
 
-    # Handle shutdown gracefully
+    # Handle shutdown gracefully; the main thread stops the scheduler once woken
     def shutdown_handler(signum, frame):
         logger.info("Shutdown signal received...")
-        scheduler.stop()
-        sys.exit(0)
+        shutdown.set()
 
     signal.signal(signal.SIGINT, shutdown_handler)
     signal.signal(signal.SIGTERM, shutdown_handler)
@@ -145,6 +147,13 @@ def run_scheduled(bot: TradingBot):
     # Start scheduler
     scheduler.start()
 
+    # Log heartbeat every hour
+    def log_heartbeat():
+        status = scheduler.get_status()
+        logger.info(f"Bot heartbeat - Status: {status['status']}, Errors: {status['error_count']}")
+
+    scheduler.scheduler.add_job(log_heartbeat, "cron", minute=0, id="heartbeat", name="Heartbeat")
+
     mode = "PAPER" if bot.is_paper_mode else "LIVE"
     print("\n" + "=" * 60)
     print(f"Bitcoin ETF Trading Bot - {mode} MODE")
@@ -159,16 +168,11 @@ def run_scheduled(bot: TradingBot):
     print("\nBot is running. Press Ctrl+C to stop.")
     print("=" * 60 + "\n")
 
-    # Keep running
+    # Keep running; jobs run on the scheduler thread, so just wait for a signal. The
+    # timeout keeps the wait interruptible on Windows, which has no signal.pause()
     try:
-        while True:
-            time.sleep(60)
-            # Log heartbeat every hour
-            if datetime.now().minute == 0:
-                status = scheduler.get_status()
-                logger.info(
-                    f"Bot heartbeat - Status: {status['status']}, Errors: {status['error_count']}"
-                )
+        while not shutdown.wait(timeout=1.0):
+            pass
     except KeyboardInterrupt:
         pass
     finally:
@@ -10,10 +10,16 @@ Backtest comparing strategy WITH and WITHOUT 10 AM Dump.
 This script uses intraday data to properly simulate the 10 AM dump trades.
 """
 
+import contextlib
+import math
 import os
+import pickle
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, timedelta
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -27,142 +33,223 @@ load_dotenv()
 
 from src.data_providers import AlpacaProvider  # noqa: E402
 
+INTRADAY_VALUE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+SLIPPAGE_PCT = 0.02  # 0.02% against us on each fill
+ENTRY_SLIPPAGE = 1 + SLIPPAGE_PCT / 100
+EXIT_SLIPPAGE = 1 - SLIPPAGE_PCT / 100
+
+CACHE_DIR = Path(__file__).parent / ".cache" / "backtest_10am_dump"
+CACHE_TTL_SECONDS = 15 * 60
+
+
+def trading_day(timestamps: pd.Series) -> pd.Series:
+    """
+    Calendar day of each timestamp (in its own timezone) as naive midnight datetime64.
+
+    Dates are kept as datetime64 rather than datetime.date objects so aligning
+    and merging on them works on integer keys instead of hashing Python objects.
+    """
+    return timestamps.dt.tz_localize(None).dt.normalize()
+
+
+def fetch_bars(
+    symbol: str,
+    start_date: date,
+    end_date: date,
+    timeframe: str,
+    fetch: Callable[[str, str, str, str], Optional[List[Dict[str, Any]]]],
+) -> pd.DataFrame:
+    """Raw bars as a DataFrame, reusing a local copy of an earlier download."""
+    cache_path = CACHE_DIR / f"{symbol.replace('/', '')}_{timeframe}_{start_date}_{end_date}.pkl"
+    # Closed ranges never change; ranges that include today go stale
+    df = _read_cache(cache_path, None if end_date < date.today() else CACHE_TTL_SECONDS)
+    if df is not None:
+        return df
+
+    bars = fetch(
+        symbol, start_date.isoformat(), (end_date + timedelta(days=1)).isoformat(), timeframe
+    )
+    df = pd.DataFrame(bars)
+    if not df.empty:
+        _write_cache(cache_path, df)
+    return df
+
+
+def _read_cache(path: Path, max_age: Optional[float]) -> Optional[pd.DataFrame]:
+    """Cached frame at path, or None if it is missing, too old or unreadable."""
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime >= max_age:
+            return None
+        return pd.read_pickle(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+        print(f"Ignoring unreadable cache file {path}: {e}")
+        return None
+
+
+def _write_cache(path: Path, df: pd.DataFrame) -> None:
+    """Save df to path; the cache is only an optimisation, so failures are just reported."""
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so an interrupted run never leaves a partial file behind
+        df.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Could not cache data to {path}: {e}")
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+
 
 def get_intraday_data(
     alpaca: AlpacaProvider, symbol: str, start_date: date, end_date: date
 ) -> pd.DataFrame:
     """Fetch intraday (minute) bars for a symbol."""
-    bars = alpaca.get_historical_bars(
-        symbol, start_date.isoformat(), (end_date + timedelta(days=1)).isoformat(), "1Min"
-    )
+    df = fetch_bars(symbol, start_date, end_date, "1Min", alpaca.get_historical_bars)
 
-    if not bars:
+    if df.empty:
         return pd.DataFrame()
 
-    df = pd.DataFrame(bars)
     df["timestamp"] = pd.to_datetime(df["t"])
     # Convert UTC to ET (Eastern Time)
     df["timestamp_et"] = df["timestamp"].dt.tz_convert("America/New_York")
-    df["date"] = df["timestamp_et"].dt.date
-    df["time"] = df["timestamp_et"].dt.strftime("%H:%M")
+    df["date"] = trading_day(df["timestamp_et"])
+    # Minutes after midnight ET; a packed int16 instead of "HH:MM" strings
+    timestamp_et = df["timestamp_et"].dt
+    df["minutes"] = timestamp_et.hour.astype("int16") * 60 + timestamp_et.minute.astype("int16")
     df = df.rename(columns={"o": "open", "h": "high", "l": "low", "c": "close", "v": "volume"})
-    return df
+    # Minute bars are the bulk of the data; float32 halves the bytes each scan moves
+    return df.astype({column: "float32" for column in INTRADAY_VALUE_COLUMNS})
 
 
 def get_daily_data(
     alpaca: AlpacaProvider, symbol: str, start_date: date, end_date: date
 ) -> pd.DataFrame:
     """Fetch daily bars for a symbol."""
-    bars = alpaca.get_historical_bars(
-        symbol, start_date.isoformat(), (end_date + timedelta(days=1)).isoformat(), "1Day"
-    )
+    df = fetch_bars(symbol, start_date, end_date, "1Day", alpaca.get_historical_bars)
 
-    if not bars:
+    if df.empty:
         return pd.DataFrame()
 
-    df = pd.DataFrame(bars)
-    df["date"] = pd.to_datetime(df["t"]).dt.date
+    df["date"] = trading_day(pd.to_datetime(df["t"]))
     df = df.rename(columns={"o": "open", "h": "high", "l": "low", "c": "close", "v": "volume"})
     return df
 
 
 def get_btc_overnight(
     alpaca: AlpacaProvider, start_date: date, end_date: date
-) -> Dict[date, float]:
+) -> Dict[pd.Timestamp, float]:
     """Get BTC overnight changes (yesterday close → today open)."""
-    bars = alpaca.get_crypto_bars(
-        "BTC/USD", start_date.isoformat(), (end_date + timedelta(days=1)).isoformat(), "1Day"
-    )
+    df = fetch_bars("BTC/USD", start_date, end_date, "1Day", alpaca.get_crypto_bars)
 
-    if not bars:
+    if df.empty:
         return {}
 
-    df = pd.DataFrame(bars)
-    df["date"] = pd.to_datetime(df["t"]).dt.date
+    df["date"] = trading_day(pd.to_datetime(df["t"]))
     df = df.rename(columns={"o": "open", "c": "close"})
     df = df.sort_values("date").reset_index(drop=True)
 
-    overnight = {}
-    for i in range(1, len(df)):
-        prev_close = df.iloc[i - 1]["close"]
-        today_open = df.iloc[i]["open"]
-        pct = (today_open - prev_close) / prev_close * 100 if prev_close > 0 else 0
-        overnight[df.iloc[i]["date"]] = pct
-
-    return overnight
+    prev_close = df["close"].shift(1)
+    overnight_pct = np.where(prev_close > 0, (df["open"] - prev_close) / prev_close * 100, 0.0)
 
+    return dict(zip(df["date"].iloc[1:], overnight_pct[1:]))
 
-def find_nearest_bar(
-    day_data: pd.DataFrame, target_time: str, window_minutes: int = 5
-) -> pd.Series:
-    """Find the bar nearest to target_time within a window."""
-    target_hour, target_min = map(int, target_time.split(":"))
-    target_minutes = target_hour * 60 + target_min
 
-    day_data = day_data.copy()
-    day_data["minutes"] = day_data["timestamp_et"].dt.hour * 60 + day_data["timestamp_et"].dt.minute
-    day_data["diff"] = abs(day_data["minutes"] - target_minutes)
+def extract_10am_bars(sbit_intraday: pd.DataFrame, window_minutes: int = 5) -> pd.DataFrame:
+    """
+    Find the 9:35 entry and 10:30 exit closes for every trading day.
 
-    # Filter to within window
-    nearby = day_data[day_data["diff"] <= window_minutes]
-    if nearby.empty:
-        return pd.Series()
+    Each target takes the bar nearest to it within window_minutes (earlier bar
+    on a tie). Days missing either bar are dropped. Returns columns
+    date, entry, exit sorted by date.
+    """
+    # Gather just the three columns merge_asof needs in minutes order (one copy each)
+    minutes = sbit_intraday["minutes"].to_numpy()
+    order = np.argsort(minutes, kind="stable")
+    bars = pd.DataFrame(
+        {
+            "date": sbit_intraday["date"].to_numpy()[order],
+            "minutes": minutes[order],
+            "close": sbit_intraday["close"].to_numpy()[order],
+        }
+    )
+    days = np.unique(sbit_intraday["date"].to_numpy())
+
+    # Both targets go through one merge: every day at 9:35, then every day at 10:30
+    # (already sorted by minutes, as merge_asof requires)
+    targets = pd.DataFrame(
+        {
+            "date": np.tile(days, 2),
+            "minutes": np.repeat(
+                np.array([9 * 60 + 35, 10 * 60 + 30], dtype=minutes.dtype), len(days)
+            ),
+        }
+    )
+    nearest = pd.merge_asof(
+        targets,
+        bars,
+        on="minutes",
+        by="date",
+        direction="nearest",
+        tolerance=window_minutes,
+    )
+    entry, exit_ = nearest["close"].to_numpy(dtype=np.float64).reshape(2, len(days))
+    result = pd.DataFrame({"date": days, "entry": entry, "exit": exit_})
 
-    return nearby.loc[nearby["diff"].idxmin()]
+    return result.dropna(subset=["entry", "exit"]).reset_index(drop=True)
 
 
-def backtest_10am_dump_only(
-    sbit_intraday: pd.DataFrame, initial_capital: float = 10000.0
-) -> Dict[str, Any]:
-    """Backtest ONLY the 10 AM dump strategy (SBIT 9:35 → 10:30)."""
-    capital = initial_capital
-    trades = []
-    slippage = 0.02  # 0.02%
+def align_open_close(daily: pd.DataFrame, dates: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Open and close arrays from daily bars aligned to dates (NaN where missing)."""
+    aligned = daily.set_index("date")[["open", "close"]].reindex(dates.to_numpy())
+    return aligned["open"].to_numpy(), aligned["close"].to_numpy()
 
-    # Group by date
-    for trade_date, day_data in sbit_intraday.groupby("date"):
-        # Find nearest bars to 9:35 entry and 10:30 exit (within 5 min window)
-        entry_bar = find_nearest_bar(day_data, "09:35", window_minutes=5)
-        exit_bar = find_nearest_bar(day_data, "10:30", window_minutes=5)
 
-        if entry_bar.empty or exit_bar.empty:
-            continue
+def align_btc_change(btc_overnight: Dict[pd.Timestamp, float], dates: pd.Series) -> np.ndarray:
+    """BTC overnight change (%) aligned to dates (NaN where there is no BTC bar)."""
+    return pd.Series(btc_overnight, dtype=float).reindex(dates.to_numpy()).to_numpy()
 
-        entry_price = entry_bar["close"] * (1 + slippage / 100)
-        exit_price = exit_bar["close"] * (1 - slippage / 100)
 
-        ret = (exit_price - entry_price) / entry_price
-        capital *= 1 + ret
+def backtest_10am_dump_only(
+    sbit_10am: pd.DataFrame, initial_capital: float = 10000.0
+) -> Dict[str, Any]:
+    """
+    Backtest ONLY the 10 AM dump strategy (SBIT 9:35 → 10:30).
 
-        trades.append(
-            {
-                "date": trade_date,
-                "signal": "10am_dump",
-                "etf": "SBIT",
-                "entry": entry_price,
-                "exit": exit_price,
-                "return_pct": ret * 100,
-                "capital": capital,
-            }
-        )
+    sbit_10am is the per-day entry/exit table from extract_10am_bars.
+    """
+    entry_price = sbit_10am["entry"].to_numpy() * ENTRY_SLIPPAGE
+    exit_price = sbit_10am["exit"].to_numpy() * EXIT_SLIPPAGE
+    ret = (exit_price - entry_price) / entry_price
+
+    # Compound in trade order; the seed keeps the same multiplication order as a running total
+    capital = np.cumprod(np.concatenate(([initial_capital], 1 + ret)))[1:]
+    final_capital = float(capital[-1]) if len(capital) else initial_capital
+
+    trades = {
+        "date": sbit_10am["date"].to_numpy(),
+        "signal": np.full(len(ret), "10am_dump"),
+        "etf": np.full(len(ret), "SBIT"),
+        "entry": entry_price,
+        "exit": exit_price,
+        "return_pct": ret * 100,
+        "capital": capital,
+    }
 
-    return calculate_metrics(trades, initial_capital, capital)
+    return calculate_metrics(trades, initial_capital, final_capital)
 
 
 def backtest_mean_reversion(
     ibit_daily: pd.DataFrame,
     bitu_daily: pd.DataFrame,
-    btc_overnight: Dict[date, float],
+    btc_overnight: Dict[pd.Timestamp, float],
     threshold: float = -2.0,
     initial_capital: float = 10000.0,
     use_btc_filter: bool = True,
 ) -> Dict[str, Any]:
     """Backtest mean reversion strategy (BITU after IBIT drops 2%+)."""
-    capital = initial_capital
-    trades = []
-    skipped = []
-    slippage = 0.02
-
     # Calculate previous day returns
     ibit_daily = ibit_daily.sort_values("date").reset_index(drop=True)
     ibit_daily["daily_return"] = (
@@ -170,65 +257,116 @@ def backtest_mean_reversion(
     )
     ibit_daily["prev_return"] = ibit_daily["daily_return"].shift(1)
 
-    # Create BITU lookup by date
-    bitu_by_date = {row["date"]: row for _, row in bitu_daily.iterrows()}
-
-    for i in range(1, len(ibit_daily)):
-        row = ibit_daily.iloc[i]
-        prev_ret = row["prev_return"]
-        trade_date = row["date"]
-
-        if pd.isna(prev_ret) or prev_ret >= threshold:
-            continue
-
-        # Check BTC overnight filter
-        if use_btc_filter and trade_date in btc_overnight:
-            btc_change = btc_overnight[trade_date]
-            if btc_change <= 0:
-                skipped.append(
-                    {
-                        "date": trade_date,
-                        "reason": f"BTC down {btc_change:.2f}%",
-                        "prev_return": prev_ret,
-                    }
-                )
-                continue
-
-        # Execute trade
-        if trade_date not in bitu_by_date:
-            continue
-
-        bitu_row = bitu_by_date[trade_date]
-        entry_price = bitu_row["open"] * (1 + slippage / 100)
-        exit_price = bitu_row["close"] * (1 - slippage / 100)
-
-        ret = (exit_price - entry_price) / entry_price
-        capital *= 1 + ret
-
-        trades.append(
-            {
-                "date": trade_date,
-                "signal": "mean_reversion",
-                "etf": "BITU",
-                "entry": entry_price,
-                "exit": exit_price,
-                "return_pct": ret * 100,
-                "capital": capital,
-                "prev_ibit_return": prev_ret,
-            }
-        )
+    # BITU open/close aligned to the IBIT rows (NaN where BITU has no bar)
+    bitu_open, bitu_close = align_open_close(bitu_daily, ibit_daily["date"])
 
-    metrics = calculate_metrics(trades, initial_capital, capital)
+    # Only days after a big enough drop can trade; a NaN previous return compares False
+    prev_return = ibit_daily["prev_return"].to_numpy()
+    dates = ibit_daily["date"].to_numpy()
+    eligible = prev_return < threshold
+
+    # BTC overnight filter (days without BTC data pass)
+    btc_change = align_btc_change(btc_overnight, ibit_daily["date"])
+    btc_down = use_btc_filter & ~np.isnan(btc_change) & (btc_change <= 0)
+
+    skipped = [
+        {
+            "date": dates[i],
+            "reason": f"BTC down {btc_change[i]:.2f}%",
+            "prev_return": prev_return[i],
+        }
+        for i in np.flatnonzero(eligible & btc_down)
+    ]
+
+    rows = np.flatnonzero(eligible & ~btc_down & ~np.isnan(bitu_open))
+    count = len(rows)
+    entry_price = bitu_open[rows] * ENTRY_SLIPPAGE
+    exit_price = bitu_close[rows] * EXIT_SLIPPAGE
+    ret = (exit_price - entry_price) / entry_price
+
+    # Compound in trade order; the seed keeps the same multiplication order as a running total
+    capital = np.cumprod(np.concatenate(([initial_capital], 1 + ret)))[1:]
+    final_capital = float(capital[-1]) if len(capital) else initial_capital
+
+    trades = {
+        "date": dates[rows],
+        "signal": np.full(count, "mean_reversion"),
+        "etf": np.full(count, "BITU"),
+        "entry": entry_price,
+        "exit": exit_price,
+        "return_pct": ret * 100,
+        "capital": capital,
+        "prev_ibit_return": prev_return[rows],
+    }
+
+    metrics = calculate_metrics(trades, initial_capital, final_capital)
     metrics["skipped_by_btc_filter"] = len(skipped)
     metrics["skipped_details"] = skipped
     return metrics
 
 
+def _combined_inputs(
+    ibit_daily: pd.DataFrame,
+    bitu_daily: pd.DataFrame,
+    sbit_10am: pd.DataFrame,
+    btc_overnight: Dict[pd.Timestamp, float],
+) -> Dict[str, Any]:
+    """Per-day inputs for the combined backtests, aligned to the IBIT rows (NaN = missing)."""
+    ibit_daily = ibit_daily.sort_values("date").reset_index(drop=True)
+    daily_return = (ibit_daily["close"] - ibit_daily["open"]) / ibit_daily["open"] * 100
+    dates = ibit_daily["date"]
+
+    bitu_open, bitu_close = align_open_close(bitu_daily, dates)
+    sbit = sbit_10am.set_index("date").reindex(dates.to_numpy())
+
+    return {
+        "dates": dates.to_numpy(),
+        "prev_return": daily_return.shift(1).to_numpy(),
+        "btc_change": align_btc_change(btc_overnight, dates),
+        "bitu_open": bitu_open,
+        "bitu_close": bitu_close,
+        "sbit_entry": sbit["entry"].to_numpy(),
+        "sbit_exit": sbit["exit"].to_numpy(),
+    }
+
+
+def _compound_trades(
+    inputs: Dict[str, Any],
+    is_dump: np.ndarray,
+    is_mr: np.ndarray,
+    initial_capital: float,
+) -> Tuple[Dict[str, np.ndarray], float]:
+    """Build the day-ordered trade columns for 10 AM dump (SBIT) and mean reversion (BITU) days."""
+    rows = np.flatnonzero(is_dump | is_mr)
+    mr_rows = is_mr[rows]
+
+    entry_close = np.where(mr_rows, inputs["bitu_open"][rows], inputs["sbit_entry"][rows])
+    exit_close = np.where(mr_rows, inputs["bitu_close"][rows], inputs["sbit_exit"][rows])
+    entry_price = entry_close * ENTRY_SLIPPAGE
+    exit_price = exit_close * EXIT_SLIPPAGE
+    ret = (exit_price - entry_price) / entry_price
+
+    # Compound in trade order; the seed keeps the same multiplication order as a running total
+    capital = np.cumprod(np.concatenate(([initial_capital], 1 + ret)))[1:]
+    final_capital = float(capital[-1]) if len(capital) else initial_capital
+
+    trades = {
+        "date": inputs["dates"][rows],
+        "signal": np.where(mr_rows, "mean_reversion", "10am_dump"),
+        "etf": np.where(mr_rows, "BITU", "SBIT"),
+        "entry": entry_price,
+        "exit": exit_price,
+        "return_pct": ret * 100,
+        "capital": capital,
+    }
+    return trades, final_capital
+
+
 def backtest_combined(
     ibit_daily: pd.DataFrame,
     bitu_daily: pd.DataFrame,
-    sbit_intraday: pd.DataFrame,
-    btc_overnight: Dict[date, float],
+    sbit_10am: pd.DataFrame,
+    btc_overnight: Dict[pd.Timestamp, float],
     include_10am_dump: bool = True,
     initial_capital: float = 10000.0,
 ) -> Dict[str, Any]:
@@ -239,119 +377,40 @@ def backtest_combined(
     1. 10 AM Dump (if enabled) - takes priority at 9:35 AM
     2. Mean Reversion
     """
-    capital = initial_capital
-    trades = []
-    skipped = []
-    slippage = 0.02
     threshold = -2.0
 
-    # Prepare data
-    ibit_daily = ibit_daily.sort_values("date").reset_index(drop=True)
-    ibit_daily["daily_return"] = (
-        (ibit_daily["close"] - ibit_daily["open"]) / ibit_daily["open"] * 100
-    )
-    ibit_daily["prev_return"] = ibit_daily["daily_return"].shift(1)
+    inputs = _combined_inputs(ibit_daily, bitu_daily, sbit_10am, btc_overnight)
+    btc_change = inputs["btc_change"]
+
+    # The first day has no previous return and is never traded
+    tradable = np.arange(len(inputs["dates"])) >= 1
+
+    # 10 AM dump runs EVERY day it has bars (if enabled) and takes priority at 9:35 AM,
+    # matching actual code behavior
+    is_dump = tradable & include_10am_dump & ~np.isnan(inputs["sbit_entry"])
 
-    bitu_by_date = {row["date"]: row for _, row in bitu_daily.iterrows()}
-
-    # Get 10 AM dump data by date
-    sbit_10am = {}
-    for trade_date, day_data in sbit_intraday.groupby("date"):
-        entry_bar = find_nearest_bar(day_data, "09:35", window_minutes=5)
-        exit_bar = find_nearest_bar(day_data, "10:30", window_minutes=5)
-        if not entry_bar.empty and not exit_bar.empty:
-            sbit_10am[trade_date] = {
-                "entry": entry_bar["close"],
-                "exit": exit_bar["close"],
-            }
-
-    # Track which dates had 10 AM dump trades
-    ten_am_dump_dates = set()
-
-    for i in range(1, len(ibit_daily)):
-        row = ibit_daily.iloc[i]
-        prev_ret = row["prev_return"]
-        trade_date = row["date"]
-
-        # Check if 10 AM dump should run (it runs EVERY day if enabled)
-        if include_10am_dump and trade_date in sbit_10am:
-            # 10 AM dump takes priority
-            data = sbit_10am[trade_date]
-            entry_price = data["entry"] * (1 + slippage / 100)
-            exit_price = data["exit"] * (1 - slippage / 100)
-
-            ret = (exit_price - entry_price) / entry_price
-            capital *= 1 + ret
-
-            trades.append(
-                {
-                    "date": trade_date,
-                    "signal": "10am_dump",
-                    "etf": "SBIT",
-                    "entry": entry_price,
-                    "exit": exit_price,
-                    "return_pct": ret * 100,
-                    "capital": capital,
-                }
-            )
-            ten_am_dump_dates.add(trade_date)
-
-            # Skip mean reversion check for this day since 10 AM dump took priority
-            # (This matches actual code behavior at 9:35 AM)
-            continue
-
-        # Mean reversion check (only if 10 AM dump didn't fire)
-        if pd.isna(prev_ret) or prev_ret >= threshold:
-            continue
-
-        # BTC overnight filter
-        if trade_date in btc_overnight:
-            btc_change = btc_overnight[trade_date]
-            if btc_change <= 0:
-                skipped.append(
-                    {
-                        "date": trade_date,
-                        "reason": f"BTC down {btc_change:.2f}%",
-                        "prev_return": prev_ret,
-                    }
-                )
-                continue
-
-        # Execute mean reversion
-        if trade_date not in bitu_by_date:
-            continue
-
-        bitu_row = bitu_by_date[trade_date]
-        entry_price = bitu_row["open"] * (1 + slippage / 100)
-        exit_price = bitu_row["close"] * (1 - slippage / 100)
-
-        ret = (exit_price - entry_price) / entry_price
-        capital *= 1 + ret
-
-        trades.append(
-            {
-                "date": trade_date,
-                "signal": "mean_reversion",
-                "etf": "BITU",
-                "entry": entry_price,
-                "exit": exit_price,
-                "return_pct": ret * 100,
-                "capital": capital,
-            }
-        )
+    # Mean reversion only if 10 AM dump didn't fire; a NaN previous return compares False
+    mr_signal = tradable & ~is_dump & (inputs["prev_return"] < threshold)
+
+    # BTC overnight filter (days without BTC data pass)
+    btc_down = ~np.isnan(btc_change) & (btc_change <= 0)
+    skipped = mr_signal & btc_down
+    is_mr = mr_signal & ~btc_down & ~np.isnan(inputs["bitu_open"])
+
+    trades, capital = _compound_trades(inputs, is_dump, is_mr, initial_capital)
 
     metrics = calculate_metrics(trades, initial_capital, capital)
-    metrics["ten_am_dump_trades"] = len([t for t in trades if t["signal"] == "10am_dump"])
-    metrics["mean_reversion_trades"] = len([t for t in trades if t["signal"] == "mean_reversion"])
-    metrics["skipped_by_btc_filter"] = len(skipped)
+    metrics["ten_am_dump_trades"] = int(np.count_nonzero(is_dump))
+    metrics["mean_reversion_trades"] = int(np.count_nonzero(is_mr))
+    metrics["skipped_by_btc_filter"] = int(np.count_nonzero(skipped))
     return metrics
 
 
 def backtest_combined_mr_priority(
     ibit_daily: pd.DataFrame,
     bitu_daily: pd.DataFrame,
-    sbit_intraday: pd.DataFrame,
-    btc_overnight: Dict[date, float],
+    sbit_10am: pd.DataFrame,
+    btc_overnight: Dict[pd.Timestamp, float],
     initial_capital: float = 10000.0,
 ) -> Dict[str, Any]:
     """
@@ -360,118 +419,44 @@ def backtest_combined_mr_priority(
     On mean reversion days: do mean reversion (BITU), skip 10 AM dump
     On non-mean-reversion days: do 10 AM dump (SBIT)
     """
-    capital = initial_capital
-    trades = []
-    skipped = []
-    slippage = 0.02
     threshold = -2.0
 
-    # Prepare data
-    ibit_daily = ibit_daily.sort_values("date").reset_index(drop=True)
-    ibit_daily["daily_return"] = (
-        (ibit_daily["close"] - ibit_daily["open"]) / ibit_daily["open"] * 100
-    )
-    ibit_daily["prev_return"] = ibit_daily["daily_return"].shift(1)
+    inputs = _combined_inputs(ibit_daily, bitu_daily, sbit_10am, btc_overnight)
+    btc_change = inputs["btc_change"]
+
+    # The first day has no previous return and is never traded
+    tradable = np.arange(len(inputs["dates"])) >= 1
+
+    # Mean reversion day: previous day down enough and BTC up overnight (BTC data required)
+    mr_signal = tradable & (inputs["prev_return"] < threshold)
+    has_btc = ~np.isnan(btc_change)
+    is_mean_rev_day = mr_signal & has_btc & (btc_change > 0)
+    skipped = mr_signal & has_btc & (btc_change <= 0)
+
+    # MEAN REVERSION takes priority; without a BITU bar that day nothing trades
+    is_mr = is_mean_rev_day & ~np.isnan(inputs["bitu_open"])
 
-    bitu_by_date = {row["date"]: row for _, row in bitu_daily.iterrows()}
-
-    # Get 10 AM dump data by date
-    sbit_10am = {}
-    for trade_date, day_data in sbit_intraday.groupby("date"):
-        entry_bar = find_nearest_bar(day_data, "09:35", window_minutes=5)
-        exit_bar = find_nearest_bar(day_data, "10:30", window_minutes=5)
-        if not entry_bar.empty and not exit_bar.empty:
-            sbit_10am[trade_date] = {
-                "entry": entry_bar["close"],
-                "exit": exit_bar["close"],
-            }
-
-    # Build set of mean reversion days (for reference)
-    mean_rev_days = set()
-
-    for i in range(1, len(ibit_daily)):
-        row = ibit_daily.iloc[i]
-        prev_ret = row["prev_return"]
-        trade_date = row["date"]
-
-        # Check if this is a mean reversion day
-        is_mean_rev_day = False
-        if not pd.isna(prev_ret) and prev_ret < threshold:
-            # Check BTC overnight filter
-            if trade_date in btc_overnight:
-                btc_change = btc_overnight[trade_date]
-                if btc_change > 0:
-                    is_mean_rev_day = True
-                else:
-                    skipped.append(
-                        {
-                            "date": trade_date,
-                            "reason": f"BTC down {btc_change:.2f}%",
-                            "prev_return": prev_ret,
-                        }
-                    )
-
-        if is_mean_rev_day:
-            # MEAN REVERSION takes priority
-            mean_rev_days.add(trade_date)
-
-            if trade_date not in bitu_by_date:
-                continue
-
-            bitu_row = bitu_by_date[trade_date]
-            entry_price = bitu_row["open"] * (1 + slippage / 100)
-            exit_price = bitu_row["close"] * (1 - slippage / 100)
-
-            ret = (exit_price - entry_price) / entry_price
-            capital *= 1 + ret
-
-            trades.append(
-                {
-                    "date": trade_date,
-                    "signal": "mean_reversion",
-                    "etf": "BITU",
-                    "entry": entry_price,
-                    "exit": exit_price,
-                    "return_pct": ret * 100,
-                    "capital": capital,
-                }
-            )
-        else:
-            # Not a mean reversion day - do 10 AM dump if available
-            if trade_date in sbit_10am:
-                data = sbit_10am[trade_date]
-                entry_price = data["entry"] * (1 + slippage / 100)
-                exit_price = data["exit"] * (1 - slippage / 100)
-
-                ret = (exit_price - entry_price) / entry_price
-                capital *= 1 + ret
-
-                trades.append(
-                    {
-                        "date": trade_date,
-                        "signal": "10am_dump",
-                        "etf": "SBIT",
-                        "entry": entry_price,
-                        "exit": exit_price,
-                        "return_pct": ret * 100,
-                        "capital": capital,
-                    }
-                )
+    # Not a mean reversion day - do 10 AM dump if available
+    is_dump = tradable & ~is_mean_rev_day & ~np.isnan(inputs["sbit_entry"])
+
+    trades, capital = _compound_trades(inputs, is_dump, is_mr, initial_capital)
 
     metrics = calculate_metrics(trades, initial_capital, capital)
-    metrics["ten_am_dump_trades"] = len([t for t in trades if t["signal"] == "10am_dump"])
-    metrics["mean_reversion_trades"] = len([t for t in trades if t["signal"] == "mean_reversion"])
-    metrics["skipped_by_btc_filter"] = len(skipped)
+    metrics["ten_am_dump_trades"] = int(np.count_nonzero(is_dump))
+    metrics["mean_reversion_trades"] = int(np.count_nonzero(is_mr))
+    metrics["skipped_by_btc_filter"] = int(np.count_nonzero(skipped))
     return metrics
 
 
 def calculate_metrics(
-    trades: List[Dict], initial_capital: float, final_capital: float
+    trades: Dict[str, np.ndarray], initial_capital: float, final_capital: float
 ) -> Dict[str, Any]:
-    """Calculate backtest metrics."""
+    """Calculate backtest metrics from columnar trades (one array per field)."""
     total_return = (final_capital - initial_capital) / initial_capital * 100
+    num_trades = len(trades["return_pct"])
 
-    if not trades:
+    # Nothing traded: skip the array work entirely
+    if num_trades == 0:
         return {
             "initial_capital": initial_capital,
             "final_capital": final_capital,
@@ -481,30 +466,27 @@ def calculate_metrics(
             "avg_return": 0,
             "sharpe_ratio": 0,
             "max_drawdown_pct": 0,
-            "trades": [],
+            "trades": trades,
         }
 
-    returns = [t["return_pct"] / 100 for t in trades]
-    win_rate = sum(1 for r in returns if r > 0) / len(returns) * 100
-    avg_return = np.mean(returns) * 100
-    sharpe = (
-        (np.mean(returns) / np.std(returns)) * np.sqrt(len(returns)) if np.std(returns) > 0 else 0
-    )
+    returns = trades["return_pct"] / 100
+    capital = trades["capital"]
 
-    # Max drawdown
-    peak = initial_capital
-    max_dd = 0
-    for t in trades:
-        if t["capital"] > peak:
-            peak = t["capital"]
-        dd = (peak - t["capital"]) / peak
-        max_dd = max(max_dd, dd)
+    mean_return = returns.mean()
+    std_return = returns.std()
+    win_rate = np.count_nonzero(returns > 0) / num_trades * 100
+    avg_return = mean_return * 100
+    sharpe = (mean_return / std_return) * math.sqrt(num_trades) if std_return > 0 else 0
+
+    # Max drawdown against the running peak, which starts at the initial capital
+    peaks = np.maximum.accumulate(np.concatenate(([initial_capital], capital)))[1:]
+    max_dd = ((peaks - capital) / peaks).max()
 
     return {
         "initial_capital": initial_capital,
         "final_capital": final_capital,
         "total_return_pct": total_return,
-        "total_trades": len(trades),
+        "total_trades": num_trades,
         "win_rate": win_rate,
         "avg_return": avg_return,
         "sharpe_ratio": sharpe,
@@ -556,13 +538,43 @@ def main():
         print("\nERROR: Failed to fetch required data")
         return
 
+    # Nearest bars to 9:35 entry and 10:30 exit (within 5 min window), shared by every test
+    sbit_10am = extract_10am_bars(sbit_intraday, window_minutes=5)
+
+    # The five variants are independent, so run them in parallel and report in order
+    jobs = {
+        "dump_only": (backtest_10am_dump_only, (sbit_10am,), {}),
+        "mr_only": (backtest_mean_reversion, (ibit_daily, bitu_daily, btc_overnight), {}),
+        "with_dump": (
+            backtest_combined,
+            (ibit_daily, bitu_daily, sbit_10am, btc_overnight),
+            {"include_10am_dump": True},
+        ),
+        "without_dump": (
+            backtest_combined,
+            (ibit_daily, bitu_daily, sbit_10am, btc_overnight),
+            {"include_10am_dump": False},
+        ),
+        "mr_priority": (
+            backtest_combined_mr_priority,
+            (ibit_daily, bitu_daily, sbit_10am, btc_overnight),
+            {},
+        ),
+    }
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+        futures = {
+            key: executor.submit(func, *args, **kwargs)
+            for key, (func, args, kwargs) in jobs.items()
+        }
+        results = {key: future.result() for key, future in futures.items()}
+
     print("\n" + "=" * 70)
     print("RESULTS")
     print("=" * 70)
 
     # Test 1: 10 AM Dump ONLY
     print("\n--- 10 AM Dump Strategy ONLY ---")
-    dump_only = backtest_10am_dump_only(sbit_intraday)
+    dump_only = results["dump_only"]
     print(f"Total Return:    {dump_only['total_return_pct']:+.2f}%")
     print(f"Total Trades:    {dump_only['total_trades']}")
     print(f"Win Rate:        {dump_only['win_rate']:.1f}%")
@@ -572,7 +584,7 @@ def main():
 
     # Test 2: Mean Reversion ONLY (with BTC filter)
     print("\n--- Mean Reversion Strategy ONLY (with BTC filter) ---")
-    mr_only = backtest_mean_reversion(ibit_daily, bitu_daily, btc_overnight)
+    mr_only = results["mr_only"]
     print(f"Total Return:    {mr_only['total_return_pct']:+.2f}%")
     print(f"Total Trades:    {mr_only['total_trades']}")
     print(f"Win Rate:        {mr_only['win_rate']:.1f}%")
@@ -583,9 +595,7 @@ def main():
 
     # Test 3: Combined WITH 10 AM Dump
     print("\n--- Combined Strategy WITH 10 AM Dump ---")
-    with_dump = backtest_combined(
-        ibit_daily, bitu_daily, sbit_intraday, btc_overnight, include_10am_dump=True
-    )
+    with_dump = results["with_dump"]
     print(f"Total Return:    {with_dump['total_return_pct']:+.2f}%")
     print(f"Total Trades:    {with_dump['total_trades']}")
     print(f"  - 10 AM Dump:  {with_dump['ten_am_dump_trades']}")
@@ -597,9 +607,7 @@ def main():
 
     # Test 4: Combined WITHOUT 10 AM Dump
     print("\n--- Combined Strategy WITHOUT 10 AM Dump ---")
-    without_dump = backtest_combined(
-        ibit_daily, bitu_daily, sbit_intraday, btc_overnight, include_10am_dump=False
-    )
+    without_dump = results["without_dump"]
     print(f"Total Return:    {without_dump['total_return_pct']:+.2f}%")
     print(f"Total Trades:    {without_dump['total_trades']}")
     print(f"  - Mean Rev:    {without_dump['mean_reversion_trades']}")
@@ -610,9 +618,7 @@ def main():
 
     # Test 5: Combined with MEAN REVERSION Priority
     print("\n--- Combined Strategy with MR PRIORITY (opposite) ---")
-    mr_priority = backtest_combined_mr_priority(
-        ibit_daily, bitu_daily, sbit_intraday, btc_overnight
-    )
+    mr_priority = results["mr_priority"]
     print(f"Total Return:    {mr_priority['total_return_pct']:+.2f}%")
     print(f"Total Trades:    {mr_priority['total_trades']}")
     print(f"  - Mean Rev:    {mr_priority['mean_reversion_trades']}")
@@ -16,6 +16,8 @@ Prerequisites:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 # Add project root to path
@@ -23,12 +25,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.etrade_client import ETradeClient  # noqa: E402
 
+# Rules used by the banners and listings
+_EQ = "=" * 60
+_DASH = "-" * 60
+_SHORT_DASH = "-" * 40
+
+
+def print_banner(title: str):
+    """Print a step banner with a single write."""
+    # Straight to sys.stdout (not fd 1) so redirected/captured output stays in order
+    sys.stdout.write(f"\n{_EQ}\n{title}\n{_EQ}\n")
+
 
 def get_credentials():
     """Get E*TRADE credentials from user or environment."""
-    print("\n" + "=" * 60)
-    print("E*TRADE API Setup")
-    print("=" * 60)
+    print_banner("E*TRADE API Setup")
 
     # Check environment variables first
     consumer_key = os.environ.get("ETRADE_CONSUMER_KEY", "")
@@ -40,9 +51,10 @@ def get_credentials():
         if use_env != "n":
             return consumer_key, consumer_secret
 
-    print("\nEnter your E*TRADE API credentials:")
-    print("(Get them from https://developer.etrade.com/getting-started)")
-    print()
+    print(
+        "\nEnter your E*TRADE API credentials:\n"
+        "(Get them from https://developer.etrade.com/getting-started)\n"
+    )
 
     consumer_key = input("Consumer Key: ").strip()
     consumer_secret = input("Consumer Secret: ").strip()
@@ -52,20 +64,20 @@ def get_credentials():
         sys.exit(1)
 
     # Offer to save to environment
-    print("\n" + "-" * 40)
-    print("To save credentials permanently, add these to your ~/.zshrc or ~/.bashrc:")
-    print(f'  export ETRADE_CONSUMER_KEY="{consumer_key}"')
-    print(f'  export ETRADE_CONSUMER_SECRET="{consumer_secret}"')
-    print("-" * 40)
+    print(
+        f"\n{_SHORT_DASH}\n"
+        "To save credentials permanently, add these to your ~/.zshrc or ~/.bashrc:\n"
+        f'  export ETRADE_CONSUMER_KEY="{consumer_key}"\n'
+        f'  export ETRADE_CONSUMER_SECRET="{consumer_secret}"\n'
+        f"{_SHORT_DASH}"
+    )
 
     return consumer_key, consumer_secret
 
 
 def authenticate(consumer_key: str, consumer_secret: str, sandbox: bool = False):
     """Authenticate with E*TRADE."""
-    print("\n" + "=" * 60)
-    print("Step 2: OAuth Authentication")
-    print("=" * 60)
+    print_banner("Step 2: OAuth Authentication")
 
     env = "SANDBOX" if sandbox else "PRODUCTION"
     print(f"\nConnecting to E*TRADE {env} environment...")
@@ -76,15 +88,14 @@ def authenticate(consumer_key: str, consumer_secret: str, sandbox: bool = False)
         sandbox=sandbox,
     )
 
-    # Check if we have saved tokens
-    if client.is_authenticated():
-        print("\nFound saved OAuth tokens. Testing connection...")
-        try:
-            accounts = client.list_accounts()
-            print(f"Success! Found {len(accounts)} account(s).")
-            return client
-        except Exception as e:
-            print(f"Saved tokens expired. Re-authenticating... ({e})")
+    # Check if we have saved tokens. Tokens past their midnight ET expiry are
+    # known dead without a round-trip; otherwise is_authenticated() makes the one
+    # live call needed (it lists accounts itself, so no second probe is needed)
+    if client.access_token and client.tokens_expired():
+        print("\nSaved OAuth tokens have expired. Re-authenticating...")
+    elif client.is_authenticated():
+        print("\nFound saved OAuth tokens. Connection verified.")
+        return client
 
     # Perform OAuth flow
     success = client.authenticate()
@@ -97,9 +108,7 @@ def authenticate(consumer_key: str, consumer_secret: str, sandbox: bool = False)
 
 def select_account(client: ETradeClient):
     """Select trading account."""
-    print("\n" + "=" * 60)
-    print("Step 3: Select Trading Account")
-    print("=" * 60)
+    print_banner("Step 3: Select Trading Account")
 
     accounts = client.list_accounts()
 
@@ -107,19 +116,19 @@ def select_account(client: ETradeClient):
         print("\nNo accounts found!")
         sys.exit(1)
 
-    print("\nAvailable accounts:")
-    print("-" * 60)
-
+    # Build the whole listing first and write it with a single print
+    lines = ["\nAvailable accounts:", _DASH]
     for i, acct in enumerate(accounts, 1):
-        acct_id = acct.get("accountId", "N/A")
-        acct_key = acct.get("accountIdKey", "N/A")
-        acct_type = acct.get("accountType", "Unknown")
-        acct_desc = acct.get("accountDesc", "")
-
-        print(f"  [{i}] {acct_id} - {acct_type}")
-        print(f"      Description: {acct_desc}")
-        print(f"      Account Key: {acct_key}")
-        print()
+        get = acct.get
+        lines.extend(
+            (
+                f"  [{i}] {get('accountId', 'N/A')} - {get('accountType', 'Unknown')}",
+                f"      Description: {get('accountDesc', '')}",
+                f"      Account Key: {get('accountIdKey', 'N/A')}",
+                "",
+            )
+        )
+    print("\n".join(lines))
 
     selection = input(f"Select account [1-{len(accounts)}]: ").strip()
 
@@ -139,31 +148,38 @@ def select_account(client: ETradeClient):
 
 def test_account(client: ETradeClient, account_id_key: str):
     """Test account access and show balance."""
-    print("\n" + "=" * 60)
-    print("Step 4: Test Account Access")
-    print("=" * 60)
+    print_banner("Step 4: Test Account Access")
 
     try:
+        # The three requests are independent, so issue them together; results are
+        # still reported in order, and the first failure ends the test as before
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            cash_future = executor.submit(client.get_cash_available, account_id_key)
+            positions_future = executor.submit(client.get_account_positions, account_id_key)
+            quote_future = executor.submit(client.get_ibit_quote)
+
         # Get balance
-        cash = client.get_cash_available(account_id_key)
+        cash = cash_future.result()
         print(f"\nCash available for trading: ${cash:,.2f}")
 
         # Get positions
-        positions = client.get_account_positions(account_id_key)
+        positions = positions_future.result()
         if positions:
-            print(f"\nCurrent positions: {len(positions)}")
-            for pos in positions[:5]:  # Show first 5
-                symbol = pos.get("symbolDescription", pos.get("Product", {}).get("symbol", "?"))
-                qty = pos.get("quantity", 0)
-                print(f"  - {symbol}: {qty} shares")
+            lines = [f"\nCurrent positions: {len(positions)}"]
+            for pos in islice(positions, 5):  # Show first 5
+                get = pos.get
+                symbol = get("symbolDescription", get("Product", {}).get("symbol", "?"))
+                lines.append(f"  - {symbol}: {get('quantity', 0)} shares")
+            print("\n".join(lines))
         else:
             print("\nNo open positions.")
 
         # Test quote
         print("\nTesting market data (IBIT quote)...")
-        quote = client.get_ibit_quote()
-        print(f"  IBIT Last: ${quote['last_price']:.2f}")
-        print(f"  IBIT Change: {quote['change_pct']:+.2f}%")
+        quote = quote_future.result()
+        print(
+            f"  IBIT Last: ${quote['last_price']:.2f}\n  IBIT Change: {quote['change_pct']:+.2f}%"
+        )
 
         return True
 
@@ -174,36 +190,42 @@ def test_account(client: ETradeClient, account_id_key: str):
 
 def save_setup(account_id_key: str):
     """Save setup instructions."""
-    print("\n" + "=" * 60)
-    print("Setup Complete!")
-    print("=" * 60)
-
-    print("\nTo use live trading, set these environment variables:")
-    print("-" * 60)
-    print(f'  export ETRADE_ACCOUNT_ID="{account_id_key}"')
-    print()
-    print("Then start the dashboard and switch to LIVE mode.")
-    print()
-    print("Note: OAuth tokens expire daily at midnight ET.")
-    print("      The bot will automatically renew them when running.")
+    print_banner("Setup Complete!")
+
+    print(
+        "\nTo use live trading, set these environment variables:\n"
+        f"{_DASH}\n"
+        f'  export ETRADE_ACCOUNT_ID="{account_id_key}"\n'
+        "\n"
+        "Then start the dashboard and switch to LIVE mode.\n"
+        "\n"
+        "Note: OAuth tokens expire daily at midnight ET.\n"
+        "      The bot will automatically renew them when running."
+    )
 
 
 def main():
     """Main setup flow."""
-    print("\nWelcome to the E*TRADE Trading Bot Setup!")
-    print("This will guide you through connecting your E*TRADE account.")
+    print(
+        "\nWelcome to the E*TRADE Trading Bot Setup!\n"
+        "This will guide you through connecting your E*TRADE account."
+    )
 
     # Ask about sandbox mode
-    print("\nWhich environment do you want to use?")
-    print("  [1] Production (real money)")
-    print("  [2] Sandbox (testing, no real trades)")
+    print(
+        "\nWhich environment do you want to use?\n"
+        "  [1] Production (real money)\n"
+        "  [2] Sandbox (testing, no real trades)"
+    )
 
     env_choice = input("\nSelect environment [1/2]: ").strip()
     sandbox = env_choice == "2"
 
     if sandbox:
-        print("\nUsing SANDBOX environment (no real trades).")
-        print("Note: Sandbox has limited functionality and test data.")
+        print(
+            "\nUsing SANDBOX environment (no real trades).\n"
+            "Note: Sandbox has limited functionality and test data."
+        )
     else:
         print("\nUsing PRODUCTION environment (REAL MONEY!).")
         confirm = input("Are you sure? [y/N]: ").strip().lower()
@@ -8,11 +8,12 @@ There are exactly TWO patterns needed:
 
 1. SYNC -> ASYNC: `run_async_from_sync(coro)`
    - Use when: APScheduler jobs need to call async Telegram methods
-   - Creates an isolated event loop that doesn't affect other threads
+   - Runs on a shared background event loop that doesn't affect other threads
 
 2. ASYNC -> SYNC: `await run_sync_in_executor(func, *args)`
    - Use when: Telegram async handlers need to call sync E*TRADE methods
    - Runs sync code in a thread pool to avoid blocking the event loop
+   - For repeated read-only calls, `run_sync_in_executor_cached` adds a short TTL cache
 
 IMPORTANT: Never mix these patterns. Choose based on your CURRENT context:
 - In an async function? Use run_sync_in_executor()
@@ -21,9 +22,27 @@ IMPORTANT: Never mix these patterns. Choose based on your CURRENT context:
 
 import asyncio
 import concurrent.futures
+import contextvars
+import copy
 import functools
 import logging
-from typing import Any, Callable, Coroutine, Optional, TypeVar
+import os
+import threading
+import time
+import warnings
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,17 +52,87 @@ T = TypeVar("T")
 # Shared thread pool for sync operations
 # Using module-level to ensure single instance across imports
 _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_alive = False
+_executor_lock = threading.Lock()
+
+# Sized for I/O-bound work (E*TRADE REST calls): threads mostly wait on the network
+_EXECUTOR_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Cap on calls in flight per event loop (running + queued); semaphores are loop-bound
+_MAX_PENDING_SUBMISSIONS = _EXECUTOR_MAX_WORKERS * 2
+_submit_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+_submit_lock = threading.Lock()
 
 
 def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
     """Get or create the shared thread pool executor."""
-    global _executor
-    if _executor is None or _executor._shutdown:
-        _executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=4,
-            thread_name_prefix="async_bridge",
-        )
-    return _executor
+    global _executor, _executor_alive
+    executor = _executor
+    if _executor_alive and executor is not None:
+        return executor
+    with _executor_lock:
+        # Re-check under the lock so concurrent first calls create only one pool
+        if _executor is None or not _executor_alive:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="async_bridge",
+            )
+            _executor_alive = True
+        return _executor
+
+
+def _get_submit_semaphore(loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+    """Get or create the submission semaphore for an event loop."""
+    semaphore = _submit_semaphores.get(loop)
+    if semaphore is not None:
+        return semaphore
+    with _submit_lock:
+        semaphore = _submit_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(_MAX_PENDING_SUBMISSIONS)
+            _submit_semaphores[loop] = semaphore
+        return semaphore
+
+
+# Persistent event loop for sync -> async calls, running in its own daemon thread
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_stop: Optional[asyncio.Future] = None
+_bg_thread: Optional[threading.Thread] = None
+_bg_lock = threading.Lock()
+
+
+async def _serve_until_stopped(started: concurrent.futures.Future) -> None:
+    """Publish the running loop plus a stop future, then idle until it resolves."""
+    loop = asyncio.get_running_loop()
+    stop = loop.create_future()
+    started.set_result((loop, stop))
+    await stop
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the shared background event loop."""
+    global _bg_loop, _bg_stop, _bg_thread
+    loop = _bg_loop
+    if loop is not None and not loop.is_closed():
+        return loop
+    with _bg_lock:
+        # Re-check under the lock so concurrent first calls start only one loop
+        if _bg_loop is None or _bg_loop.is_closed():
+            # asyncio.run owns the loop, so stopping it gets the stdlib teardown:
+            # leftover tasks cancelled, async generators and default executor
+            # shut down, loop closed
+            started: concurrent.futures.Future = concurrent.futures.Future()
+            _bg_thread = threading.Thread(
+                target=asyncio.run,
+                args=(_serve_until_stopped(started),),
+                name="async_bridge_loop",
+                daemon=True,
+            )
+            _bg_thread.start()
+            _bg_loop, _bg_stop = started.result()
+        return _bg_loop
 
 
 # =============================================================================
@@ -61,8 +150,10 @@ def run_async_from_sync(coro: Coroutine[Any, Any, T], timeout: float = 60.0) ->
     - Database callbacks
     - Signal handlers
 
-    Creates an isolated event loop that doesn't affect the global event loop
-    policy, preventing "Event loop is closed" errors in other threads.
+    Runs the coroutine on a single long-lived event loop in a background
+    thread, so no loop is created or torn down per call and the global event
+    loop policy is never touched, preventing "Event loop is closed" errors in
+    other threads.
 
     Args:
         coro: The coroutine to run
@@ -81,43 +172,31 @@ def run_async_from_sync(coro: Coroutine[Any, Any, T], timeout: float = 60.0) ->
             result = run_async_from_sync(telegram_bot.send_message("Hello"))
             return result
     """
-    # Check if we're accidentally being called from an async context
-    try:
-        loop = asyncio.get_running_loop()
-        if loop and not loop.is_closed():
-            # We're in an async context - this is a programming error
-            # But handle gracefully by using run_coroutine_threadsafe
-            logger.warning(
-                "run_async_from_sync called from async context - "
-                "consider using 'await' directly instead"
-            )
-            future = asyncio.run_coroutine_threadsafe(coro, loop)
-            return future.result(timeout=timeout)
-    except RuntimeError:
-        # No running loop - this is the expected case
-        pass
-
-    # Create isolated event loop
-    loop = asyncio.new_event_loop()
+    # Check if we're accidentally being called from an async context. The
+    # non-raising lookup keeps the common case (no running loop) free of a
+    # RuntimeError raise/catch on every call.
+    loop = asyncio._get_running_loop()
+    if loop is not None and not loop.is_closed():
+        # We're in an async context - this is a programming error
+        # But handle gracefully by using run_coroutine_threadsafe
+        logger.warning(
+            "run_async_from_sync called from async context - "
+            "consider using 'await' directly instead"
+        )
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        return future.result(timeout=timeout)
+
+    # Hand off to the shared background loop; wait_for enforces the timeout there
+    future = asyncio.run_coroutine_threadsafe(
+        asyncio.wait_for(coro, timeout=timeout),
+        _get_bg_loop(),
+    )
     try:
-        # Wrap with timeout
-        async def with_timeout():
-            return await asyncio.wait_for(coro, timeout=timeout)
-
-        return loop.run_until_complete(with_timeout())
-    finally:
-        # Clean shutdown
-        try:
-            # Cancel any pending tasks
-            pending = asyncio.all_tasks(loop)
-            for task in pending:
-                task.cancel()
-            if pending:
-                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-        except Exception:
-            pass  # Best effort cleanup
-        finally:
-            loop.close()
+        # Small grace period so the loop-side timeout normally fires first
+        return future.result(timeout=timeout + 1)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
 
 
 # =============================================================================
@@ -140,7 +219,10 @@ async def run_sync_in_executor(
     - Any 'async def' function
 
     Uses a persistent thread pool to avoid executor creation/shutdown issues.
-    The sync function runs completely isolated from the event loop.
+    The sync function runs completely isolated from the event loop, in a copy
+    of the caller's contextvars context. Calls
+    beyond the per-loop in-flight limit wait on the event loop instead of
+    piling up in the executor queue.
 
     Args:
         func: The synchronous function to run
@@ -174,13 +256,175 @@ async def run_sync_in_executor(
 
     executor = _get_executor()
 
-    # Create partial if we have args/kwargs
-    if args or kwargs:
-        func_to_run = functools.partial(func, *args, **kwargs)
-    else:
-        func_to_run = func
+    # Run inside a copy of the caller's context (like asyncio.to_thread) so contextvars
+    # such as logging/request IDs carry over; run_in_executor forwards positional args
+    context = contextvars.copy_context()
+    func_to_run = functools.partial(context.run, func, **kwargs)
+
+    semaphore = _get_submit_semaphore(loop)
+    if semaphore.locked() and logger.isEnabledFor(logging.DEBUG):
+        # Back-pressure: every in-flight slot is taken, so this call waits on the loop
+        logger.debug(
+            "Async bridge saturated; %s waiting for a free slot",
+            getattr(func, "__qualname__", func),
+        )
+
+    async with semaphore:
+        return await loop.run_in_executor(executor, func_to_run, *args)
+
+
+async def run_sync_in_executor_many(
+    calls: Sequence[Tuple[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]],
+) -> List[Any]:
+    """
+    Run several independent sync functions in the thread pool at once.
+
+    Every call is submitted before the first one is awaited, so fan-out reads
+    finish in roughly the time of the slowest call instead of the sum. Each call
+    goes through run_sync_in_executor(), so the in-flight limit and context
+    propagation still apply.
+
+    Args:
+        calls: (func, args, kwargs) tuples
+
+    Returns:
+        Results in the same order as calls
+
+    Raises:
+        The first exception raised by any of the functions
+
+    Example:
+        balance, positions = await run_sync_in_executor_many(
+            [
+                (client.get_cash_available, (account_id,), {}),
+                (client.get_account_positions, (account_id,), {}),
+            ]
+        )
+    """
+    return list(
+        await asyncio.gather(
+            *(run_sync_in_executor(func, *args, **kwargs) for func, args, kwargs in calls)
+        )
+    )
+
+
+class _TTLCache:
+    """Thread-safe in-process cache whose entries expire after a fixed number of seconds."""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
 
-    return await loop.run_in_executor(executor, func_to_run)
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value); expired entries count as misses and are dropped."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return False, None
+            return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# One cache per bound object (client, bot, ...), dropped together with the object so a
+# new instance can never be served another one's results; plain functions share one
+_sync_caches: "weakref.WeakKeyDictionary[Any, _TTLCache]" = weakref.WeakKeyDictionary()
+_function_cache = _TTLCache()
+_sync_caches_lock = threading.Lock()
+
+# Only read-only calls are cached; anything else (orders, auth, ...) always runs
+_CACHEABLE_PREFIXES = ("get_", "list_")
+
+
+def _cache_for(owner: Any) -> _TTLCache:
+    """The TTL cache for calls bound to owner (None for plain functions)."""
+    if owner is None:
+        return _function_cache
+    with _sync_caches_lock:
+        cache = _sync_caches.get(owner)
+        if cache is None:
+            cache = _sync_caches[owner] = _TTLCache()
+        return cache
+
+
+def _is_auth_failure(error: Exception) -> bool:
+    """Whether error means the E*TRADE session is no longer valid."""
+    from .etrade_client import ETradeAuthError
+
+    if isinstance(error, ETradeAuthError):
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 401
+
+
+async def run_sync_in_executor_cached(
+    func: Callable[..., T],
+    *args: Any,
+    ttl: float = 30.0,
+    **kwargs: Any,
+) -> T:
+    """
+    Like run_sync_in_executor(), but reuse results of read-only calls for ttl seconds.
+
+    Meant for E*TRADE reads (balances, positions, quotes) that several Telegram
+    commands issue in quick succession: within the TTL window the HTTP round-trip
+    and thread hop are skipped entirely. Results are cached per bound object and
+    keyed on the function and its arguments, so different clients/accounts never
+    share entries. Every caller gets its own deep copy of the result, so mutating
+    it never changes what later callers see.
+
+    Only functions whose name starts with get_ or list_ are cached; any other call,
+    or one whose arguments or bound object can't be used as a key, is passed
+    straight through. An authentication failure clears the whole cache so stale
+    data from an expired session is never served.
+
+    Example:
+        portfolio = await run_sync_in_executor_cached(trading_bot.get_portfolio_value)
+    """
+    if not func.__name__.startswith(_CACHEABLE_PREFIXES):
+        return await run_sync_in_executor(func, *args, **kwargs)
+
+    key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+        cache = _cache_for(getattr(func, "__self__", None))
+    except TypeError:
+        # Unhashable arguments (lists, dicts, ...) or an owner that can't be weakly
+        # referenced can't be keyed; just make the call
+        return await run_sync_in_executor(func, *args, **kwargs)
+
+    hit, value = cache.get(key)
+    if hit:
+        return copy.deepcopy(value)
+
+    try:
+        value = await run_sync_in_executor(func, *args, **kwargs)
+    except Exception as e:
+        if _is_auth_failure(e):
+            clear_sync_cache()
+        raise
+
+    cache.set(key, value, ttl)
+    return copy.deepcopy(value)
+
+
+def clear_sync_cache() -> None:
+    """Drop every cached result; TradingBot calls this after every order it places."""
+    _function_cache.clear()
+    with _sync_caches_lock:
+        caches = list(_sync_caches.values())
+    for cache in caches:
+        cache.clear()
 
 
 # =============================================================================
@@ -190,19 +434,33 @@ async def run_sync_in_executor(
 
 def shutdown_executor(wait: bool = True) -> None:
     """
-    Shutdown the shared thread pool executor.
+    Shutdown the shared thread pool executor and background event loop.
 
     Call this during application shutdown for clean exit.
 
     Args:
         wait: If True, wait for pending tasks to complete
     """
-    global _executor
-    if _executor is not None:
-        _executor.shutdown(wait=wait)
+    global _executor, _executor_alive, _bg_loop, _bg_stop, _bg_thread
+    with _executor_lock:
+        executor = _executor
+        _executor_alive = False
         _executor = None
+    if executor is not None:
+        executor.shutdown(wait=wait)
         logger.info("Async bridge executor shut down")
 
+    with _bg_lock:
+        loop, stop, thread = _bg_loop, _bg_stop, _bg_thread
+        _bg_loop = _bg_stop = _bg_thread = None
+
+    if loop is not None and not loop.is_closed():
+        # Resolving the stop future ends asyncio.run, which cleans up and closes the loop
+        loop.call_soon_threadsafe(stop.set_result, None)
+        if wait and thread is not None:
+            thread.join()
+        logger.info("Async bridge event loop stopped")
+
 
 # =============================================================================
 # DEPRECATED - Keep for backward compatibility but log warnings
@@ -215,8 +473,10 @@ def run_async(coro: Coroutine) -> Any:
 
     This function is kept for backward compatibility but will be removed.
     """
-    logger.warning(
+    # warnings dedupes by call site, so each caller is reported once rather than per call
+    warnings.warn(
         "run_async() is deprecated, use run_async_from_sync() instead",
+        DeprecationWarning,
         stacklevel=2,
     )
     return run_async_from_sync(coro)
@@ -3,19 +3,64 @@ Backtesting module for IBIT Dip Bot.
 Validates strategy performance using historical IBIT data.
 """
 
+import copy
+import hashlib
 import logging
-from dataclasses import dataclass, field
+import os
+import time
+from dataclasses import dataclass, field, fields, replace
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
 
-from .utils import is_market_holiday
+from .utils import MARKET_HOLIDAYS, calculate_dip_percentages
 
 logger = logging.getLogger(__name__)
 
+# Day names indexed by weekday (Monday = 0)
+_DAY_NAMES = np.array(
+    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"], dtype=object
+)
+
+# Local copies of Yahoo downloads, keyed by symbol and date range. Unlike the scripts'
+# caches this lives outside the source tree, since the package may be installed read-only
+_YAHOO_CACHE_DIR = (
+    Path(os.environ.get("BTRADE_CACHE_DIR", Path.home() / ".cache" / "btrade")) / "backtester"
+)
+_YAHOO_CACHE_TTL_SECONDS = 15 * 60
+
+# Weekdays minus market holidays, for np.is_busday
+_MARKET_CALENDAR = np.busdaycalendar(
+    holidays=np.array(sorted(MARKET_HOLIDAYS), dtype="datetime64[D]")
+)
+
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+# Loaded prices are stored as float32; the simulation widens them back to float64
+_PRICE_DTYPES = {column: np.float32 for column in _PRICE_COLUMNS}
+
+# Most BacktestResults kept by a Backtester for repeated runs
+_RUN_CACHE_SIZE = 64
+# Columns read from CSV price files (matched case-insensitively)
+_CSV_COLUMNS = frozenset(("date", "datetime", "volume") + _PRICE_COLUMNS)
+
+
+def _calendar_days(values: pd.Series) -> pd.Series:
+    """
+    Parse a date/datetime column to naive midnight timestamps.
+
+    Each value keeps the calendar day of its own timezone. Text that read_csv
+    could not parse (e.g. mixed UTC offsets) is passed to to_datetime, which
+    reports the problem.
+    """
+    timestamps = values if is_datetime64_any_dtype(values) else pd.to_datetime(values)
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+    return timestamps.dt.normalize()
+
 
 @dataclass
 class BacktestConfig:
@@ -49,6 +94,20 @@ class BacktestConfig:
 class BacktestTrade:
     """Record of a single backtest trade."""
 
+    # Explicit slots (dataclass(slots=True) needs Python 3.10) drop the per-instance __dict__
+    __slots__ = (
+        "date",
+        "day_of_week",
+        "open_price",
+        "entry_price",
+        "exit_price",
+        "dip_percentage",
+        "shares",
+        "dollar_pnl",
+        "percentage_pnl",
+        "cumulative_pnl",
+    )
+
     date: date
     day_of_week: str
     open_price: float
@@ -61,12 +120,68 @@ class BacktestTrade:
     cumulative_pnl: float
 
 
+@dataclass(eq=False)
+class TradeArrays:
+    """
+    Backtest trades stored as parallel arrays (structure of arrays).
+
+    Indexing or iterating yields BacktestTrade rows, built on demand.
+    """
+
+    date: np.ndarray  # datetime.date objects
+    day_of_week: np.ndarray  # day names
+    open_price: np.ndarray
+    entry_price: np.ndarray
+    exit_price: np.ndarray
+    dip_percentage: np.ndarray
+    shares: np.ndarray  # int32
+    dollar_pnl: np.ndarray
+    percentage_pnl: np.ndarray
+    cumulative_pnl: np.ndarray
+
+    @classmethod
+    def from_trades(cls, trades: Sequence[BacktestTrade]) -> "TradeArrays":
+        """Pack BacktestTrade rows into columns."""
+        n = len(trades)
+
+        def column(attr: str, dtype) -> np.ndarray:
+            return np.fromiter((getattr(t, attr) for t in trades), dtype=dtype, count=n)
+
+        return cls(
+            date=column("date", object),
+            day_of_week=column("day_of_week", object),
+            open_price=column("open_price", np.float64),
+            entry_price=column("entry_price", np.float64),
+            exit_price=column("exit_price", np.float64),
+            dip_percentage=column("dip_percentage", np.float64),
+            shares=column("shares", np.int32),
+            dollar_pnl=column("dollar_pnl", np.float64),
+            percentage_pnl=column("percentage_pnl", np.float64),
+            cumulative_pnl=column("cumulative_pnl", np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def __iter__(self) -> Iterator[BacktestTrade]:
+        columns = (getattr(self, f.name).tolist() for f in fields(self))
+        return (BacktestTrade(*row) for row in zip(*columns))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[BacktestTrade, "TradeArrays"]:
+        if isinstance(index, slice):
+            return TradeArrays(*(getattr(self, f.name)[index] for f in fields(self)))
+        values = (getattr(self, f.name)[index] for f in fields(self))
+        # NumPy scalars become plain int/float; object columns already hold Python values
+        return BacktestTrade(*(v.item() if isinstance(v, np.generic) else v for v in values))
+
+
 @dataclass
 class BacktestResult:
     """Results from a backtest run."""
 
     config: BacktestConfig
-    trades: List[BacktestTrade]
+    # A list of BacktestTrade rows is packed into TradeArrays on construction
+    trades: Union[TradeArrays, List[BacktestTrade]]
 
     # Summary statistics
     total_trades: int = 0
@@ -91,6 +206,8 @@ class BacktestResult:
     daily_returns: List[float] = field(default_factory=list)
 
     def __post_init__(self):
+        if not isinstance(self.trades, TradeArrays):
+            self.trades = TradeArrays.from_trades(self.trades)
         if self.trades:
             self._calculate_statistics()
 
@@ -99,78 +216,78 @@ class BacktestResult:
         if not self.trades:
             return
 
-        self.total_trades = len(self.trades)
-        self.winning_trades = sum(1 for t in self.trades if t.percentage_pnl > 0)
+        returns = self.trades.percentage_pnl
+        n = len(returns)
+
+        self.total_trades = n
+        self.winning_trades = int(np.count_nonzero(returns > 0))
         self.losing_trades = self.total_trades - self.winning_trades
         self.win_rate = (
             (self.winning_trades / self.total_trades * 100) if self.total_trades > 0 else 0
         )
 
         # Returns
-        self.total_return = sum(t.dollar_pnl for t in self.trades)
+        self.total_return = float(self.trades.dollar_pnl.sum())
         self.total_return_pct = (
             (self.total_return / self.config.initial_capital * 100)
             if self.config.initial_capital > 0
             else 0
         )
-        self.avg_return_pct = np.mean([t.percentage_pnl for t in self.trades]) if self.trades else 0
+
+        # Mean and (population) std share one mean instead of np.mean/np.std recomputing it
+        mean = returns.sum() / n
+        deviation = returns - mean
+        std = np.sqrt((deviation * deviation).sum() / n)
+        self.avg_return_pct = mean
 
         # Best/worst
-        returns = [t.percentage_pnl for t in self.trades]
-        self.best_trade_pct = max(returns) if returns else 0
-        self.worst_trade_pct = min(returns) if returns else 0
+        self.best_trade_pct = returns.max()
+        self.worst_trade_pct = returns.min()
 
         # Max drawdown
         self.max_drawdown_pct = self._calculate_max_drawdown()
 
         # Sharpe ratio (annualized)
-        self.daily_returns = returns
-        if len(returns) > 1:
-            returns_array = np.array(returns)
-            if returns_array.std() > 0:
-                # Assume ~250 trading days per year
-                self.sharpe_ratio = (returns_array.mean() / returns_array.std()) * np.sqrt(250)
+        self.daily_returns = returns.tolist()
+        if n > 1 and std > 0:
+            # Assume ~250 trading days per year
+            self.sharpe_ratio = (mean / std) * np.sqrt(250)
 
     def _calculate_max_drawdown(self) -> float:
         """Calculate maximum drawdown from peak."""
         if not self.trades:
             return 0.0
 
-        cumulative = [t.cumulative_pnl for t in self.trades]
-        peak = cumulative[0]
-        max_dd = 0.0
+        cumulative = self.trades.cumulative_pnl
+        peaks = np.maximum.accumulate(cumulative)
 
-        for value in cumulative:
-            if value > peak:
-                peak = value
-            drawdown = (
-                (peak - value) / (self.config.initial_capital + peak) * 100 if peak > 0 else 0
-            )
-            max_dd = max(max_dd, drawdown)
+        # Drawdown is only measured once the running peak is in profit
+        in_profit = peaks > 0
+        base = np.where(in_profit, self.config.initial_capital + peaks, 1.0)
+        drawdowns = np.where(in_profit, (peaks - cumulative) / base * 100, 0.0)
 
-        return max_dd
+        return float(drawdowns.max(initial=0.0))
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert trades to DataFrame."""
         if not self.trades:
             return pd.DataFrame()
 
+        trades = self.trades
         return pd.DataFrame(
-            [
-                {
-                    "date": t.date,
-                    "day_of_week": t.day_of_week,
-                    "open_price": t.open_price,
-                    "entry_price": t.entry_price,
-                    "exit_price": t.exit_price,
-                    "dip_pct": t.dip_percentage,
-                    "shares": t.shares,
-                    "dollar_pnl": t.dollar_pnl,
-                    "pct_pnl": t.percentage_pnl,
-                    "cumulative_pnl": t.cumulative_pnl,
-                }
-                for t in self.trades
-            ]
+            {
+                "date": trades.date,
+                "day_of_week": trades.day_of_week,
+                "open_price": trades.open_price,
+                "entry_price": trades.entry_price,
+                "exit_price": trades.exit_price,
+                "dip_pct": trades.dip_percentage,
+                "shares": trades.shares,
+                "dollar_pnl": trades.dollar_pnl,
+                "pct_pnl": trades.percentage_pnl,
+                "cumulative_pnl": trades.cumulative_pnl,
+            },
+            copy=False,
         )
 
     def summary(self) -> str:
@@ -198,6 +315,116 @@ Strategy vs B&H: {self.total_return_pct - self.buy_hold_return_pct:+.1f}%
 """
 
 
+def _copy_result(result: BacktestResult) -> BacktestResult:
+    """Copy of a cached result that shares only its read-only trade columns."""
+    result = copy.copy(result)
+    result.config = replace(result.config)
+    result.trades = copy.copy(result.trades)
+    result.daily_returns = list(result.daily_returns)
+    return result
+
+
+@dataclass(frozen=True)
+class _PriceArrays:
+    """Threshold-independent arrays prepared once per data set."""
+
+    dates: np.ndarray  # datetime64[D]
+    open_prices: np.ndarray
+    close_prices: np.ndarray
+    weekdays: np.ndarray  # Monday = 0
+    trading_days: np.ndarray  # False on weekends and holidays
+    max_dips: np.ndarray  # open-to-low dip %
+    buy_hold_return_pct: float
+    data_key: str  # content hash of the dates and prices
+
+
+def _simulate(
+    prices: _PriceArrays, config: BacktestConfig, regular_thresholds: List[float]
+) -> Tuple[np.ndarray, TradeArrays]:
+    """
+    Simulate the dip strategy over prepared daily price arrays.
+
+    All regular thresholds are simulated together: each one is a row of a
+    (thresholds x days) trigger matrix, so a sweep costs one pass of array ops.
+
+    Args:
+        prices: Prepared price, weekday and trading-day arrays
+        config: Strategy parameters
+        regular_thresholds: Dip thresholds for non-Monday trades, one simulation each
+
+    Returns:
+        Tuple of (offsets, trades): the trades of every threshold in one set of
+        columns, threshold i owning trades[offsets[i]:offsets[i + 1]]
+    """
+    # Skip Monday if disabled; every filter that doesn't depend on the threshold is one mask
+    is_monday = prices.weekdays == 0
+    valid = prices.trading_days
+    if not config.monday_enabled:
+        valid = valid & ~is_monday
+    candidates = np.flatnonzero(valid)
+
+    # Use the Monday threshold on Mondays, one row of thresholds per sweep
+    thresholds = np.where(
+        is_monday[candidates],
+        config.monday_threshold,
+        np.asarray(regular_thresholds, dtype=np.float64)[:, np.newaxis],
+    )
+
+    # Did the MAXIMUM dip that day (open to low) reach the threshold?
+    sweeps, hits = np.nonzero(prices.max_dips[candidates] >= thresholds)
+    rows = candidates[hits]
+
+    # A dip occurred! Estimate our entry price.
+    # Strategy: We're watching at 10:00-10:59 AM, buy when we see >= threshold dip
+    # Realistically, we'd enter near the threshold level, not at the absolute low
+    # Entry estimate: Open price minus the threshold amount (we bought when threshold was hit)
+    # The dip we captured is approximately the threshold (what triggered our buy)
+    dip_pcts = thresholds[sweeps, hits]
+    entry_prices = prices.open_prices[rows] * (1 - dip_pcts / 100)
+
+    # Apply slippage
+    entry_prices = entry_prices * (1 + config.slippage_pct / 100)
+
+    # Calculate position size, dropping days we can't afford any shares
+    position_value = config.initial_capital * (config.max_position_pct / 100)
+    shares = np.floor_divide(position_value, entry_prices).astype(np.int32)
+    affordable = shares > 0
+    sweeps = sweeps[affordable]
+    rows = rows[affordable]
+    dip_pcts = dip_pcts[affordable]
+    entry_prices = entry_prices[affordable]
+    shares = shares[affordable]
+
+    # Exit at close
+    exit_prices = prices.close_prices[rows] * (1 - config.slippage_pct / 100)
+
+    # Calculate P&L
+    dollar_pnl = (exit_prices - entry_prices) * shares
+    dollar_pnl -= config.commission * 2  # Entry + exit commission
+    pct_pnl = ((exit_prices - entry_prices) / entry_prices) * 100
+
+    # Trades come out grouped by threshold, in date order within each group.
+    # Cumulative P&L restarts for each threshold but shares one output buffer
+    offsets = np.searchsorted(sweeps, np.arange(len(regular_thresholds) + 1))
+    cumulative_pnl = np.empty_like(dollar_pnl)
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        np.cumsum(dollar_pnl[start:stop], out=cumulative_pnl[start:stop])
+
+    trades = TradeArrays(
+        date=prices.dates[rows].astype(object),
+        day_of_week=_DAY_NAMES[prices.weekdays[rows]],
+        open_price=prices.open_prices[rows],
+        entry_price=entry_prices,
+        exit_price=exit_prices,
+        dip_percentage=dip_pcts,
+        shares=shares,
+        dollar_pnl=dollar_pnl,
+        percentage_pnl=pct_pnl,
+        cumulative_pnl=cumulative_pnl,
+    )
+    return offsets, trades
+
+
 class Backtester:
     """
     Backtesting engine for IBIT dip strategy.
@@ -209,6 +436,15 @@ class Backtester:
         """Initialize backtester."""
         self.config = config or BacktestConfig()
         self._data: Optional[pd.DataFrame] = None
+        # (data frame, arrays prepared from it)
+        self._prepared: Optional[Tuple[pd.DataFrame, _PriceArrays]] = None
+        # (data hash, config values) -> result of an earlier run
+        self._run_cache: Dict[Tuple, BacktestResult] = {}
+
+    def clear_cache(self):
+        """Forget prepared data and cached results, e.g. after editing the data in place."""
+        self._prepared = None
+        self._run_cache.clear()
 
     def load_data(self, source: str = "yahoo") -> pd.DataFrame:
         """
@@ -230,14 +466,26 @@ class Backtester:
         return self._data
 
     def _load_yahoo_data(self) -> pd.DataFrame:
-        """Load data from Yahoo Finance."""
+        """Load data from Yahoo Finance, reusing a local copy of an earlier download."""
+        # Plain dates, so a datetime in the config can't change the key or the comparison below
+        start = pd.Timestamp(self.config.start_date).date()
+        end = pd.Timestamp(self.config.end_date).date()
+        cache_path = _YAHOO_CACHE_DIR / f"IBIT_{start}_{end}.pkl"
+        if cache_path.exists():
+            # Closed ranges never change; ranges that include today go stale
+            age = time.time() - cache_path.stat().st_mtime
+            if end < date.today() or age < _YAHOO_CACHE_TTL_SECONDS:
+                df = pd.read_pickle(cache_path)
+                logger.info(f"Loaded {len(df)} days of cached Yahoo Finance data")
+                return df
+
         try:
             import yfinance as yf
 
             ticker = yf.Ticker("IBIT")
             df = ticker.history(
-                start=self.config.start_date,
-                end=self.config.end_date + timedelta(days=1),
+                start=start,
+                end=end + timedelta(days=1),
                 interval="1d",
             )
 
@@ -246,7 +494,17 @@ class Backtester:
 
             df = df.reset_index()
             df.columns = [c.lower() for c in df.columns]
-            df["date"] = pd.to_datetime(df["date"]).dt.date
+            df["date"] = _calendar_days(df["date"])
+
+            # Drop the dividend/split columns Yahoo adds; the backtest never reads them
+            df = df[["date", *_PRICE_COLUMNS, "volume"]].astype(_PRICE_DTYPES)
+
+            # The cache is only an optimisation; a read-only or full disk mustn't fail the load
+            try:
+                _YAHOO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                df.to_pickle(cache_path)
+            except OSError as e:
+                logger.warning(f"Could not cache Yahoo Finance data: {e}")
 
             logger.info(f"Loaded {len(df)} days of data from Yahoo Finance")
             return df
@@ -258,17 +516,28 @@ class Backtester:
 
     def _load_csv_data(self, path: str) -> pd.DataFrame:
         """Load data from CSV file."""
-        df = pd.read_csv(path)
+        # Match the wanted columns case-insensitively, then parse only those in one read
+        header = pd.read_csv(path, nrows=0).columns
+        names = {c.lower(): c for c in header if c.lower() in _CSV_COLUMNS}
+        date_column = names.get("date") or names.get("datetime")
+        if date_column is None:
+            raise ValueError(f"No date or datetime column in {path}")
+
+        df = pd.read_csv(
+            path,
+            usecols=list(names.values()),
+            dtype={names[c]: _PRICE_DTYPES[c] for c in _PRICE_COLUMNS if c in names},
+            parse_dates=[date_column],
+        )
         df.columns = [c.lower() for c in df.columns]
 
-        # Parse date column
-        if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"]).dt.date
-        elif "datetime" in df.columns:
-            df["date"] = pd.to_datetime(df["datetime"]).dt.date
+        days = _calendar_days(df[date_column.lower()])
 
         # Filter to date range
-        df = df[(df["date"] >= self.config.start_date) & (df["date"] <= self.config.end_date)]
+        in_range = days.between(
+            pd.Timestamp(self.config.start_date), pd.Timestamp(self.config.end_date)
+        )
+        df = df[in_range].assign(date=days[in_range])
 
         logger.info(f"Loaded {len(df)} days of data from {path}")
         return df
@@ -288,101 +557,95 @@ class Backtester:
         elif self._data is None:
             self.load_data()
 
-        trades = []
-        capital = self.config.initial_capital
-        cumulative_pnl = 0.0
-
-        # Get first and last prices for buy & hold comparison
-        first_price = None
-        last_price = None
-
-        for _, row in self._data.iterrows():
-            trade_date = row["date"]
-
-            # Skip weekends and holidays
-            if trade_date.weekday() >= 5 or is_market_holiday(trade_date):
-                continue
-
-            open_price = row["open"]
-            _high_price = row["high"]  # noqa: F841 - reserved for future use
-            low_price = row["low"]
-            close_price = row["close"]
-
-            # Track first/last for buy & hold
-            if first_price is None:
-                first_price = open_price
-            last_price = close_price
+        return self._simulate_thresholds(self._prepare_arrays(), [self.config.regular_threshold])[0]
 
-            # Determine day of week
-            day_of_week = trade_date.strftime("%A")
-            is_monday = trade_date.weekday() == 0
+    def _prepare_arrays(self) -> _PriceArrays:
+        """Build the threshold-independent arrays for the current data, memoized per frame."""
+        if self._prepared is not None and self._prepared[0] is self._data:
+            return self._prepared[1]
 
-            # Skip Monday if disabled
-            if is_monday and not self.config.monday_enabled:
-                continue
+        # Dates stay datetime64; only the traded days become datetime.date objects
+        days = _calendar_days(self._data["date"])
+        dates = days.to_numpy(dtype="datetime64[D]")
+        open_prices = self._data["open"].to_numpy(dtype=np.float64)
+        close_prices = self._data["close"].to_numpy(dtype=np.float64)
 
-            # Get appropriate threshold
-            threshold = self.config.monday_threshold if is_monday else self.config.regular_threshold
+        # Skip weekends and holidays
+        weekdays = days.dt.weekday.to_numpy(dtype=np.int8)
+        trading_days = np.is_busday(dates, busdaycal=_MARKET_CALENDAR)
 
-            # Calculate the MAXIMUM dip that occurred during the day (open to low)
-            # This tells us if a dip opportunity existed
-            max_dip_pct = ((open_price - low_price) / open_price) * 100 if open_price > 0 else 0
+        # First/last trading day prices for buy & hold
+        trading_rows = np.flatnonzero(trading_days)
+        first_price = open_prices[trading_rows[0]] if trading_rows.size else None
+        last_price = close_prices[trading_rows[-1]] if trading_rows.size else None
 
-            # Check if the max dip meets threshold (did the opportunity exist?)
-            if max_dip_pct < threshold:
-                continue  # No dip opportunity that day
-
-            # A dip occurred! Estimate our entry price.
-            # Strategy: We're watching at 10:00-10:59 AM, buy when we see >= threshold dip
-            # Realistically, we'd enter near the threshold level, not at the absolute low
-            # Entry estimate: Open price minus the threshold amount (we bought when threshold was hit)
-            entry_price = open_price * (1 - threshold / 100)
-
-            # The dip we captured is approximately the threshold (what triggered our buy)
-            dip_pct = threshold
-
-            # Apply slippage
-            entry_price_with_slippage = entry_price * (1 + self.config.slippage_pct / 100)
-
-            # Calculate position size
-            position_value = capital * (self.config.max_position_pct / 100)
-            shares = int(position_value // entry_price_with_slippage)
-
-            if shares <= 0:
-                continue  # Can't afford any shares
-
-            # Exit at close
-            exit_price = close_price * (1 - self.config.slippage_pct / 100)
-
-            # Calculate P&L
-            dollar_pnl = (exit_price - entry_price_with_slippage) * shares
-            dollar_pnl -= self.config.commission * 2  # Entry + exit commission
-
-            pct_pnl = ((exit_price - entry_price_with_slippage) / entry_price_with_slippage) * 100
-
-            cumulative_pnl += dollar_pnl
-
-            trade = BacktestTrade(
-                date=trade_date,
-                day_of_week=day_of_week,
-                open_price=open_price,
-                entry_price=entry_price_with_slippage,
-                exit_price=exit_price,
-                dip_percentage=dip_pct,
-                shares=shares,
-                dollar_pnl=dollar_pnl,
-                percentage_pnl=pct_pnl,
-                cumulative_pnl=cumulative_pnl,
-            )
-            trades.append(trade)
-
-        # Calculate buy & hold return
         buy_hold_return_pct = 0.0
         if first_price and last_price and first_price > 0:
             buy_hold_return_pct = ((last_price - first_price) / first_price) * 100
 
-        result = BacktestResult(config=self.config, trades=trades)
-        result.buy_hold_return_pct = buy_hold_return_pct
+        # Results are cached by content, so equal data loaded twice shares them
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(dates.tobytes())
+        digest.update(self._data[list(_PRICE_COLUMNS)].to_numpy(dtype=np.float64).tobytes())
+        data_key = digest.hexdigest()
+
+        prices = _PriceArrays(
+            dates=dates,
+            open_prices=open_prices,
+            close_prices=close_prices,
+            weekdays=weekdays,
+            trading_days=trading_days,
+            max_dips=calculate_dip_percentages(open_prices, self._data["low"]),
+            buy_hold_return_pct=buy_hold_return_pct,
+            data_key=data_key,
+        )
+        self._prepared = (self._data, prices)
+        return prices
+
+    def _simulate_thresholds(
+        self, prices: _PriceArrays, regular_thresholds: List[float]
+    ) -> List[BacktestResult]:
+        """Run the simulation on prepared arrays for each threshold and collect the results."""
+        keys = self._run_keys(prices, regular_thresholds)
+        results = {t: self._run_cache[key] for t, key in keys.items() if key in self._run_cache}
+
+        # Simulate the thresholds without a cached result in one pass. Each result
+        # gets a read-only slice of the sweep's trade columns rather than its own copy
+        missing = [t for t in keys if t not in results]
+        if missing:
+            offsets, trades = _simulate(prices, self.config, missing)
+            for column in fields(trades):
+                getattr(trades, column.name).setflags(write=False)
+            for threshold, start, stop in zip(missing, offsets[:-1], offsets[1:]):
+                config = replace(self.config, regular_threshold=threshold)
+                result = self._collect_result(prices, config, trades[start:stop])
+                if len(self._run_cache) >= _RUN_CACHE_SIZE:
+                    # Evict the oldest entry
+                    del self._run_cache[next(iter(self._run_cache))]
+                self._run_cache[keys[threshold]] = result
+                results[threshold] = result
+
+        # Callers get their own copy so changes to one never reach the cache
+        return [_copy_result(results[t]) for t in regular_thresholds]
+
+    def _run_keys(
+        self, prices: _PriceArrays, regular_thresholds: List[float]
+    ) -> Dict[float, Tuple]:
+        """Cache keys for running the current config with each threshold on prepared data."""
+        # Plain field values; dataclasses.astuple would deep-copy the config for every key
+        config = {f.name: getattr(self.config, f.name) for f in fields(self.config)}
+        keys = {}
+        for threshold in regular_thresholds:
+            config["regular_threshold"] = threshold
+            keys[threshold] = (prices.data_key, *config.values())
+        return keys
+
+    def _collect_result(
+        self, prices: _PriceArrays, config: BacktestConfig, trades: TradeArrays
+    ) -> BacktestResult:
+        """Wrap trades simulated with config in a BacktestResult."""
+        result = BacktestResult(config=config, trades=trades)
+        result.buy_hold_return_pct = prices.buy_hold_return_pct
 
         logger.info(
             f"Backtest complete: {len(trades)} trades, {result.total_return_pct:+.1f}% return"
@@ -407,20 +670,19 @@ class Backtester:
             thresholds = [round(x * 0.1, 1) for x in range(3, 16)]  # 0.3 to 1.5
 
         results = {}
-        original_threshold = self.config.regular_threshold
 
-        for threshold in thresholds:
-            self.config.regular_threshold = threshold
-            result = self.run()
+        # Only the threshold changes between runs, so every threshold is simulated in one pass
+        if self._data is None:
+            self.load_data()
+        prices = self._prepare_arrays()
+
+        for threshold, result in zip(thresholds, self._simulate_thresholds(prices, thresholds)):
             results[threshold] = result
             logger.info(
                 f"Threshold {threshold}%: {result.total_trades} trades, "
                 f"{result.win_rate:.1f}% win rate, {result.total_return_pct:+.1f}% return"
             )
 
-        # Restore original
-        self.config.regular_threshold = original_threshold
-
         # Find optimal
         if metric == "return":
             optimal = max(results.keys(), key=lambda t: results[t].total_return_pct)
@@ -14,7 +14,7 @@ import os
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -362,6 +362,19 @@ class Database:
 
             return stats
 
+    def get_trades_version(self) -> Tuple[int, str]:
+        """
+        Get a cheap fingerprint of the trades table.
+
+        Returns (row count, latest updated_at). It changes whenever a trade is
+        recorded or closed, so callers can use it as a cache key for trade reads.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*), COALESCE(MAX(updated_at), '') FROM trades")
+            count, updated_at = cursor.fetchone()
+            return count, updated_at
+
     # ==================== Bot State Operations ====================
 
     def get_bot_state(self) -> Dict[str, Any]:
@@ -8,13 +8,14 @@ import logging
 import os
 import time
 import webbrowser
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import requests
 from requests_oauthlib import OAuth1Session
 
-from .utils import get_et_now
+from .utils import ET, get_et_now
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,15 @@ OAUTH_ACCESS_TOKEN = "/oauth/access_token"
 OAUTH_RENEW_TOKEN = "/oauth/renew_access_token"
 OAUTH_REVOKE_TOKEN = "/oauth/revoke_access_token"
 
+# Treat tokens this close to their midnight ET expiry as already expired
+TOKEN_EXPIRY_MARGIN_SECONDS = 300
+
+
+def next_token_expiry(issued_at: datetime) -> datetime:
+    """E*TRADE access tokens expire at the first midnight ET after they are issued or renewed."""
+    next_day = issued_at.astimezone(ET).date() + timedelta(days=1)
+    return datetime(next_day.year, next_day.month, next_day.day, tzinfo=ET)
+
 
 class ETradeAuthError(Exception):
     """Authentication error with E*TRADE API."""
@@ -78,6 +88,7 @@ class ETradeClient:
 
         self.access_token: Optional[str] = None
         self.access_token_secret: Optional[str] = None
+        self.token_expires_at: Optional[datetime] = None
         self.session: Optional[OAuth1Session] = None
 
         self._load_tokens()
@@ -90,6 +101,10 @@ class ETradeClient:
                     tokens = json.load(f)
                     self.access_token = tokens.get("access_token")
                     self.access_token_secret = tokens.get("access_token_secret")
+                    if tokens.get("saved_at"):
+                        self.token_expires_at = next_token_expiry(
+                            datetime.fromisoformat(tokens["saved_at"])
+                        )
                     if self.access_token and self.access_token_secret:
                         self._create_session()
                         logger.info("Loaded saved OAuth tokens")
@@ -98,13 +113,15 @@ class ETradeClient:
 
     def _save_tokens(self):
         """Save tokens to file."""
+        saved_at = get_et_now()
+        self.token_expires_at = next_token_expiry(saved_at)
         try:
             with open(self.token_file, "w") as f:
                 json.dump(
                     {
                         "access_token": self.access_token,
                         "access_token_secret": self.access_token_secret,
-                        "saved_at": get_et_now().isoformat(),
+                        "saved_at": saved_at.isoformat(),
                     },
                     f,
                 )
@@ -123,6 +140,18 @@ class ETradeClient:
             resource_owner_secret=self.access_token_secret,
         )
 
+    def tokens_expired(self) -> bool:
+        """
+        Check locally whether the saved tokens are past (or about to hit) their expiry.
+
+        Needs no network call. Tokens with an unknown issue time are not
+        considered expired; is_authenticated() remains the authoritative check.
+        """
+        if self.token_expires_at is None:
+            return False
+        remaining = (self.token_expires_at - get_et_now()).total_seconds()
+        return remaining <= TOKEN_EXPIRY_MARGIN_SECONDS
+
     def is_authenticated(self) -> bool:
         """Check if we have valid tokens that actually work."""
         if self.access_token is None or self.access_token_secret is None:
@@ -338,6 +367,7 @@ class ETradeClient:
                     logger.info("Access token renewed and saved successfully")
                 else:
                     # Some E*TRADE responses don't include new tokens (token extended, not replaced)
+                    self._save_tokens()  # still records the new expiry
                     logger.info("Access token renewed (token extended, no new credentials)")
 
                 return True
@@ -363,6 +393,7 @@ class ETradeClient:
         finally:
             self.access_token = None
             self.access_token_secret = None
+            self.token_expires_at = None
             self.session = None
             if self.token_file.exists():
                 self.token_file.unlink()
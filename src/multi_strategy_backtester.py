@@ -10,8 +10,10 @@ Backtests all identified profitable strategies:
 """
 
 import logging
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
@@ -24,6 +26,13 @@ from .strategies import (
 
 logger = logging.getLogger(__name__)
 
+# Trade direction signs
+LONG = 1
+SHORT = -1
+
+# The only columns the strategy backtests read; executor jobs are sent just these
+_STRATEGY_COLUMNS = ["date", "open", "close"]
+
 
 @dataclass
 class BacktestTrade:
@@ -180,6 +189,25 @@ class MultiStrategyBacktester:
         self.slippage_pct = slippage_pct
         self._data: Optional[pd.DataFrame] = None
 
+    def _trade_outcome(
+        self, open_price: float, close_price: float, capital: float, direction: int
+    ) -> Tuple[float, float, int, float, float]:
+        """
+        Price one open-to-close trade.
+
+        direction is LONG (+1) or SHORT (-1); slippage always works against the
+        trade. Returns (entry_price, exit_price, shares, dollar_pnl, pct_pnl).
+        """
+        slippage = direction * self.slippage_pct / 100
+        entry_price = open_price * (1 + slippage)
+        exit_price = close_price * (1 - slippage)
+
+        shares = int(capital // entry_price)
+        move = direction * (exit_price - entry_price)
+        dollar_pnl = move * shares - self.commission * 2
+        pct_pnl = move / entry_price * 100
+        return entry_price, exit_price, shares, dollar_pnl, pct_pnl
+
     def load_data(self, start_date: date, end_date: date) -> pd.DataFrame:
         """Load IBIT data from Yahoo Finance."""
         try:
@@ -195,10 +223,8 @@ class MultiStrategyBacktester:
             df.columns = [c.lower() for c in df.columns]
 
             # Normalize date column
-            if "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"]).dt.date
-            elif "datetime" in df.columns:
-                df["date"] = pd.to_datetime(df["datetime"]).dt.date
+            df = df.rename(columns={"datetime": "date"})
+            df["date"] = pd.to_datetime(df["date"]).dt.date
 
             self._data = df
             logger.info(f"Loaded {len(df)} days of data")
@@ -246,10 +272,11 @@ class MultiStrategyBacktester:
             else:
                 raise ValueError("No data loaded")
 
-        df = self._data.copy()
-        df["daily_return"] = (df["close"] - df["open"]) / df["open"] * 100
-        df["prev_return"] = df["daily_return"].shift(1)
-        df["weekday"] = pd.to_datetime(df["date"]).apply(lambda x: x.weekday())
+        # Derived columns are kept as locals so the loaded frame is never copied
+        df = self._data
+        daily_return = (df["close"] - df["open"]) / df["open"] * 100
+        prev_return_col = daily_return.shift(1)
+        weekday_col = pd.to_datetime(df["date"]).dt.weekday
 
         results = BacktestResults(
             strategy_name=f"Mean Reversion ({threshold}%)",
@@ -261,30 +288,25 @@ class MultiStrategyBacktester:
 
         capital = self.initial_capital
 
-        for i, row in df.iterrows():
-            if pd.isna(row["prev_return"]):
-                continue
-
+        # Only the first day has no previous return, so skip it instead of NaN-checking each row
+        rows = zip(df["date"], df["open"], df["close"], prev_return_col, weekday_col)
+        for day, open_price, close_price, prev_return, weekday in islice(rows, 1, None):
             # Check signal conditions
-            if row["prev_return"] >= threshold:
+            if prev_return >= threshold:
                 continue  # Previous day not down enough
 
-            if skip_thursday and row["weekday"] == 3:
+            if skip_thursday and weekday == 3:
                 continue  # Skip Thursday
 
             # Execute trade
-            entry_price = row["open"] * (1 + self.slippage_pct / 100)
-            exit_price = row["close"] * (1 - self.slippage_pct / 100)
-
-            shares = int(capital // entry_price)
+            entry_price, exit_price, shares, dollar_pnl, pct_pnl = self._trade_outcome(
+                open_price, close_price, capital, LONG
+            )
             if shares <= 0:
                 continue
 
-            dollar_pnl = (exit_price - entry_price) * shares - self.commission * 2
-            pct_pnl = (exit_price - entry_price) / entry_price * 100
-
             trade = BacktestTrade(
-                date=row["date"],
+                date=day,
                 direction="long",
                 strategy="mean_reversion",
                 entry_price=entry_price,
@@ -292,8 +314,8 @@ class MultiStrategyBacktester:
                 shares=shares,
                 dollar_pnl=dollar_pnl,
                 percentage_pnl=pct_pnl,
-                reason=f"Prev day: {row['prev_return']:.2f}%",
-                metadata={"threshold": threshold, "prev_return": row["prev_return"]},
+                reason=f"Prev day: {prev_return:.2f}%",
+                metadata={"threshold": threshold, "prev_return": prev_return},
             )
             results.trades.append(trade)
 
@@ -319,8 +341,8 @@ class MultiStrategyBacktester:
             else:
                 raise ValueError("No data loaded")
 
-        df = self._data.copy()
-        df["weekday"] = pd.to_datetime(df["date"]).apply(lambda x: x.weekday())
+        df = self._data
+        weekday_col = pd.to_datetime(df["date"]).dt.weekday
 
         results = BacktestResults(
             strategy_name="Short Thursday",
@@ -332,25 +354,21 @@ class MultiStrategyBacktester:
 
         capital = self.initial_capital
 
-        for i, row in df.iterrows():
+        rows = zip(df["date"], df["open"], df["close"], weekday_col)
+        for day, open_price, close_price, weekday in rows:
             # Only trade Thursdays
-            if row["weekday"] != 3:
+            if weekday != 3:
                 continue
 
-            # Execute short trade
-            entry_price = row["open"] * (1 - self.slippage_pct / 100)  # Short entry
-            exit_price = row["close"] * (1 + self.slippage_pct / 100)  # Cover
-
-            shares = int(capital // entry_price)
+            # Execute short trade (profit when price goes down)
+            entry_price, exit_price, shares, dollar_pnl, pct_pnl = self._trade_outcome(
+                open_price, close_price, capital, SHORT
+            )
             if shares <= 0:
                 continue
 
-            # Short P&L: profit when price goes down
-            dollar_pnl = (entry_price - exit_price) * shares - self.commission * 2
-            pct_pnl = (entry_price - exit_price) / entry_price * 100
-
             trade = BacktestTrade(
-                date=row["date"],
+                date=day,
                 direction="short",
                 strategy="short_thursday",
                 entry_price=entry_price,
@@ -391,10 +409,10 @@ class MultiStrategyBacktester:
             else:
                 raise ValueError("No data loaded")
 
-        df = self._data.copy()
-        df["daily_return"] = (df["close"] - df["open"]) / df["open"] * 100
-        df["prev_return"] = df["daily_return"].shift(1)
-        df["weekday"] = pd.to_datetime(df["date"]).apply(lambda x: x.weekday())
+        df = self._data
+        daily_return = (df["close"] - df["open"]) / df["open"] * 100
+        prev_return_col = daily_return.shift(1)
+        weekday_col = pd.to_datetime(df["date"]).dt.weekday
 
         results = BacktestResults(
             strategy_name=f"Combined (MR: {mean_reversion_threshold}%, Short Thu: {enable_short_thursday})",
@@ -406,22 +424,20 @@ class MultiStrategyBacktester:
 
         capital = self.initial_capital
 
-        for i, row in df.iterrows():
+        rows = zip(df["date"], df["open"], df["close"], prev_return_col, weekday_col)
+        for day, open_price, close_price, prev_return, weekday in rows:
             trade = None
 
-            # Check mean reversion signal first (takes priority)
-            if not pd.isna(row["prev_return"]) and row["prev_return"] < mean_reversion_threshold:
+            # Check mean reversion signal first (takes priority); the first day's NaN
+            # previous return compares False, so it can still be a short Thursday
+            if prev_return < mean_reversion_threshold:
                 # Long signal
-                entry_price = row["open"] * (1 + self.slippage_pct / 100)
-                exit_price = row["close"] * (1 - self.slippage_pct / 100)
-
-                shares = int(capital // entry_price)
+                entry_price, exit_price, shares, dollar_pnl, pct_pnl = self._trade_outcome(
+                    open_price, close_price, capital, LONG
+                )
                 if shares > 0:
-                    dollar_pnl = (exit_price - entry_price) * shares - self.commission * 2
-                    pct_pnl = (exit_price - entry_price) / entry_price * 100
-
                     trade = BacktestTrade(
-                        date=row["date"],
+                        date=day,
                         direction="long",
                         strategy="combined_mean_reversion",
                         entry_price=entry_price,
@@ -429,22 +445,18 @@ class MultiStrategyBacktester:
                         shares=shares,
                         dollar_pnl=dollar_pnl,
                         percentage_pnl=pct_pnl,
-                        reason=f"Mean reversion: prev {row['prev_return']:.2f}%",
-                        metadata={"trigger": "mean_reversion", "prev_return": row["prev_return"]},
+                        reason=f"Mean reversion: prev {prev_return:.2f}%",
+                        metadata={"trigger": "mean_reversion", "prev_return": prev_return},
                     )
 
             # If no mean reversion, check short Thursday
-            elif enable_short_thursday and row["weekday"] == 3:
-                entry_price = row["open"] * (1 - self.slippage_pct / 100)
-                exit_price = row["close"] * (1 + self.slippage_pct / 100)
-
-                shares = int(capital // entry_price)
+            elif enable_short_thursday and weekday == 3:
+                entry_price, exit_price, shares, dollar_pnl, pct_pnl = self._trade_outcome(
+                    open_price, close_price, capital, SHORT
+                )
                 if shares > 0:
-                    dollar_pnl = (entry_price - exit_price) * shares - self.commission * 2
-                    pct_pnl = (entry_price - exit_price) / entry_price * 100
-
                     trade = BacktestTrade(
-                        date=row["date"],
+                        date=day,
                         direction="short",
                         strategy="combined_short_thursday",
                         entry_price=entry_price,
@@ -468,31 +480,50 @@ class MultiStrategyBacktester:
         return results
 
     def backtest_all_strategies(
-        self, start_date: Optional[date] = None, end_date: Optional[date] = None
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        executor: Optional[Executor] = None,
     ) -> Dict[str, BacktestResults]:
-        """Run backtests on all strategies."""
+        """
+        Run backtests on all strategies.
+
+        Variants run one after another in this process unless an executor is given,
+        e.g. a ProcessPoolExecutor from a command-line caller. Each variant is
+        cheap, so a pool only pays off for long date ranges.
+        """
         if self._data is None:
             if start_date and end_date:
                 self.load_data(start_date, end_date)
             else:
                 raise ValueError("No data loaded")
 
-        results = {}
+        jobs: Dict[str, Tuple[str, Dict[str, Any]]] = {}
 
         # Mean Reversion variants
         for threshold in [-2.0, -3.0, -4.0]:
             key = f"mean_reversion_{abs(threshold)}"
-            results[key] = self.backtest_mean_reversion(threshold=threshold)
+            jobs[key] = ("backtest_mean_reversion", {"threshold": threshold})
 
         # Short Thursday
-        results["short_thursday"] = self.backtest_short_thursday()
+        jobs["short_thursday"] = ("backtest_short_thursday", {})
 
         # Combined variants
         for threshold in [-2.0, -3.0]:
             key = f"combined_{abs(threshold)}"
-            results[key] = self.backtest_combined(mean_reversion_threshold=threshold)
+            jobs[key] = ("backtest_combined", {"mean_reversion_threshold": threshold})
 
-        return results
+        if executor is None:
+            return {key: getattr(self, method)(**kwargs) for key, (method, kwargs) in jobs.items()}
+
+        # Ship each job the settings and the columns it reads, not the whole backtester
+        settings = (self.initial_capital, self.commission, self.slippage_pct)
+        data = self._data[_STRATEGY_COLUMNS]
+        futures = {
+            key: executor.submit(_run_strategy_variant, settings, data, method, kwargs)
+            for key, (method, kwargs) in jobs.items()
+        }
+        return {key: future.result() for key, future in futures.items()}
 
     def compare_strategies(self, results: Dict[str, BacktestResults]) -> pd.DataFrame:
         """Create comparison table of strategy results."""
@@ -516,14 +547,29 @@ class MultiStrategyBacktester:
         return pd.DataFrame(comparison)
 
 
+def _run_strategy_variant(
+    settings: Tuple[float, float, float],
+    data: pd.DataFrame,
+    method: str,
+    kwargs: Dict[str, Any],
+) -> BacktestResults:
+    """Run one backtest_all_strategies job on a fresh backtester (module-level so it pickles)."""
+    backtester = MultiStrategyBacktester(*settings)
+    backtester._data = data
+    return getattr(backtester, method)(**kwargs)
+
+
 def run_comprehensive_backtest(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     initial_capital: float = 10000.0,
+    executor: Optional[Executor] = None,
 ) -> Tuple[Dict[str, BacktestResults], pd.DataFrame]:
     """
     Run comprehensive backtest of all strategies.
 
+    Pass an executor to run the strategy variants on it (see backtest_all_strategies).
+
     Returns tuple of (results dict, comparison DataFrame)
     """
     if start_date is None:
@@ -534,7 +580,7 @@ def run_comprehensive_backtest(
     backtester = MultiStrategyBacktester(initial_capital=initial_capital)
     backtester.load_data(start_date, end_date)
 
-    results = backtester.backtest_all_strategies()
+    results = backtester.backtest_all_strategies(executor=executor)
     comparison = backtester.compare_strategies(results)
 
     return results, comparison
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from ..async_utils import run_sync_in_executor
+from ..async_utils import clear_sync_cache, run_sync_in_executor, run_sync_in_executor_cached
 from .utils import escape_markdown
 
 if TYPE_CHECKING:
@@ -107,6 +107,8 @@ class TradingCommandsMixin:
                 parse_mode="Markdown",
             )
 
+        # Balances and positions differ between modes
+        clear_sync_cache()
         logger.info(f"Mode switched to {new_mode.upper()} (persisted to database)")
 
     async def _cmd_pause(self: "TelegramBot", update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -169,7 +171,7 @@ class TradingCommandsMixin:
 
         try:
             # Run in thread to avoid event loop conflicts with HTTP libraries
-            portfolio = await run_sync_in_executor(self.trading_bot.get_portfolio_value)
+            portfolio = await run_sync_in_executor_cached(self.trading_bot.get_portfolio_value)
             cash = portfolio.get("cash", 0)
             total_value = portfolio.get("total_value", cash)
             positions_value = total_value - cash
@@ -202,7 +204,7 @@ class TradingCommandsMixin:
 
         try:
             # Run in thread to avoid event loop conflicts with HTTP libraries
-            portfolio = await run_sync_in_executor(self.trading_bot.get_portfolio_value)
+            portfolio = await run_sync_in_executor_cached(self.trading_bot.get_portfolio_value)
             positions = portfolio.get("positions", [])
 
             if not positions:
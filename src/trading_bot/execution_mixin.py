@@ -7,6 +7,7 @@ Provides methods for executing trades in paper and live modes.
 import logging
 from typing import TYPE_CHECKING, Optional
 
+from ..async_utils import clear_sync_cache
 from ..etrade_client import ETradeAPIError, ETradeAuthError
 from ..smart_strategy import Signal, TodaySignal
 from ..telegram_bot import ApprovalResult
@@ -161,10 +162,14 @@ class ExecutionMixin:
                 return approval_result
 
             # Execute trade
-            if self.is_paper_mode:
-                result = self._execute_paper_trade(etf, shares, price, signal)
-            else:
-                result = self._execute_live_trade(etf, shares, signal)
+            try:
+                if self.is_paper_mode:
+                    result = self._execute_paper_trade(etf, shares, price, signal)
+                else:
+                    result = self._execute_live_trade(etf, shares, signal)
+            finally:
+                # Cash and positions changed (or may have); drop cached portfolio reads
+                clear_sync_cache()
 
             # Send notification (email/desktop)
             if result.success:
@@ -7,6 +7,7 @@ Provides methods for trailing hedges and loss reversal strategies.
 import logging
 from typing import TYPE_CHECKING, Optional
 
+from ..async_utils import clear_sync_cache
 from ..etrade_client import ETradeAPIError
 from ..smart_strategy import Signal
 from ..utils import get_et_now
@@ -91,10 +92,13 @@ class HedgeMixin:
 
         # Acquire lock for position modification
         with self._position_lock:
-            if self.is_paper_mode:
-                return self._execute_paper_hedge(hedge_instrument, hedge_shares, hedge_price)
-            else:
-                return self._execute_live_hedge(hedge_instrument, hedge_shares, hedge_price)
+            try:
+                if self.is_paper_mode:
+                    return self._execute_paper_hedge(hedge_instrument, hedge_shares, hedge_price)
+                else:
+                    return self._execute_live_hedge(hedge_instrument, hedge_shares, hedge_price)
+            finally:
+                clear_sync_cache()
 
     def _execute_paper_hedge(
         self: "TradingBot",
@@ -332,12 +336,15 @@ class HedgeMixin:
         # Use same number of shares for simplicity
         sbit_shares = shares
 
-        if self.is_paper_mode:
-            return self._execute_paper_reversal(sbit_shares, sbit_price, pnl_pct)
-        else:
-            return self._execute_live_reversal(
-                sbit_shares, sbit_price, shares, pnl_pct, close_result
-            )
+        try:
+            if self.is_paper_mode:
+                return self._execute_paper_reversal(sbit_shares, sbit_price, pnl_pct)
+            else:
+                return self._execute_live_reversal(
+                    sbit_shares, sbit_price, shares, pnl_pct, close_result
+                )
+        finally:
+            clear_sync_cache()
 
     def _execute_paper_reversal(
         self: "TradingBot",
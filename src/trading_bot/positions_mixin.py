@@ -7,6 +7,7 @@ Provides methods for checking, getting, and closing positions.
 import logging
 from typing import TYPE_CHECKING, Any, Dict, List
 
+from ..async_utils import clear_sync_cache
 from ..etrade_client import ETradeAPIError, ETradeAuthError
 from ..smart_strategy import Signal
 from ..utils import get_et_now
@@ -100,10 +101,13 @@ class PositionsMixin:
         Thread-safe: Uses position lock to prevent concurrent modifications.
         """
         with self._position_lock:
-            if self.is_paper_mode:
-                return self._close_paper_position(etf)
-            else:
-                return self._close_live_position(etf)
+            try:
+                if self.is_paper_mode:
+                    return self._close_paper_position(etf)
+                else:
+                    return self._close_live_position(etf)
+            finally:
+                clear_sync_cache()
 
     def _close_paper_position(self: "TradingBot", etf: str) -> TradeResult:
         """Close a paper position."""
@@ -7,6 +7,7 @@ import datetime
 import logging
 from typing import Optional, Tuple
 
+import numpy as np
 from zoneinfo import ZoneInfo
 
 # Re-export async utilities for backward compatibility
@@ -111,6 +112,20 @@ def calculate_dip_percentage(open_price: float, current_price: float) -> float:
     return ((open_price - current_price) / open_price) * 100
 
 
+def calculate_dip_percentages(open_prices, current_prices) -> np.ndarray:
+    """
+    Vectorized calculate_dip_percentage over arrays of prices.
+
+    Accepts scalars or array-likes (broadcast by NumPy). Entries with a
+    non-positive open price get 0.0.
+    """
+    open_prices = np.asarray(open_prices, dtype=np.float64)
+    current_prices = np.asarray(current_prices, dtype=np.float64)
+    valid = open_prices > 0
+    safe_open = np.where(valid, open_prices, 1.0)
+    return np.where(valid, (open_prices - current_prices) / safe_open * 100, 0.0)
+
+
 def calculate_shares(
     available_cash: float, price: float, max_position: Optional[float] = None
 ) -> int:
@@ -5,11 +5,14 @@ These tests verify the core async utilities that prevent "Event loop is closed"
 """
 
 import asyncio
+import contextvars
+import gc
 import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -17,8 +20,13 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.async_utils import (
+    _MAX_PENDING_SUBMISSIONS,
+    clear_sync_cache,
+    run_async,
     run_async_from_sync,
     run_sync_in_executor,
+    run_sync_in_executor_cached,
+    run_sync_in_executor_many,
     shutdown_executor,
 )
 
@@ -81,8 +89,8 @@ class TestRunAsyncFromSync:
         thread.join(timeout=5)
 
         assert len(results) == 1
-        # The coroutine runs in the thread that called run_async_from_sync
-        assert "TestThread" in results[0] or "MainThread" in results[0]
+        # The coroutine runs on the shared background loop thread
+        assert results[0] == "async_bridge_loop"
 
     def test_multiple_threads_concurrent(self):
         """Multiple threads can call run_async_from_sync concurrently."""
@@ -111,23 +119,28 @@ class TestRunAsyncFromSync:
         for n, result in results:
             assert result == n * 2
 
-    def test_isolates_event_loops(self):
-        """Each call should create a new loop that gets closed after use."""
-        # Test that the loop is properly closed after each call
-        # by verifying we can make many calls without accumulating open loops
-        results = []
+    def test_reuses_background_loop(self):
+        """Sequential calls should share one long-lived event loop."""
+        loops = []
 
-        async def return_value(n):
+        async def current_loop():
             await asyncio.sleep(0.001)
-            return n
+            return asyncio.get_running_loop()
 
-        # Make many sequential calls - if loops weren't being cleaned up,
-        # we'd eventually hit resource limits
-        for i in range(10):
-            result = run_async_from_sync(return_value(i))
-            results.append(result)
+        for _ in range(10):
+            loops.append(run_async_from_sync(current_loop()))
+
+        assert len(set(map(id, loops))) == 1
+        assert not loops[0].is_closed()
+
+    def test_deprecated_run_async_warns(self):
+        """The old run_async() name should still work but emit a DeprecationWarning."""
 
-        assert results == list(range(10))
+        async def simple_coro():
+            return 42
+
+        with pytest.warns(DeprecationWarning, match="run_async_from_sync"):
+            assert run_async(simple_coro()) == 42
 
 
 class TestRunSyncInExecutor:
@@ -187,6 +200,18 @@ class TestRunSyncInExecutor:
         assert result != main_thread
         assert "async_bridge" in result
 
+    @pytest.mark.asyncio
+    async def test_propagates_context_vars(self):
+        """Context variables set by the caller should be visible in the worker thread."""
+        request_id = contextvars.ContextVar("request_id", default=None)
+        request_id.set("req-123")
+
+        def read_request_id(suffix, sep="-"):
+            return f"{request_id.get()}{sep}{suffix}"
+
+        result = await run_sync_in_executor(read_request_id, "x", sep=":")
+        assert result == "req-123:x"
+
     @pytest.mark.asyncio
     async def test_handles_blocking_io(self):
         """Should handle blocking I/O without blocking event loop."""
@@ -222,6 +247,40 @@ class TestRunSyncInExecutor:
         # Should complete in ~0.1s (parallel), not ~0.3s (sequential)
         assert elapsed < 0.25
 
+    @pytest.mark.asyncio
+    async def test_bursts_beyond_submission_limit(self):
+        """Calls beyond the in-flight limit should wait their turn, not fail."""
+
+        def identity(n):
+            time.sleep(0.001)
+            return n
+
+        count = _MAX_PENDING_SUBMISSIONS * 2
+        results = await asyncio.gather(*(run_sync_in_executor(identity, i) for i in range(count)))
+
+        assert results == list(range(count))
+
+    @pytest.mark.asyncio
+    async def test_many_runs_calls_concurrently_in_order(self):
+        """Batched calls should run in parallel and keep the input order."""
+
+        def slow_func(n, scale=1):
+            time.sleep(0.1)
+            return n * scale
+
+        start = time.time()
+        results = await run_sync_in_executor_many(
+            [
+                (slow_func, (1,), {}),
+                (slow_func, (2,), {"scale": 10}),
+                (slow_func, (3,), {}),
+            ]
+        )
+        elapsed = time.time() - start
+
+        assert results == [1, 20, 3]
+        assert elapsed < 0.25
+
     def test_documents_async_requirement(self):
         """run_sync_in_executor is an async function that must be awaited."""
         # This test just documents that run_sync_in_executor is async
@@ -238,6 +297,129 @@ class TestRunSyncInExecutor:
         result.close()
 
 
+class TestRunSyncInExecutorCached:
+    """Test the TTL-cached async -> sync bridge."""
+
+    def setup_method(self):
+        clear_sync_cache()
+
+    @pytest.mark.asyncio
+    async def test_reuses_result_within_ttl(self):
+        """Repeated read-only calls inside the TTL should run the function once."""
+        calls = []
+
+        def get_balance(account):
+            calls.append(account)
+            return {"account": account, "cash": 100.0}
+
+        first = await run_sync_in_executor_cached(get_balance, "A")
+        second = await run_sync_in_executor_cached(get_balance, "A")
+        other = await run_sync_in_executor_cached(get_balance, "B")
+
+        assert first == second == {"account": "A", "cash": 100.0}
+        assert other["account"] == "B"
+        assert calls == ["A", "B"]
+
+    @pytest.mark.asyncio
+    async def test_expires_after_ttl(self):
+        """Entries older than the TTL should be refetched."""
+        calls = []
+
+        def get_quote():
+            calls.append(1)
+            return len(calls)
+
+        assert await run_sync_in_executor_cached(get_quote, ttl=0.05) == 1
+        time.sleep(0.06)
+        assert await run_sync_in_executor_cached(get_quote, ttl=0.05) == 2
+
+    @pytest.mark.asyncio
+    async def test_never_caches_mutating_calls(self):
+        """Functions that aren't get_/list_ reads should always run."""
+        calls = []
+
+        def place_order(symbol):
+            calls.append(symbol)
+            return len(calls)
+
+        await run_sync_in_executor_cached(place_order, "IBIT")
+        await run_sync_in_executor_cached(place_order, "IBIT")
+
+        assert calls == ["IBIT", "IBIT"]
+
+    @pytest.mark.asyncio
+    async def test_unhashable_arguments_bypass_cache(self):
+        """Calls with unhashable arguments should run uncached instead of raising."""
+        calls = []
+
+        def get_quotes(symbols):
+            calls.append(symbols)
+            return len(calls)
+
+        assert await run_sync_in_executor_cached(get_quotes, ["IBIT", "BITU"]) == 1
+        assert await run_sync_in_executor_cached(get_quotes, ["IBIT", "BITU"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_results_are_per_instance_and_copied(self):
+        """Bound calls on different objects never share entries; callers get copies."""
+
+        class Client:
+            def __init__(self, cash):
+                self.cash = cash
+
+            def get_balance(self):
+                return {"cash": self.cash, "positions": []}
+
+        first = Client(100.0)
+        balance = await run_sync_in_executor_cached(first.get_balance)
+        balance["positions"].append("IBIT")
+        assert await run_sync_in_executor_cached(first.get_balance) == {
+            "cash": 100.0,
+            "positions": [],
+        }
+
+        del first
+        gc.collect()
+        second = Client(200.0)
+        assert (await run_sync_in_executor_cached(second.get_balance))["cash"] == 200.0
+
+    @pytest.mark.asyncio
+    async def test_http_401_clears_cache(self):
+        """An HTTP 401 response error should clear the cache like ETradeAuthError."""
+        cash = iter([100.0, 200.0])
+
+        def get_cash():
+            return next(cash)
+
+        def get_positions():
+            error = Exception("Unauthorized")
+            error.response = SimpleNamespace(status_code=401)
+            raise error
+
+        assert await run_sync_in_executor_cached(get_cash) == 100.0
+        with pytest.raises(Exception, match="Unauthorized"):
+            await run_sync_in_executor_cached(get_positions)
+        assert await run_sync_in_executor_cached(get_cash) == 200.0
+
+    @pytest.mark.asyncio
+    async def test_auth_error_clears_cache(self):
+        """A 401 should drop cached results so stale data isn't served."""
+        from src.etrade_client import ETradeAuthError
+
+        cash = iter([100.0, 200.0])
+
+        def get_cash():
+            return next(cash)
+
+        def get_positions():
+            raise ETradeAuthError("Token expired and renewal failed")
+
+        assert await run_sync_in_executor_cached(get_cash) == 100.0
+        with pytest.raises(ETradeAuthError):
+            await run_sync_in_executor_cached(get_positions)
+        assert await run_sync_in_executor_cached(get_cash) == 200.0
+
+
 class TestExecutorShutdown:
     """Test executor lifecycle management."""
 
@@ -253,10 +435,41 @@ class TestExecutorShutdown:
         # Shutdown
         shutdown_executor(wait=True)
 
-        # After shutdown, new calls should still work (creates new executor)
+        # After shutdown, new calls should still work (creates new executor and loop)
         result = run_async_from_sync(dummy())
         assert result == 1
 
+    def test_shutdown_stops_background_loop(self):
+        """shutdown_executor should stop and close the background event loop."""
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        loop = run_async_from_sync(current_loop())
+        shutdown_executor(wait=True)
+
+        assert loop.is_closed()
+        assert run_async_from_sync(current_loop()) is not loop
+
+    def test_shutdown_cancels_pending_tasks(self):
+        """Tasks still running on the background loop are cancelled at shutdown."""
+        cancelled = threading.Event()
+
+        async def start_background_task():
+            async def forever():
+                try:
+                    await asyncio.sleep(3600)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+            return asyncio.ensure_future(forever())
+
+        run_async_from_sync(start_background_task())
+        shutdown_executor(wait=True)
+
+        assert cancelled.is_set()
+
 
 class TestIntegration:
     """Integration tests for real-world scenarios."""
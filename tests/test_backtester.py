@@ -3,7 +3,8 @@ Unit tests for IBIT Dip Bot backtester module.
 """
 
 import sys
-from datetime import date
+import types
+from datetime import date, datetime
 from pathlib import Path
 
 import numpy as np
@@ -18,6 +19,7 @@ from src.backtester import (
     Backtester,
     BacktestResult,
     BacktestTrade,
+    TradeArrays,
     run_default_backtest,
 )
 
@@ -71,6 +73,7 @@ class TestBacktestTrade:
         assert trade.date == date(2024, 6, 15)
         assert trade.shares == 100
         assert trade.dollar_pnl == 100.0
+        assert not hasattr(trade, "__dict__")
 
 
 class TestBacktestResult:
@@ -129,6 +132,25 @@ class TestBacktestResult:
         assert result.win_rate == pytest.approx(66.67, rel=0.01)
         assert result.total_return == 150.0
 
+    def test_result_max_drawdown(self, sample_trades):
+        """Test drawdown is measured from the running profit peak."""
+        result = BacktestResult(config=BacktestConfig(), trades=sample_trades)
+
+        # Peak of +100 falls back to +50 on $10,000 starting capital
+        assert result.max_drawdown_pct == pytest.approx(50 / 10100 * 100)
+
+    def test_result_stores_trade_arrays(self, sample_trades):
+        """Test that trades are packed into columns and still read back as rows."""
+        result = BacktestResult(config=BacktestConfig(), trades=sample_trades)
+
+        assert isinstance(result.trades, TradeArrays)
+        assert len(result.trades) == 3
+        assert result.trades.dollar_pnl.tolist() == [100.0, -50.0, 100.0]
+        assert list(result.trades) == sample_trades
+        assert result.trades[-1] == sample_trades[-1]
+        assert isinstance(result.trades[0].shares, int)
+        assert list(result.trades[1:]) == sample_trades[1:]
+
     def test_result_to_dataframe(self, sample_trades):
         """Test converting result to DataFrame."""
         config = BacktestConfig()
@@ -195,6 +217,77 @@ class TestBacktester:
         assert backtester.config.start_date == date(2024, 6, 1)
         assert backtester.config.end_date == date(2024, 6, 30)
 
+    def test_load_csv_data(self, tmp_path):
+        """Test loading a CSV with mixed-case headers and extra columns."""
+        path = tmp_path / "ibit.csv"
+        path.write_text(
+            "Date,Open,High,Low,Close,Adj Close,Volume\n"
+            "2024-05-31,50.0,51.0,49.0,50.5,50.5,1000\n"
+            "2024-06-03,50.5,52.0,50.0,51.5,51.5,2000\n"
+            "2024-06-04,51.5,52.5,50.5,52.0,52.0,3000\n"
+        )
+        config = BacktestConfig(start_date=date(2024, 6, 1), end_date=date(2024, 6, 30))
+
+        df = Backtester(config).load_data(str(path))
+
+        assert list(df.columns) == ["date", "open", "high", "low", "close", "volume"]
+        assert df["date"].tolist() == [pd.Timestamp("2024-06-03"), pd.Timestamp("2024-06-04")]
+        assert df["close"].tolist() == [51.5, 52.0]
+
+    @pytest.fixture
+    def fake_yfinance(self, monkeypatch):
+        """Stand-in yfinance module; returns the list of history() calls made."""
+        calls = []
+
+        class FakeTicker:
+            def __init__(self, symbol):
+                pass
+
+            def history(self, **kwargs):
+                calls.append(kwargs)
+                index = pd.date_range("2024-06-03", periods=3, tz="America/New_York", name="Date")
+                return pd.DataFrame(
+                    {
+                        "Open": [50.0, 51.0, 52.0],
+                        "High": [51.0, 52.0, 53.0],
+                        "Low": [49.0, 50.0, 51.0],
+                        "Close": [50.5, 51.5, 52.5],
+                        "Volume": [1000, 2000, 3000],
+                        "Dividends": 0.0,
+                    },
+                    index=index,
+                )
+
+        monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(Ticker=FakeTicker))
+        return calls
+
+    def test_yahoo_download_is_cached(self, fake_yfinance, tmp_path, monkeypatch):
+        """Test that a closed date range is downloaded once and then read from disk."""
+        monkeypatch.setattr("src.backtester._YAHOO_CACHE_DIR", tmp_path)
+        config = BacktestConfig(start_date=date(2024, 6, 1), end_date=date(2024, 6, 30))
+
+        first = Backtester(config).load_data()
+        second = Backtester(config).load_data()
+
+        assert len(fake_yfinance) == 1
+        pd.testing.assert_frame_equal(first, second)
+
+        # A datetime end date is treated as its calendar day
+        config = BacktestConfig(start_date=date(2024, 6, 1), end_date=datetime(2024, 6, 30, 16))
+        pd.testing.assert_frame_equal(Backtester(config).load_data(), first)
+        assert len(fake_yfinance) == 1
+
+    def test_yahoo_download_survives_unwritable_cache(self, fake_yfinance, tmp_path, monkeypatch):
+        """Test that failing to write the cache doesn't fail the download."""
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
+        monkeypatch.setattr("src.backtester._YAHOO_CACHE_DIR", blocker / "backtester")
+        config = BacktestConfig(start_date=date(2024, 6, 1), end_date=date(2024, 6, 30))
+
+        df = Backtester(config).load_data()
+
+        assert len(df) == 3
+
     def test_run_backtest(self, sample_data):
         """Test running backtest with sample data."""
         config = BacktestConfig(
@@ -211,6 +304,87 @@ class TestBacktester:
         # May or may not have trades depending on random data
         assert result.total_trades >= 0
 
+    def test_run_skips_holidays_and_weekends(self):
+        """Test that big dips on non-trading days are never traded."""
+        dates = [date(2024, 7, 3), date(2024, 7, 4), date(2024, 7, 6), date(2024, 7, 8)]
+        data = pd.DataFrame(
+            {
+                "date": dates,
+                "open": [50.0] * 4,
+                "high": [51.0] * 4,
+                "low": [45.0] * 4,
+                "close": [50.5] * 4,
+                "volume": [1000000] * 4,
+            }
+        )
+        backtester = Backtester(BacktestConfig(monday_enabled=True))
+
+        result = backtester.run(data=data)
+
+        assert [t.date for t in result.trades] == [date(2024, 7, 3), date(2024, 7, 8)]
+        assert [t.day_of_week for t in result.trades] == ["Wednesday", "Monday"]
+        assert result.trades[1].dip_percentage == 1.0
+
+    def test_run_sizes_whole_share_positions(self):
+        """Test share counts round down and unaffordable days are skipped."""
+        data = pd.DataFrame(
+            {
+                "date": [date(2024, 7, 2), date(2024, 7, 3)],
+                "open": [50.0, 500.0],
+                "high": [51.0, 510.0],
+                "low": [45.0, 450.0],
+                "close": [50.5, 505.0],
+                "volume": [1000000] * 2,
+            }
+        )
+        config = BacktestConfig(initial_capital=200.0, slippage_pct=0.0)
+
+        result = Backtester(config).run(data=data)
+
+        # Entry is 0.6% under the open: 200 // 49.7 = 4 shares, and 497 is unaffordable
+        assert [t.date for t in result.trades] == [date(2024, 7, 2)]
+        assert result.trades[0].shares == 4
+        assert result.trades[0].dollar_pnl == pytest.approx((50.5 - 49.7) * 4)
+
+    def test_run_reuses_cached_result(self, sample_data):
+        """Test that repeating a run with the same data and config hits the cache."""
+        backtester = Backtester(BacktestConfig(regular_threshold=0.5))
+
+        first = backtester.run(data=sample_data)
+        second = backtester.run(data=sample_data.copy())
+        # A cache hit is a copy of the result sharing its trade columns
+        assert second is not first
+        assert second.trades.dollar_pnl is first.trades.dollar_pnl
+
+        backtester.config = BacktestConfig(regular_threshold=0.7)
+        assert backtester.run().trades.dollar_pnl is not first.trades.dollar_pnl
+
+        backtester.config = BacktestConfig(regular_threshold=0.5)
+        backtester.clear_cache()
+        assert backtester.run().trades.dollar_pnl is not first.trades.dollar_pnl
+
+    def test_run_after_sweep_uses_its_own_threshold(self, sample_data):
+        """Test that a run served from a sweep's cache reports the run's threshold."""
+        backtester = Backtester(BacktestConfig(regular_threshold=0.6))
+        backtester._data = sample_data
+        _, results = backtester.optimize_threshold(thresholds=[0.3, 0.9])
+        assert results[0.9].config.regular_threshold == 0.9
+
+        backtester.config = BacktestConfig(regular_threshold=0.9)
+        result = backtester.run()
+
+        assert result.config.regular_threshold == 0.9
+        assert "Threshold: 0.9%" in result.summary()
+
+        # Changing the returned result leaves the cached one alone
+        result.config.initial_capital = 1.0
+        result.daily_returns.clear()
+        again = backtester.run()
+        assert again.config.initial_capital == BacktestConfig().initial_capital
+        assert again.daily_returns == results[0.9].daily_returns
+        with pytest.raises(ValueError):
+            again.trades.dollar_pnl[:] = 0.0
+
     def test_optimize_threshold(self, sample_data):
         """Test threshold optimization."""
         config = BacktestConfig(start_date=date(2024, 6, 1), end_date=date(2024, 6, 30))
@@ -225,6 +399,18 @@ class TestBacktester:
         assert len(results) == 4
         assert all(isinstance(r, BacktestResult) for r in results.values())
 
+    def test_optimize_threshold_matches_single_runs(self, sample_data):
+        """Test that the sweep gives the same trades as separate runs."""
+        backtester = Backtester(BacktestConfig())
+        backtester._data = sample_data
+
+        _, results = backtester.optimize_threshold(thresholds=[0.3, 0.9])
+
+        for threshold, result in results.items():
+            single = Backtester(BacktestConfig(regular_threshold=threshold)).run(data=sample_data)
+            assert list(result.trades) == list(single.trades)
+            assert result.total_return == single.total_return
+
 
 class TestRunDefaultBacktest:
     """Test the convenience function."""
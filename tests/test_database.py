@@ -206,6 +206,28 @@ class TestDatabase:
         assert len(curve) == 5
         assert curve[-1]["cumulative_pnl"] == sum(50.0 * (i + 1) for i in range(5))
 
+    def test_trades_version_changes_on_entry_and_exit(self, db):
+        """Test trades version fingerprint tracks writes."""
+        empty_version = db.get_trades_version()
+        assert empty_version == (0, "")
+
+        trade_id = db.record_trade_entry(
+            date=date(2024, 6, 15),
+            day_of_week="Tuesday",
+            open_price=50.0,
+            entry_price=49.5,
+            dip_percentage=1.0,
+            shares=100,
+        )
+        entry_version = db.get_trades_version()
+        assert entry_version[0] == 1
+        assert entry_version == db.get_trades_version()
+
+        db.record_trade_exit(
+            trade_id=trade_id, exit_price=50.5, dollar_pnl=100.0, percentage_pnl=2.02
+        )
+        assert db.get_trades_version() != entry_version
+
 
 class TestDatabaseConcurrency:
     """Test database concurrency handling."""
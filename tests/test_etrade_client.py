@@ -0,0 +1,93 @@
+"""
+Tests for E*TRADE access token expiry tracking.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.etrade_client import TOKEN_EXPIRY_MARGIN_SECONDS, ETradeClient, next_token_expiry
+from src.utils import ET, UTC
+
+
+def make_client(tmp_path, **tokens) -> ETradeClient:
+    """Client whose token file holds the given fields."""
+    token_file = tmp_path / "tokens.json"
+    token_file.write_text(
+        json.dumps({"access_token": "token", "access_token_secret": "secret", **tokens})
+    )
+    return ETradeClient("key", "secret", token_file=token_file)
+
+
+class TestNextTokenExpiry:
+    """Test the midnight ET expiry rule."""
+
+    def test_saved_before_midnight(self):
+        """Tokens saved late in the evening expire at the coming midnight."""
+        expiry = next_token_expiry(datetime(2024, 6, 3, 23, 59, tzinfo=ET))
+        assert expiry == datetime(2024, 6, 4, tzinfo=ET)
+
+    def test_saved_after_midnight(self):
+        """Tokens saved just after midnight last until the following midnight."""
+        expiry = next_token_expiry(datetime(2024, 6, 4, 0, 1, tzinfo=ET))
+        assert expiry == datetime(2024, 6, 5, tzinfo=ET)
+
+    def test_uses_the_eastern_calendar_day(self):
+        """A UTC time already past midnight UTC but still the previous day in ET."""
+        expiry = next_token_expiry(datetime(2024, 6, 4, 2, 0, tzinfo=UTC))  # 22:00 ET, June 3
+        assert expiry == datetime(2024, 6, 4, tzinfo=ET)
+
+    @pytest.mark.parametrize(
+        "issued_at, expected_offset_hours",
+        [
+            (datetime(2024, 3, 10, 12, 0, tzinfo=ET), -4),  # spring forward: expires in EDT
+            (datetime(2024, 11, 3, 1, 30, tzinfo=ET), -5),  # ambiguous fall-back hour
+        ],
+    )
+    def test_dst_boundary(self, issued_at, expected_offset_hours):
+        """Expiry is midnight local time on the next day across DST changes."""
+        expiry = next_token_expiry(issued_at)
+
+        assert expiry.astimezone(ET).date() == issued_at.date() + timedelta(days=1)
+        assert (expiry.hour, expiry.minute) == (0, 0)
+        assert expiry.utcoffset() == timedelta(hours=expected_offset_hours)
+
+
+class TestTokensExpired:
+    """Test the local expiry check on a client."""
+
+    def test_missing_saved_at_is_not_expired(self, tmp_path):
+        """Token files from before saved_at was recorded have an unknown expiry."""
+        client = make_client(tmp_path)
+
+        assert client.token_expires_at is None
+        assert client.tokens_expired() is False
+
+    def test_loads_expiry_from_saved_at(self, tmp_path):
+        """saved_at in the token file determines the expiry."""
+        client = make_client(tmp_path, saved_at="2024-06-03T23:30:00-04:00")
+
+        assert client.token_expires_at == datetime(2024, 6, 4, tzinfo=ET)
+
+    @pytest.mark.parametrize(
+        "seconds_left, expired",
+        [
+            (TOKEN_EXPIRY_MARGIN_SECONDS + 1, False),
+            (TOKEN_EXPIRY_MARGIN_SECONDS, True),
+            (0, True),
+            (-60, True),
+        ],
+    )
+    def test_margin_edge(self, tmp_path, monkeypatch, seconds_left, expired):
+        """Tokens within the margin of midnight ET count as expired."""
+        client = make_client(tmp_path, saved_at="2024-06-03T09:00:00-04:00")
+        now = client.token_expires_at - timedelta(seconds=seconds_left)
+        monkeypatch.setattr("src.etrade_client.get_et_now", lambda: now)
+
+        assert client.tokens_expired() is expired
@@ -8,6 +8,7 @@ These tests verify core trading logic that handles real money:
 - Approval handling
 """
 
+import asyncio
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -17,6 +18,7 @@ import pytest
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.async_utils import clear_sync_cache, run_sync_in_executor_cached
 from src.database import Database
 from src.etrade_client import MockETradeClient
 from src.smart_strategy import Signal, TodaySignal
@@ -270,6 +272,31 @@ class TestExecuteSignalPaperMode:
 
         assert result.is_paper is True
 
+    def test_trades_invalidate_cached_portfolio(self, trading_bot):
+        """Opening or closing a position should drop cached portfolio reads."""
+        clear_sync_cache()
+        trading_bot.get_quote = MagicMock(return_value={"current_price": 50.0})
+        trading_bot.data_manager.get_quote = MagicMock(return_value=None)
+        trading_bot.notifications = MagicMock()
+        trading_bot.telegram = MagicMock()
+        signal = TodaySignal(
+            signal=Signal.CRASH_DAY,
+            etf="SBIT",
+            reason="Paper trade test",
+        )
+
+        def cached_portfolio():
+            return asyncio.run(run_sync_in_executor_cached(trading_bot.get_portfolio_value))
+
+        before = cached_portfolio()
+        trading_bot.execute_signal(signal)
+        after_buy = cached_portfolio()
+        trading_bot.close_position("SBIT")
+        after_close = cached_portfolio()
+
+        assert after_buy["cash"] < before["cash"]
+        assert after_close["cash"] > after_buy["cash"]
+
 
 class TestGetOpenPositions:
     """Test position tracking."""
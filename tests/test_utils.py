@@ -0,0 +1,43 @@
+"""
+Unit tests for IBIT Dip Bot utility functions.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import calculate_dip_percentage, calculate_dip_percentages
+
+
+class TestCalculateDipPercentages:
+    """Test the vectorized dip percentage helper."""
+
+    def test_matches_scalar_version(self):
+        """Each element should equal calculate_dip_percentage on the same prices."""
+        open_prices = [50.0, 50.0, 50.0, 0.0, -1.0, 48.25]
+        current_prices = [49.0, 50.0, 51.5, 10.0, 10.0, 47.9]
+
+        result = calculate_dip_percentages(open_prices, current_prices)
+
+        expected = [calculate_dip_percentage(o, c) for o, c in zip(open_prices, current_prices)]
+        assert result.tolist() == expected
+
+    def test_zero_open_gives_zero(self):
+        """A zero open price gives 0.0 without a division warning."""
+        with np.errstate(all="raise"):
+            result = calculate_dip_percentages(np.array([0.0, 0.0]), np.array([0.0, 5.0]))
+
+        assert result.tolist() == [0.0, 0.0]
+
+    def test_broadcasts_scalar_open(self):
+        """A scalar open price is compared against every current price."""
+        result = calculate_dip_percentages(50.0, [49.0, 51.0])
+
+        assert result.tolist() == [
+            calculate_dip_percentage(50.0, 49.0),
+            calculate_dip_percentage(50.0, 51.0),
+        ]